@@ -0,0 +1,39 @@
+"""add_transaction_reconciliation
+
+Revision ID: 7c1d9e4a2b6f
+Revises: 42be14e03be4
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1d9e4a2b6f"
+down_revision: Union[str, None] = "42be14e03be4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the next reconciliation time of in-progress transactions."""
+    op.add_column(
+        "transactions",
+        sa.Column("next_reconcile_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_transactions_reconcile_due",
+        "transactions",
+        ["next_reconcile_at"],
+        postgresql_where=sa.text("status = 'IN_PROGRESS' AND deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Remove the reconciliation schedule."""
+    op.drop_index("ix_transactions_reconcile_due", table_name="transactions")
+    op.drop_column("transactions", "next_reconcile_at")
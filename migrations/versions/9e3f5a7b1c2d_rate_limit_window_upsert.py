@@ -0,0 +1,82 @@
+"""rate_limit_window_upsert
+
+Revision ID: 9e3f5a7b1c2d
+Revises: 7c1d9e4a2b6f
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9e3f5a7b1c2d"
+down_revision: Union[str, None] = "7c1d9e4a2b6f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store rate limit windows as timestamps, one row per window."""
+    # Counters of past windows are useless; only the current ones are kept
+    op.execute(
+        "DELETE FROM rate_limits "
+        "WHERE window_start::timestamp < (now() AT TIME ZONE 'UTC') - interval '1 hour'"
+    )
+    # Merge rows that concurrent requests created for the same window
+    op.execute(
+        """
+        UPDATE rate_limits r
+        SET request_count = d.total
+        FROM (
+            SELECT min(id::text)::uuid AS keep_id, sum(request_count) AS total
+            FROM rate_limits
+            GROUP BY resource_type, resource_identifier, window_start
+            HAVING count(*) > 1
+        ) d
+        WHERE r.id = d.keep_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM rate_limits r
+        USING rate_limits k
+        WHERE r.resource_type = k.resource_type
+          AND r.resource_identifier = k.resource_identifier
+          AND r.window_start = k.window_start
+          AND r.id::text > k.id::text
+        """
+    )
+    op.alter_column(
+        "rate_limits",
+        "window_start",
+        type_=sa.DateTime(timezone=True),
+        existing_type=sa.String(),
+        existing_nullable=False,
+        postgresql_using="window_start::timestamp AT TIME ZONE 'UTC'",
+    )
+    op.create_unique_constraint(
+        "unique_rate_limit_window",
+        "rate_limits",
+        ["resource_type", "resource_identifier", "window_start"],
+    )
+    op.create_index("ix_rate_limits_window_start", "rate_limits", ["window_start"])
+
+
+def downgrade() -> None:
+    """Store rate limit windows as ISO strings again."""
+    op.drop_index("ix_rate_limits_window_start", table_name="rate_limits")
+    op.drop_constraint("unique_rate_limit_window", "rate_limits", type_="unique")
+    op.alter_column(
+        "rate_limits",
+        "window_start",
+        type_=sa.String(),
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+        postgresql_using=(
+            "to_char(window_start AT TIME ZONE 'UTC', 'YYYY-MM-DD\"T\"HH24:MI:SS')"
+        ),
+    )
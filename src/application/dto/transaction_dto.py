@@ -1,5 +1,6 @@
 """Transaction Data Transfer Objects (DTOs)."""
 
+from datetime import datetime
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -54,3 +55,51 @@ class TransactionListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+
+
+class BanescoStatusResponse(BaseModel):
+    """Response model for a Banesco transaction status lookup."""
+
+    transaction_id: str
+    data: dict | None = Field(None, description="Banesco API payload")
+    stale: bool = Field(
+        False, description="True if Banesco failed and a previous response was served"
+    )
+    age_seconds: float | None = Field(
+        None, description="Age of the served response in seconds when stale"
+    )
+
+
+class BankStatusItem(BaseModel):
+    """Lookup result of a single bank."""
+
+    bank: BankType
+    found: bool
+    data: dict | None = Field(None, description="Bank API payload")
+    stale: bool = False
+    error: str | None = Field(None, description="Why the bank could not answer")
+
+
+class BankStatusLookupResponse(BaseModel):
+    """Response model for a transaction lookup across banks."""
+
+    reference: str
+    transaction_id: str = Field(..., description="Transaction ID queried")
+    results: list[BankStatusItem]
+
+
+class BanescoWebhookNotification(BaseModel):
+    """Transaction status notification pushed by Banesco."""
+
+    transaction_id: str = Field(..., description="Banesco transaction ID")
+    status: str = Field(..., description="Banesco transaction status")
+    event_id: str | None = Field(None, description="Banesco notification ID")
+    occurred_at: datetime | None = Field(
+        None, description="When the status changed at Banesco"
+    )
+
+
+class WebhookAcceptedResponse(BaseModel):
+    """Acknowledgement of a queued webhook notification."""
+
+    accepted: bool = True
@@ -0,0 +1,91 @@
+"""Periodic removal of expired rate limit windows."""
+
+import asyncio
+import contextlib
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import structlog
+
+from infrastructure.monitoring.metrics import rate_limit_windows_purged_total
+from infrastructure.rate_limit import DatabaseRateLimitBackend
+
+logger = structlog.get_logger()
+
+
+class RateLimitPurgeService:
+    """Deletes database rate limit counters of windows long gone.
+
+    Every counter row belongs to one window, so without a purge the
+    ``rate_limits`` table grows by one row per resource and minute. Each
+    pass deletes rows whose window started more than ``retention`` seconds
+    ago, ``batch_size`` rows per transaction so locks stay short.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        interval: float = 300.0,
+        retention: float = 3600.0,
+        batch_size: int = 5000,
+    ) -> None:
+        """Initialize purge service.
+
+        Args:
+            session_factory: Creates database sessions (async context managers)
+            interval: Seconds between passes
+            retention: Age (seconds) of a window start after which it is deleted
+            batch_size: Rows deleted per transaction
+        """
+        self.session_factory = session_factory
+        self.interval = interval
+        self.retention = retention
+        self.batch_size = batch_size
+        self._task: asyncio.Task[None] | None = None
+
+    async def purge_once(self) -> int:
+        """Run one purge pass.
+
+        Returns:
+            Number of counters deleted
+        """
+        before = datetime.now(timezone.utc) - timedelta(seconds=self.retention)
+        purged = 0
+        async with self.session_factory() as session:
+            backend = DatabaseRateLimitBackend(session)
+            while True:
+                deleted = await backend.purge_expired(before, limit=self.batch_size)
+                await session.commit()
+                purged += deleted
+                if deleted < self.batch_size:
+                    break
+
+        rate_limit_windows_purged_total.inc(purged)
+        if purged:
+            logger.info("Purged expired rate limit windows", deleted=purged)
+        return purged
+
+    def start(self) -> None:
+        """Start running passes in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background passes."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        """Run a pass every ``interval`` seconds."""
+        while True:
+            try:
+                await self.purge_once()
+            except Exception as e:
+                logger.warning("Rate limit purge pass failed", error=str(e))
+            await asyncio.sleep(self.interval)
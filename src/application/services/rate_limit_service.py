@@ -1,31 +1,125 @@
 """Rate limiting service for Banesco API calls."""
 
-from datetime import datetime
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from infrastructure.database.models import RateLimitModel
+from infrastructure.monitoring.metrics import banesco_rate_limit_deferrals_total
+from infrastructure.rate_limit import (
+    DatabaseRateLimitBackend,
+    FallbackRateLimitBackend,
+    RateLimitBackend,
+    RateLimitDecision,
+)
+from infrastructure.resilience import DeadlineExceededError, remaining_time
+
+T = TypeVar("T")
+
+# Rate limit window in seconds
+RATE_LIMIT_WINDOW = 60
+
+
+class RateLimitDeferralError(Exception):
+    """Raised when a call over its rate limit cannot wait for the next window."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("Rate limit exceeded and the next window is too far away")
+        self.retry_after = retry_after
+
+
+@dataclass
+class _DeferredCall(Generic[T]):
+    """A call parked until the next rate limit window, shared by its waiters."""
+
+    run_at: float
+    future: asyncio.Future[T] = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+    waiters: int = 0
+
+
+# Deferred calls by (resource_type, resource_identifier); process-wide because
+# a service instance lives for one request only
+_deferred_calls: dict[tuple[str, str], _DeferredCall[Any]] = {}
 
 
 class RateLimitService:
-    """Service for managing API rate limits."""
+    """Service for managing API rate limits.
+
+    Counters live in the database by default. With a ``redis_backend``,
+    they live in Redis (one atomic round trip per request) and the
+    database is only used while Redis is unavailable.
+    """
 
-    def __init__(self, session: AsyncSession, banesco_rate_limit: int = 2) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        banesco_rate_limit: int = 2,
+        max_deferred_waiters: int = 100,
+        redis_backend: RateLimitBackend | None = None,
+        autocommit: bool = False,
+    ) -> None:
         """Initialize rate limit service.
 
         Args:
             session: Database session
             banesco_rate_limit: Max requests per minute per transaction_id (default: 2)
+            max_deferred_waiters: Max callers sharing one deferred call per resource
+            redis_backend: Application-scoped Redis counters (optional)
+            autocommit: Commit the session after every ``try_acquire``, for
+                callers that keep their session open across slow calls
         """
         self.session = session
         self.banesco_rate_limit = banesco_rate_limit
+        self.max_deferred_waiters = max_deferred_waiters
+        self.autocommit = autocommit
+        database_backend = DatabaseRateLimitBackend(session)
+        self.backend: RateLimitBackend = (
+            FallbackRateLimitBackend(redis_backend, database_backend)
+            if redis_backend is not None
+            else database_backend
+        )
+
+    def get_limit(self, resource_type: str) -> int | None:
+        """Requests allowed per window for a resource type (None: unlimited)."""
+        if resource_type in ("TRANSACTION_ID", "REFERENCE"):
+            return self.banesco_rate_limit
+        return None
+
+    async def try_acquire(
+        self, resource_type: str, resource_identifier: str
+    ) -> RateLimitDecision:
+        """Count a request if it is within the rate limit, in one atomic step.
+
+        Args:
+            resource_type: Type of resource (e.g., 'TRANSACTION_ID')
+            resource_identifier: Identifier for the resource
+
+        Returns:
+            Whether the request is allowed, and if not, when to retry
+        """
+        decision = await self.backend.acquire(
+            resource_type,
+            resource_identifier,
+            self.get_limit(resource_type),
+            RATE_LIMIT_WINDOW,
+        )
+        if self.autocommit:
+            await self.session.commit()
+        return decision
 
     async def check_rate_limit(
         self, resource_type: str, resource_identifier: str
     ) -> bool:
         """Check if request is within rate limit.
 
+        Prefer ``try_acquire``: checking and incrementing separately lets
+        concurrent requests exceed the limit together.
+
         Args:
             resource_type: Type of resource (e.g., 'TRANSACTION_ID')
             resource_identifier: Identifier for the resource
@@ -33,17 +127,14 @@ class RateLimitService:
         Returns:
             True if within limit, False if limit exceeded
         """
-        now = datetime.utcnow()
-        window_start = now.replace(second=0, microsecond=0)
+        limit = self.get_limit(resource_type)
+        if limit is None:
+            return True
 
-        current_count = await self._get_request_count(
-            resource_type, resource_identifier, window_start
+        count = await self.backend.count(
+            resource_type, resource_identifier, RATE_LIMIT_WINDOW
         )
-
-        if resource_type == "TRANSACTION_ID":
-            return current_count < self.banesco_rate_limit
-
-        return True
+        return count < limit
 
     async def increment_rate_limit(
         self, resource_type: str, resource_identifier: str
@@ -54,55 +145,125 @@ class RateLimitService:
             resource_type: Type of resource (e.g., 'TRANSACTION_ID')
             resource_identifier: Identifier for the resource
         """
-        now = datetime.utcnow()
-        window_start = now.replace(second=0, microsecond=0)
-
-        # Try to get existing rate limit record
-        stmt = select(RateLimitModel).where(
-            RateLimitModel.resource_type == resource_type,
-            RateLimitModel.resource_identifier == resource_identifier,
-            RateLimitModel.window_start == window_start.isoformat(),
+        await self.backend.acquire(
+            resource_type, resource_identifier, None, RATE_LIMIT_WINDOW
         )
-        result = await self.session.execute(stmt)
-        rate_limit = result.scalar_one_or_none()
-
-        if rate_limit:
-            # Increment existing counter
-            rate_limit.request_count += 1
-        else:
-            # Create new counter
-            rate_limit = RateLimitModel(
-                resource_type=resource_type,
-                resource_identifier=resource_identifier,
-                window_start=window_start.isoformat(),
-                request_count=1,
-            )
-            self.session.add(rate_limit)
 
-        await self.session.flush()
+    async def execute_or_defer(
+        self,
+        resource_type: str,
+        resource_identifier: str,
+        fn: Callable[[], Awaitable[T]],
+        max_wait: float = 60.0,
+        min_run_time: float = 0.0,
+    ) -> T:
+        """Run ``fn`` within the rate limit, deferring it until allowed if needed.
 
-    async def _get_request_count(
-        self, resource_type: str, resource_identifier: str, window_start: datetime
-    ) -> int:
-        """Get current request count for the given window.
+        Within the limit the request is counted (and committed, so other
+        workers see it) and ``fn`` runs right away. Over the limit, the call
+        is parked until the limit admits requests again, provided that happens within
+        ``max_wait`` and the current deadline still leaves ``min_run_time``
+        afterwards. Callers arriving while a call for the same resource is
+        parked or running share its single result instead of calling again.
 
         Args:
-            resource_type: Type of resource
+            resource_type: Type of resource (e.g., 'TRANSACTION_ID')
             resource_identifier: Identifier for the resource
-            window_start: Start of the time window
+            fn: Coroutine factory performing the rate-limited call
+            max_wait: Maximum seconds to wait for the next window
+            min_run_time: Seconds ``fn`` needs after the wait
 
         Returns:
-            Current request count
+            Result of ``fn``, possibly obtained by another caller
+
+        Raises:
+            RateLimitDeferralError: If the call can neither run nor be deferred
+            DeadlineExceededError: If the caller's deadline passes while
+                waiting for a call deferred by another caller
+            asyncio.CancelledError: If the deferred call was cancelled
         """
-        stmt = select(RateLimitModel).where(
-            RateLimitModel.resource_type == resource_type,
-            RateLimitModel.resource_identifier == resource_identifier,
-            RateLimitModel.window_start == window_start.isoformat(),
-        )
-        result = await self.session.execute(stmt)
-        rate_limit = result.scalar_one_or_none()
+        key = (resource_type, resource_identifier)
+        deferred = _deferred_calls.get(key)
+        if deferred is not None:
+            return await self._join_deferred(deferred, max_wait, min_run_time)
+
+        decision = await self.try_acquire(resource_type, resource_identifier)
+        if decision.allowed:
+            await self.session.commit()
+            return await fn()
 
-        return rate_limit.request_count if rate_limit else 0
+        # A refused upsert still locks the counter row: release it before
+        # waiting, so other workers are refused instead of blocked
+        await self.session.commit()
+        wait = decision.retry_after
+        self._check_can_wait(wait, max_wait, min_run_time)
+
+        deferred = _DeferredCall(run_at=time.monotonic() + wait)
+        _deferred_calls[key] = deferred
+        banesco_rate_limit_deferrals_total.labels(result="deferred").inc()
+        try:
+            await asyncio.sleep(wait)
+            # Another worker may have used up the new window already
+            decision = await self.try_acquire(resource_type, resource_identifier)
+            if not decision.allowed:
+                raise RateLimitDeferralError(decision.retry_after)
+            await self.session.commit()
+            result = await fn()
+        except BaseException as e:
+            if isinstance(e, Exception):
+                deferred.future.set_exception(e)
+                # Mark the exception as retrieved when nobody joined
+                deferred.future.exception()
+            else:
+                # Cancelled (or interrupted): waiters see the cancellation
+                deferred.future.cancel()
+            raise
+        else:
+            deferred.future.set_result(result)
+            return result
+        finally:
+            if _deferred_calls.get(key) is deferred:
+                del _deferred_calls[key]
+
+    async def _join_deferred(
+        self, deferred: _DeferredCall[T], max_wait: float, min_run_time: float
+    ) -> T:
+        """Wait for the result of a call deferred by another caller."""
+        wait = max(deferred.run_at - time.monotonic(), 0.0)
+        if deferred.waiters >= self.max_deferred_waiters:
+            banesco_rate_limit_deferrals_total.labels(result="rejected").inc()
+            raise RateLimitDeferralError(wait)
+        self._check_can_wait(wait, max_wait, min_run_time)
+
+        deferred.waiters += 1
+        banesco_rate_limit_deferrals_total.labels(result="joined").inc()
+        try:
+            # Shielded: a waiter giving up must not cancel the shared call
+            return await asyncio.wait_for(
+                asyncio.shield(deferred.future), remaining_time()
+            )
+        except TimeoutError:
+            if deferred.future.done():
+                raise
+            raise DeadlineExceededError(
+                "Deadline exceeded waiting for a deferred call"
+            ) from None
+        finally:
+            deferred.waiters -= 1
+
+    @staticmethod
+    def _check_can_wait(wait: float, max_wait: float, min_run_time: float) -> None:
+        """Reject a deferral that would outlast the wait bound or the deadline.
+
+        Raises:
+            RateLimitDeferralError: If the caller cannot wait ``wait`` seconds
+        """
+        remaining = remaining_time()
+        too_long = wait > max_wait
+        past_deadline = remaining is not None and wait + min_run_time > remaining
+        if too_long or past_deadline:
+            banesco_rate_limit_deferrals_total.labels(result="rejected").inc()
+            raise RateLimitDeferralError(wait)
 
     async def reset_rate_limit(
         self, resource_type: str, resource_identifier: str
@@ -113,17 +274,4 @@ class RateLimitService:
             resource_type: Type of resource
             resource_identifier: Identifier for the resource
         """
-        now = datetime.utcnow()
-        window_start = now.replace(second=0, microsecond=0)
-
-        stmt = select(RateLimitModel).where(
-            RateLimitModel.resource_type == resource_type,
-            RateLimitModel.resource_identifier == resource_identifier,
-            RateLimitModel.window_start == window_start.isoformat(),
-        )
-        result = await self.session.execute(stmt)
-        rate_limit = result.scalar_one_or_none()
-
-        if rate_limit:
-            await self.session.delete(rate_limit)
-            await self.session.flush()
+        await self.backend.reset(resource_type, resource_identifier)
@@ -0,0 +1,217 @@
+"""Background reconciliation of in-progress transactions with Banesco."""
+
+import asyncio
+import contextlib
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.services.rate_limit_service import RateLimitService
+from domain.entities.transaction import ActorType, Transaction, TransactionStatus
+from domain.repositories.transaction_repository import ITransactionRepository
+from infrastructure.database.repositories.transaction_repository import (
+    TransactionRepository,
+)
+from infrastructure.external.banesco_client import BanescoClient
+from infrastructure.monitoring.metrics import transaction_reconciliations_total
+from infrastructure.rate_limit import RateLimitBackend
+
+logger = structlog.get_logger()
+
+# Final Banesco statuses and the transaction status they settle on
+BANESCO_STATUS_MAP = {
+    "COMPLETED": TransactionStatus.COMPLETED,
+    "APPROVED": TransactionStatus.COMPLETED,
+    "CANCELED": TransactionStatus.CANCELED,
+    "CANCELLED": TransactionStatus.CANCELED,
+    "REJECTED": TransactionStatus.CANCELED,
+}
+
+
+def map_banesco_status(payload: dict | None) -> TransactionStatus | None:
+    """Map a Banesco payload to a final transaction status, if it has one."""
+    if not payload:
+        return None
+    return BANESCO_STATUS_MAP.get(str(payload.get("status", "")).upper())
+
+
+class ReconciliationService:
+    """Moves in-progress transactions to their final status in the background.
+
+    Each pass claims a batch of in-progress transactions that are due,
+    looks them up in Banesco through the batch API (which honors the
+    per-transaction rate limit and the client-side throttle) and applies
+    final statuses with ``actor_type=SYSTEM``. Transactions that are still
+    pending are checked again later, less often the older they are: every
+    ``base_delay`` seconds at first, doubling every ``doubling_age`` of age,
+    up to ``max_delay``.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        banesco_client: BanescoClient,
+        repository_factory: Callable[
+            [AsyncSession], ITransactionRepository
+        ] = TransactionRepository,
+        banesco_rate_limit: int = 2,
+        rate_limit_backend: RateLimitBackend | None = None,
+        interval: float = 30.0,
+        batch_size: int = 50,
+        concurrency: int | None = None,
+        base_delay: float = 30.0,
+        max_delay: float = 3600.0,
+        doubling_age: float = 600.0,
+        max_age: float = 259200.0,
+        lease: float = 300.0,
+    ) -> None:
+        """Initialize reconciliation service.
+
+        Args:
+            session_factory: Creates database sessions (async context managers)
+            banesco_client: Application-scoped Banesco client
+            repository_factory: Builds a transaction repository for a session
+            banesco_rate_limit: Max Banesco queries per minute per transaction
+            rate_limit_backend: Redis rate limit counters (optional)
+            interval: Seconds between passes
+            batch_size: Transactions claimed per pass
+            concurrency: Concurrent Banesco lookups per pass (defaults to the
+                client's batch concurrency)
+            base_delay: Seconds between checks of a new transaction
+            max_delay: Longest delay between checks
+            doubling_age: Transaction age (seconds) after which the delay doubles
+            max_age: Transactions older than this (seconds) are left alone
+            lease: Seconds a claimed transaction is hidden from other workers
+        """
+        self.session_factory = session_factory
+        self.banesco_client = banesco_client
+        self.repository_factory = repository_factory
+        self.banesco_rate_limit = banesco_rate_limit
+        self.rate_limit_backend = rate_limit_backend
+        self.interval = interval
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.doubling_age = doubling_age
+        self.max_age = max_age
+        self.lease = lease
+        self._task: asyncio.Task[None] | None = None
+
+    def next_delay(self, age: timedelta) -> timedelta:
+        """Delay before the next check of a transaction of the given age."""
+        doublings = max(age.total_seconds(), 0) // self.doubling_age
+        delay = self.base_delay * 2 ** min(doublings, 32)
+        return timedelta(seconds=min(delay, self.max_delay))
+
+    async def reconcile_once(self) -> int:
+        """Run one reconciliation pass.
+
+        Returns:
+            Number of transactions whose status changed
+        """
+        async with self.session_factory() as session:
+            repo = self.repository_factory(session)
+            transactions = await repo.claim_for_reconciliation(
+                limit=self.batch_size,
+                lease=timedelta(seconds=self.lease),
+                max_age=timedelta(seconds=self.max_age),
+            )
+            # Release the row locks before calling Banesco
+            await session.commit()
+            if not transactions:
+                return 0
+
+            # Admissions are committed one by one in their own session, so
+            # the counts are visible (and their rows unlocked) at once
+            async with self.session_factory() as admission_session:
+                results = await self.banesco_client.get_transaction_statuses(
+                    [t.transaction_id for t in transactions],
+                    rate_limit_service=RateLimitService(
+                        admission_session,
+                        banesco_rate_limit=self.banesco_rate_limit,
+                        redis_backend=self.rate_limit_backend,
+                        autocommit=True,
+                    ),
+                    concurrency=self.concurrency,
+                )
+
+            now = datetime.now(timezone.utc)
+            updates: dict[str, TransactionStatus] = {}
+            metadata: dict[str, dict] = {}
+            next_checks: dict[UUID, datetime] = {}
+            for transaction in transactions:
+                result = results[transaction.transaction_id]
+                new_status = map_banesco_status(result.data) if result.ok else None
+                if new_status is None:
+                    outcome = "pending" if result.ok else "failed"
+                    next_checks[transaction.id] = now + self.next_delay(
+                        self._age(transaction, now)
+                    )
+                    transaction_reconciliations_total.labels(result=outcome).inc()
+                else:
+                    updates[transaction.transaction_id] = new_status
+                    metadata[transaction.transaction_id] = {
+                        "banesco_status": result.data.get("status")
+                    }
+
+            # The claim's row locks are gone: only transactions still in
+            # progress are updated, so webhooks or manual changes made
+            # during the lookups are not reverted
+            changed = await repo.bulk_update_status(
+                updates,
+                reason="Reconciled with Banesco",
+                actor_type=ActorType.SYSTEM,
+                event_metadata=metadata,
+            )
+            updated = len(changed)
+            transaction_reconciliations_total.labels(result="updated").inc(updated)
+            transaction_reconciliations_total.labels(result="superseded").inc(
+                len(updates) - updated
+            )
+
+            await repo.schedule_reconciliation(next_checks)
+            await session.commit()
+
+        logger.info(
+            "Reconciled in-progress transactions",
+            checked=len(transactions),
+            updated=updated,
+        )
+        return updated
+
+    def start(self) -> None:
+        """Start running passes in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background passes."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        """Run a pass every ``interval`` seconds."""
+        while True:
+            try:
+                await self.reconcile_once()
+            except Exception as e:
+                logger.warning("Transaction reconciliation pass failed", error=str(e))
+            await asyncio.sleep(self.interval)
+
+    @staticmethod
+    def _age(transaction: Transaction, now: datetime) -> timedelta:
+        """Age of a transaction, whether its timestamp is naive or aware."""
+        created_at = transaction.created_at
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return now - created_at
@@ -0,0 +1,180 @@
+"""Batched application of Banesco webhook notifications."""
+
+import asyncio
+import contextlib
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.dto.transaction_dto import BanescoWebhookNotification
+from application.services.reconciliation_service import map_banesco_status
+from domain.entities.transaction import ActorType, TransactionStatus
+from domain.repositories.transaction_repository import ITransactionRepository
+from infrastructure.database.repositories.transaction_repository import (
+    TransactionRepository,
+)
+from infrastructure.monitoring.metrics import (
+    banesco_webhook_batch_size,
+    banesco_webhook_notifications_total,
+)
+
+logger = structlog.get_logger()
+
+
+class BanescoWebhookProcessor:
+    """Queues Banesco status notifications and applies them in batches.
+
+    The webhook endpoint only verifies and enqueues a notification, so
+    Banesco gets its acknowledgement without waiting for the database. A
+    single consumer takes up to ``batch_size`` notifications at a time,
+    waiting at most ``flush_interval`` seconds to fill a batch, and applies
+    the final statuses among them with one bulk update and one bulk insert
+    of audit events. Notifications lost to a failed batch or a full queue
+    are picked up later by the background reconciliation.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        repository_factory: Callable[
+            [AsyncSession], ITransactionRepository
+        ] = TransactionRepository,
+        queue_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 0.5,
+    ) -> None:
+        """Initialize webhook processor.
+
+        Args:
+            session_factory: Creates database sessions (async context managers)
+            repository_factory: Builds a transaction repository for a session
+            queue_size: Notifications held before new ones are refused
+            batch_size: Most notifications applied per batch
+            flush_interval: Longest wait (seconds) to fill a batch
+        """
+        self.session_factory = session_factory
+        self.repository_factory = repository_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue: asyncio.Queue[BanescoWebhookNotification] = asyncio.Queue(
+            maxsize=queue_size
+        )
+        self._task: asyncio.Task[None] | None = None
+
+    def submit(self, notification: BanescoWebhookNotification) -> bool:
+        """Queue a notification without waiting.
+
+        Returns:
+            False if the queue is full and the notification was refused
+        """
+        try:
+            self.queue.put_nowait(notification)
+        except asyncio.QueueFull:
+            banesco_webhook_notifications_total.labels(result="dropped").inc()
+            return False
+        return True
+
+    async def apply(self, notifications: list[BanescoWebhookNotification]) -> int:
+        """Apply a batch of notifications.
+
+        Only final statuses are applied, and of those only the last one of
+        each transaction, so a late non-final notification cannot hide a
+        final one.
+
+        Returns:
+            Number of transactions whose status changed
+        """
+        updates: dict[str, TransactionStatus] = {}
+        metadata: dict[str, dict] = {}
+        final = 0
+        for notification in notifications:
+            status = map_banesco_status({"status": notification.status})
+            if status is None:
+                banesco_webhook_notifications_total.labels(result="ignored").inc()
+                continue
+            final += 1
+            transaction_id = notification.transaction_id
+            updates[transaction_id] = status
+            metadata[transaction_id] = {
+                "banesco_status": notification.status,
+                "banesco_event_id": notification.event_id,
+                "occurred_at": (
+                    notification.occurred_at.isoformat()
+                    if notification.occurred_at
+                    else None
+                ),
+            }
+
+        changed: list[str] = []
+        if updates:
+            async with self.session_factory() as session:
+                repo = self.repository_factory(session)
+                changed = await repo.bulk_update_status(
+                    updates,
+                    reason="Banesco webhook",
+                    actor_type=ActorType.EXTERNAL,
+                    event_metadata=metadata,
+                )
+                await session.commit()
+
+        duplicates = final - len(changed)
+        banesco_webhook_notifications_total.labels(result="applied").inc(len(changed))
+        banesco_webhook_notifications_total.labels(result="duplicate").inc(duplicates)
+        banesco_webhook_batch_size.observe(len(notifications))
+        return len(changed)
+
+    def start(self) -> None:
+        """Start consuming the queue in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the consumer, then apply whatever is still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        while not self.queue.empty():
+            await self._apply_safely(self._take_queued(self.batch_size))
+
+    async def _run(self) -> None:
+        """Apply batches as notifications arrive."""
+        while True:
+            batch = [await self.queue.get()]
+            loop = asyncio.get_running_loop()
+            flush_at = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                batch.extend(self._take_queued(self.batch_size - len(batch)))
+                remaining = flush_at - loop.time()
+                if len(batch) >= self.batch_size or remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self.queue.get(), timeout=remaining)
+                    )
+                except TimeoutError:
+                    break
+            await self._apply_safely(batch)
+
+    def _take_queued(self, limit: int) -> list[BanescoWebhookNotification]:
+        """Take up to ``limit`` notifications that are already queued."""
+        batch = []
+        while len(batch) < limit and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        return batch
+
+    async def _apply_safely(self, batch: list[BanescoWebhookNotification]) -> None:
+        """Apply a batch, logging rather than raising on failure."""
+        try:
+            await self.apply(batch)
+        except Exception as e:
+            banesco_webhook_notifications_total.labels(result="failed").inc(len(batch))
+            logger.warning(
+                "Failed to apply Banesco webhook batch",
+                size=len(batch),
+                error=str(e),
+            )
@@ -16,6 +16,14 @@ class TransactionStatus(str, Enum):
     TO_REVIEW = "TO_REVIEW"
 
 
+class ActorType(str, Enum):
+    """Who changed a transaction."""
+
+    USER = "USER"
+    SYSTEM = "SYSTEM"
+    EXTERNAL = "EXTERNAL"
+
+
 class BankType(str, Enum):
     """Bank type enumeration."""
 
@@ -1,10 +1,10 @@
 """Transaction repository interface."""
 
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timedelta
 from uuid import UUID
 
-from domain.entities.transaction import Transaction, TransactionStatus
+from domain.entities.transaction import ActorType, Transaction, TransactionStatus
 
 
 class ITransactionRepository(ABC):
@@ -57,6 +57,31 @@ class ITransactionRepository(ABC):
         new_status: TransactionStatus,
         reason: str | None = None,
         actor_id: UUID | None = None,
+        actor_type: ActorType | None = None,
+        event_metadata: dict | None = None,
     ) -> bool:
         """Update transaction status and create audit event."""
         pass
+
+    @abstractmethod
+    async def claim_for_reconciliation(
+        self, limit: int, lease: timedelta, max_age: timedelta
+    ) -> list[Transaction]:
+        """Claim in-progress transactions due for reconciliation for ``lease``."""
+        pass
+
+    @abstractmethod
+    async def schedule_reconciliation(self, next_checks: dict[UUID, datetime]) -> None:
+        """Set when each transaction is next reconciled."""
+        pass
+
+    @abstractmethod
+    async def bulk_update_status(
+        self,
+        updates: dict[str, TransactionStatus],
+        reason: str | None = None,
+        actor_type: ActorType = ActorType.EXTERNAL,
+        event_metadata: dict[str, dict] | None = None,
+    ) -> list[str]:
+        """Move in-progress transactions, by Banesco ID, to new statuses."""
+        pass
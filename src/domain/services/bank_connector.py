@@ -0,0 +1,75 @@
+"""Bank connector interface."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from domain.entities.transaction import BankType
+
+
+@dataclass
+class BankStatusResult:
+    """Outcome of a transaction lookup at a bank.
+
+    ``data`` is None both when the bank does not know the transaction and
+    when the lookup failed; ``error`` tells the two apart.
+    """
+
+    bank: BankType
+    transaction_id: str
+    data: dict | None = None
+    error: Exception | None = None
+    stale: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Check if the bank answered."""
+        return self.error is None
+
+    @property
+    def found(self) -> bool:
+        """Check if the bank knows the transaction."""
+        return self.data is not None
+
+
+@dataclass
+class BankHealth:
+    """Health of a bank connector."""
+
+    bank: BankType
+    healthy: bool
+    details: dict = field(default_factory=dict)
+
+
+class IBankConnector(ABC):
+    """Integration with one bank's transaction API.
+
+    Each connector owns its HTTP connection pool, concurrency limit and
+    circuit breaker, so one bank's slowness or failures do not affect
+    lookups at other banks. Lookup errors are reported in the results
+    rather than raised.
+    """
+
+    bank: BankType
+
+    @abstractmethod
+    async def get_transaction_status(self, transaction_id: str) -> BankStatusResult:
+        """Look up one transaction."""
+        pass
+
+    @abstractmethod
+    async def get_transaction_statuses(
+        self, transaction_ids: Iterable[str], concurrency: int | None = None
+    ) -> dict[str, BankStatusResult]:
+        """Look up many transactions with bounded concurrency."""
+        pass
+
+    @abstractmethod
+    async def health_check(self) -> BankHealth:
+        """Report whether the connector is currently accepting lookups."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the connector's connections and background tasks."""
+        pass
@@ -2,10 +2,19 @@
 
 import json
 import os
+import secrets
 from typing import Any
 
 import redis.asyncio as redis
 
+# Delete the lock only if it is still held by the caller's token
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 class CacheService:
     """Asynchronous Redis cache service."""
@@ -84,6 +93,50 @@ class CacheService:
         except Exception:
             return False
 
+    async def ping(self) -> bool:
+        """Check if Redis is reachable.
+
+        Returns:
+            True if Redis answered, False otherwise
+        """
+        try:
+            return bool(await self.redis_client.ping())
+        except Exception:
+            return False
+
+    async def acquire_lock(self, key: str, ttl: int = 30) -> str | None:
+        """Acquire a distributed lock.
+
+        Args:
+            key: Lock key
+            ttl: Seconds after which the lock expires if not released
+
+        Returns:
+            Lock token if acquired, None if held elsewhere or Redis failed
+        """
+        token = secrets.token_hex(16)
+        try:
+            acquired = await self.redis_client.set(key, token, nx=True, ex=ttl)
+            return token if acquired else None
+        except Exception:
+            return None
+
+    async def release_lock(self, key: str, token: str) -> bool:
+        """Release a distributed lock held with the given token.
+
+        Args:
+            key: Lock key
+            token: Token returned by acquire_lock
+
+        Returns:
+            True if released, False otherwise
+        """
+        try:
+            result = await self.redis_client.eval(RELEASE_LOCK_SCRIPT, 1, key, token)
+            return bool(result)
+        except Exception:
+            return False
+
     def get_banesco_transaction_cache_key(self, transaction_id: str) -> str:
         """Generate cache key for Banesco transaction.
 
@@ -95,6 +148,39 @@ class CacheService:
         """
         return f"banesco:transaction:{transaction_id}"
 
+    def get_banesco_last_good_cache_key(self, transaction_id: str) -> str:
+        """Generate cache key for the last good Banesco response.
+
+        Args:
+            transaction_id: Transaction ID
+
+        Returns:
+            Cache key
+        """
+        return f"banesco:transaction:last_good:{transaction_id}"
+
+    def get_banesco_token_cache_key(self, client_id: str) -> str:
+        """Generate cache key for a Banesco OAuth token.
+
+        Args:
+            client_id: OAuth client ID
+
+        Returns:
+            Cache key
+        """
+        return f"banesco:oauth:token:{client_id}"
+
+    def get_banesco_token_lock_key(self, client_id: str) -> str:
+        """Generate lock key for refreshing a Banesco OAuth token.
+
+        Args:
+            client_id: OAuth client ID
+
+        Returns:
+            Lock key
+        """
+        return f"banesco:oauth:lock:{client_id}"
+
     def get_user_cache_key(self, user_id: str) -> str:
         """Generate cache key for user.
 
@@ -31,8 +31,106 @@ class Settings(BaseSettings):
     # Banesco
     banesco_api_url: str = Field(..., description="Banesco API base URL")
     banesco_api_key: str = Field(..., description="Banesco API key")
+    banesco_auth_url: str = Field(default="", description="Banesco OAuth token URL")
+    banesco_client_id: str = Field(default="")
+    banesco_client_secret: str = Field(default="")
     banesco_timeout: int = Field(default=30)
     banesco_rate_limit: int = Field(default=2)
+    banesco_rate_limit_defer: bool = Field(default=False)
+    banesco_rate_limit_defer_max_wait: float = Field(default=10.0)
+    banesco_rate_limit_defer_max_waiters: int = Field(default=100)
+    # "redis" (database while Redis is down) or "database"
+    rate_limit_backend: str = Field(default="redis")
+    # Redis only: limits of at least LEASE_MIN_LIMIT per window are served
+    # from per-process leases of LEASE_SIZE tokens (0 disables leasing)
+    rate_limit_lease_size: int = Field(default=0)
+    rate_limit_lease_ttl: float = Field(default=5.0)
+    rate_limit_lease_min_limit: int = Field(default=20)
+    # Database counters of windows older than the retention are purged
+    rate_limit_purge_enabled: bool = Field(default=True)
+    rate_limit_purge_interval: float = Field(default=300.0)
+    rate_limit_purge_retention: float = Field(default=3600.0)
+    rate_limit_purge_batch_size: int = Field(default=5000)
+    banesco_token_refresh_ahead: int = Field(default=300)
+    banesco_token_refresh_jitter: int = Field(default=30)
+    banesco_batch_concurrency: int = Field(default=5)
+    banesco_request_deadline: float = Field(default=10.0)
+    banesco_min_attempt_time: float = Field(default=0.5)
+    banesco_retry_budget_ratio: float = Field(default=0.1)
+    banesco_retry_budget_min_per_second: float = Field(default=1.0)
+
+    # Background reconciliation of IN_PROGRESS transactions
+    reconciliation_enabled: bool = Field(default=True)
+    reconciliation_interval: float = Field(default=30.0)
+    reconciliation_batch_size: int = Field(default=50)
+    reconciliation_base_delay: float = Field(default=30.0)
+    reconciliation_max_delay: float = Field(default=3600.0)
+    reconciliation_doubling_age: float = Field(default=600.0)
+    reconciliation_max_age: float = Field(default=259200.0)
+
+    # Bank connectors
+    bank_lookup_timeout: float = Field(default=10.0)
+
+    # Banesco status webhooks (an empty secret rejects every notification)
+    banesco_webhook_secret: str = Field(default="")
+    banesco_webhook_tolerance: float = Field(default=300.0)
+    banesco_webhook_queue_size: int = Field(default=10000)
+    banesco_webhook_batch_size: int = Field(default=200)
+    banesco_webhook_flush_interval: float = Field(default=0.5)
+
+    # Banesco credential pool ("client_id:client_secret" entries)
+    banesco_additional_credentials: List[str] = Field(default=[])
+    banesco_credential_eject_after: int = Field(default=3)
+    banesco_credential_eject_duration: float = Field(default=60.0)
+
+    # Banesco circuit breaker
+    banesco_circuit_failure_rate: float = Field(default=0.5)
+    banesco_circuit_slow_call_rate: float = Field(default=0.8)
+    banesco_circuit_slow_call_duration: float = Field(default=5.0)
+    banesco_circuit_minimum_calls: int = Field(default=10)
+    banesco_circuit_window_size: int = Field(default=20)
+    banesco_circuit_open_duration: float = Field(default=30.0)
+
+    # Banesco client-side throttle
+    banesco_throttle_rate: float = Field(default=5.0)
+    banesco_throttle_burst: int = Field(default=10)
+    banesco_throttle_min_rate: float = Field(default=0.2)
+    banesco_throttle_max_waiters: int = Field(default=100)
+    banesco_throttle_max_wait: float = Field(default=5.0)
+    banesco_max_retry_after: float = Field(default=300.0)
+
+    # Banesco adaptive concurrency limit
+    banesco_concurrency_initial_limit: int = Field(default=10)
+    banesco_concurrency_min_limit: int = Field(default=1)
+    banesco_concurrency_max_limit: int = Field(default=50)
+    banesco_concurrency_latency_target: float = Field(default=1.0)
+    banesco_concurrency_max_queue: int = Field(default=100)
+    banesco_concurrency_max_wait: float = Field(default=2.0)
+
+    # Banesco hedged status lookups (opt-in)
+    banesco_hedging_enabled: bool = Field(default=False)
+    banesco_hedge_quantile: float = Field(default=0.95)
+    banesco_hedge_min_delay: float = Field(default=0.05)
+    banesco_hedge_min_samples: int = Field(default=20)
+
+    # Banesco response cache TTLs (seconds)
+    banesco_cache_terminal_ttl: int = Field(default=86400)
+    banesco_cache_pending_ttl: int = Field(default=5)
+    banesco_cache_not_found_ttl: int = Field(default=30)
+    banesco_stale_if_error_ttl: int = Field(default=86400)
+    banesco_stale_revalidate_delay: float = Field(default=5.0)
+
+    # Banesco HTTP transport
+    banesco_max_connections: int = Field(default=20)
+    banesco_max_keepalive_connections: int = Field(default=10)
+    banesco_keepalive_expiry: float = Field(default=30.0)
+    banesco_http2: bool = Field(default=False)
+    banesco_prewarm_connections: int = Field(default=2)
+
+    # Record/replay of Banesco traffic ("record", "replay" or empty to disable)
+    banesco_cassette_mode: str = Field(default="")
+    banesco_cassette_path: str = Field(default="banesco-cassette.jsonl.gz")
+    banesco_cassette_time_scale: float = Field(default=1.0)
 
     # Monitoring
     log_level: str = Field(default="INFO")
@@ -1,8 +1,9 @@
 """Rate limit SQLAlchemy model."""
 
+from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import Integer, String
+from sqlalchemy import DateTime, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin
@@ -16,8 +17,20 @@ class RateLimitModel(Base, TimestampMixin):
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     resource_type: Mapped[str] = mapped_column(String(50), nullable=False)
     resource_identifier: Mapped[str] = mapped_column(String(255), nullable=False)
-    window_start: Mapped[str] = mapped_column(String, nullable=False)
+    window_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
     request_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
 
+    __table_args__ = (
+        UniqueConstraint(
+            "resource_type",
+            "resource_identifier",
+            "window_start",
+            name="unique_rate_limit_window",
+        ),
+        Index("ix_rate_limits_window_start", "window_start"),
+    )
+
     def __repr__(self) -> str:
         return f"<RateLimit(resource_type={self.resource_type}, resource_id={self.resource_identifier}, count={self.request_count})>"
@@ -1,9 +1,10 @@
 """Transaction SQLAlchemy models."""
 
 import enum
+from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import Enum, ForeignKey, String, UniqueConstraint
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -43,6 +44,11 @@ class TransactionModel(Base, TimestampMixin, SoftDeleteMixin):
         UniqueConstraint(
             "reference", "transaction_type", name="unique_reference_per_type"
         ),
+        Index(
+            "ix_transactions_reconcile_due",
+            "next_reconcile_at",
+            postgresql_where=text("status = 'IN_PROGRESS' AND deleted_at IS NULL"),
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
@@ -72,6 +78,9 @@ class TransactionModel(Base, TimestampMixin, SoftDeleteMixin):
     created_by: Mapped[UUID | None] = mapped_column(
         ForeignKey("users.id"), nullable=True
     )
+    next_reconcile_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     # Relationships
     creator = relationship(
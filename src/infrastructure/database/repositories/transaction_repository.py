@@ -1,12 +1,24 @@
 """Transaction repository implementation."""
 
-from datetime import datetime
-from uuid import UUID
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    String,
+    bindparam,
+    cast,
+    column,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.entities.transaction import (
+    ActorType,
     BankType,
     Transaction,
     TransactionStatus,
@@ -201,8 +213,14 @@ class TransactionRepository(ITransactionRepository):
         new_status: TransactionStatus,
         reason: str | None = None,
         actor_id: UUID | None = None,
+        actor_type: ActorType | None = None,
+        event_metadata: dict | None = None,
     ) -> bool:
-        """Update transaction status and create audit event."""
+        """Update transaction status and create audit event.
+
+        The actor type defaults to USER when an actor ID is given and to
+        SYSTEM otherwise.
+        """
         # Get transaction
         stmt = select(TransactionModel).where(TransactionModel.id == transaction_id)
         result = await self.session.execute(stmt)
@@ -220,11 +238,142 @@ class TransactionRepository(ITransactionRepository):
             old_status=TransactionStatusEnum(old_status.value),
             new_status=TransactionStatusEnum(new_status.value),
             reason=reason,
-            actor_type="USER" if actor_id else "SYSTEM",
+            actor_type=(
+                actor_type or (ActorType.USER if actor_id else ActorType.SYSTEM)
+            ).value,
             actor_id=actor_id,
-            metadata={},
+            event_metadata=event_metadata or {},
         )
         self.session.add(event)
 
         await self.session.flush()
         return True
+
+    async def claim_for_reconciliation(
+        self, limit: int, lease: timedelta, max_age: timedelta
+    ) -> list[Transaction]:
+        """Claim in-progress transactions due for reconciliation.
+
+        Claimed rows are pushed ``lease`` into the future so that other
+        workers skip them; rows locked by another worker are skipped too.
+        Transactions older than ``max_age`` are no longer reconciled.
+        """
+        due = (
+            select(TransactionModel.id)
+            .where(
+                TransactionModel.status == TransactionStatusEnum.IN_PROGRESS,
+                TransactionModel.deleted_at.is_(None),
+                TransactionModel.created_at >= func.now() - max_age,
+                or_(
+                    TransactionModel.next_reconcile_at.is_(None),
+                    TransactionModel.next_reconcile_at <= func.now(),
+                ),
+            )
+            .order_by(TransactionModel.next_reconcile_at.asc().nullsfirst())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(TransactionModel)
+            .where(TransactionModel.id.in_(due.scalar_subquery()))
+            # Scheduling is not a change to the transaction itself
+            .values(
+                next_reconcile_at=func.now() + lease,
+                updated_at=TransactionModel.updated_at,
+            )
+            .returning(TransactionModel)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.scalars(stmt)
+        return [self._to_entity(model) for model in result.all()]
+
+    async def schedule_reconciliation(self, next_checks: dict[UUID, datetime]) -> None:
+        """Set when each transaction is next reconciled."""
+        if not next_checks:
+            return
+
+        table = TransactionModel.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("transaction_pk"))
+            .values(
+                next_reconcile_at=bindparam("next_check"),
+                updated_at=table.c.updated_at,
+            )
+        )
+        await self.session.execute(
+            stmt,
+            [
+                {"transaction_pk": transaction_id, "next_check": next_check}
+                for transaction_id, next_check in next_checks.items()
+            ],
+        )
+        await self.session.flush()
+
+    async def bulk_update_status(
+        self,
+        updates: dict[str, TransactionStatus],
+        reason: str | None = None,
+        actor_type: ActorType = ActorType.EXTERNAL,
+        event_metadata: dict[str, dict] | None = None,
+    ) -> list[str]:
+        """Move in-progress transactions to new statuses in two statements.
+
+        A single ``UPDATE ... FROM (VALUES ...)`` changes every transaction
+        that is still in progress, and a single multi-row INSERT records
+        their audit events. Transactions that already left IN_PROGRESS are
+        left untouched, so applying the same updates twice is harmless.
+
+        Args:
+            updates: New status by Banesco transaction ID
+            reason: Reason recorded on every event
+            actor_type: Who made the change
+            event_metadata: Event metadata by Banesco transaction ID
+
+        Returns:
+            Banesco transaction IDs whose status changed
+        """
+        if not updates:
+            return []
+
+        new_statuses = values(
+            column("transaction_id", String),
+            column("new_status", String),
+            name="new_statuses",
+        ).data([(tid, status.value) for tid, status in updates.items()])
+        stmt = (
+            update(TransactionModel)
+            .where(
+                TransactionModel.transaction_id == new_statuses.c.transaction_id,
+                TransactionModel.status == TransactionStatusEnum.IN_PROGRESS,
+                TransactionModel.deleted_at.is_(None),
+            )
+            .values(
+                status=cast(new_statuses.c.new_status, TransactionModel.status.type)
+            )
+            .returning(TransactionModel.id, TransactionModel.transaction_id)
+            .execution_options(synchronize_session=False)
+        )
+        changed = (await self.session.execute(stmt)).all()
+        if not changed:
+            return []
+
+        event_metadata = event_metadata or {}
+        await self.session.execute(
+            insert(TransactionEventModel).values(
+                [
+                    {
+                        "id": uuid4(),
+                        "transaction_id": pk,
+                        "old_status": TransactionStatusEnum.IN_PROGRESS,
+                        "new_status": TransactionStatusEnum(updates[tid].value),
+                        "reason": reason,
+                        "actor_type": actor_type.value,
+                        "event_metadata": event_metadata.get(tid, {}),
+                    }
+                    for pk, tid in changed
+                ]
+            )
+        )
+        await self.session.flush()
+        return [tid for _, tid in changed]
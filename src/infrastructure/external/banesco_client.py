@@ -1,93 +1,392 @@
 """Banesco API client with OAuth 2.0 authentication."""
 
 import asyncio
-from datetime import datetime, timedelta
+import contextlib
+import math
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
 
 import httpx
 import structlog
 from tenacity import (
-    retry,
+    AsyncRetrying,
+    RetryCallState,
     retry_if_exception_type,
+    retry_if_not_exception_type,
     stop_after_attempt,
     wait_exponential,
 )
 
+from infrastructure.cache.redis_cache import CacheService
+from infrastructure.external.banesco_credentials import (
+    BanescoCredential,
+    BanescoCredentialPool,
+)
+from infrastructure.monitoring.metrics import (
+    banesco_api_attempts,
+    banesco_api_calls_total,
+    banesco_api_duration_seconds,
+    banesco_api_errors_total,
+    banesco_circuit_breaker_state,
+    banesco_concurrency_in_flight,
+    banesco_concurrency_limit,
+    banesco_concurrency_queue_depth,
+    banesco_conditional_requests_total,
+    banesco_rate_limit_exceeded_total,
+    banesco_retries_total,
+    banesco_singleflight_calls_total,
+    banesco_stale_responses_total,
+    banesco_throttle_rate,
+    banesco_throttle_tokens_total,
+    banesco_throttle_wait_seconds,
+    banesco_token_refresh_duration_seconds,
+    cache_operations_total,
+)
+from infrastructure.resilience import (
+    AdaptiveTokenBucket,
+    AIMDConcurrencyLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    ConcurrencyLimitExceededError,
+    DeadlineExceededError,
+    Hedger,
+    RetryBudget,
+    SingleFlight,
+    ThrottleTimeoutError,
+    cap_timeout,
+    clear_deadline,
+    remaining_time,
+    stop_before_deadline,
+)
+
+if TYPE_CHECKING:
+    from application.services.rate_limit_service import RateLimitService
+
 logger = structlog.get_logger()
 
+# Call outcomes whose latency reflects a complete Banesco answer
+ANSWERED_STATUSES = frozenset({"success", "not_modified", "not_found"})
+
+# Upstream statuses after which a transaction no longer changes
+TERMINAL_BANESCO_STATUSES = frozenset(
+    {"COMPLETED", "APPROVED", "CANCELED", "CANCELLED", "REJECTED"}
+)
+
 
 class BanescoOAuth2Client:
     """OAuth 2.0 client for Banesco authentication."""
 
-    def __init__(self, auth_url: str, client_id: str, client_secret: str) -> None:
+    def __init__(
+        self,
+        auth_url: str,
+        client_id: str,
+        client_secret: str,
+        http_client: httpx.AsyncClient | None = None,
+        refresh_ahead: float = 300,
+        refresh_jitter: float = 30,
+        cache: CacheService | None = None,
+        shared_lock_ttl: int = 30,
+        shared_lock_wait: float = 10,
+        min_attempt_time: float = 0.5,
+        retry_budget: RetryBudget | None = None,
+        min_refresh_interval: float = 1.0,
+    ) -> None:
         self.auth_url = auth_url
         self.client_id = client_id
         self.client_secret = client_secret
         self.access_token: str | None = None
         self.token_expires_at: datetime | None = None
+        self.token_lifetime: float | None = None
+        self.refresh_ahead = refresh_ahead
+        self.refresh_jitter = refresh_jitter
+        self.min_refresh_interval = min_refresh_interval
+        self.cache = cache
+        self.shared_lock_ttl = shared_lock_ttl
+        self.shared_lock_wait = shared_lock_wait
+        self.min_attempt_time = min_attempt_time
+        self.retry_budget = retry_budget or RetryBudget(metric=banesco_retries_total)
         self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
+        # Drawn from once per refresh, so the OS source costs nothing
+        self._rng = random.SystemRandom()
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient()
+
+    def _has_valid_token(self) -> bool:
+        """Check if the current token exists and has not expired."""
+        return bool(
+            self.access_token
+            and self.token_expires_at
+            and datetime.utcnow() < self.token_expires_at
+        )
 
     async def get_access_token(self) -> str:
-        """Get valid access token, refreshing if necessary."""
+        """Get valid access token, refreshing if necessary.
+
+        Reads are lock-free while a valid token is held; only callers that find
+        no valid token wait for the refresh.
+        """
+        if self._has_valid_token():
+            return self.access_token or ""
+
         async with self._lock:
-            # Check if current token is still valid
-            if (
-                self.access_token
-                and self.token_expires_at
-                and datetime.utcnow() < self.token_expires_at
-            ):
-                return self.access_token
-
-            # Request new token
-            await self._request_new_token()
+            # Another caller may have refreshed while we waited for the lock
+            if self._has_valid_token():
+                return self.access_token or ""
+
+            await self._obtain_token()
             return self.access_token or ""
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
+    async def _obtain_token(self, valid_for: float = 0) -> None:
+        """Obtain a token, recording how long it took.
+
+        Args:
+            valid_for: Minimum remaining lifetime in seconds for a shared token
+                to be adopted instead of refreshing
+        """
+        started_at = time.perf_counter()
+        try:
+            await self._obtain_shared_or_new_token(valid_for)
+        finally:
+            banesco_token_refresh_duration_seconds.observe(
+                time.perf_counter() - started_at
+            )
+
+    async def _obtain_shared_or_new_token(self, valid_for: float = 0) -> None:
+        """Obtain a token, sharing it with other workers through Redis.
+
+        One worker refreshes under a distributed lock and publishes the token;
+        the others read it. Without a cache, or when Redis is unavailable, the
+        token is refreshed in-process.
+
+        Args:
+            valid_for: Minimum remaining lifetime in seconds for a shared token
+                to be adopted instead of refreshing
+        """
+        if self.cache is None:
+            await self._request_new_token()
+            return
+
+        if await self._load_shared_token(valid_for):
+            return
+
+        lock_key = self.cache.get_banesco_token_lock_key(self.client_id)
+        lock_token = await self.cache.acquire_lock(lock_key, ttl=self.shared_lock_ttl)
+        if lock_token:
+            try:
+                # Another worker may have published a token before we got the lock
+                if await self._load_shared_token(valid_for):
+                    return
+                await self._request_new_token()
+                await self._store_shared_token()
+            finally:
+                await self.cache.release_lock(lock_key, lock_token)
+            return
+
+        if not await self.cache.ping():
+            logger.warning("Redis unavailable, refreshing Banesco token in-process")
+            await self._request_new_token()
+            return
+
+        # Another worker is refreshing; wait for it to publish the new token
+        wait = self.shared_lock_wait
+        remaining = remaining_time()
+        if remaining is not None:
+            wait = min(wait, max(remaining - self.min_attempt_time, 0))
+        loop = asyncio.get_running_loop()
+        wait_until = loop.time() + wait
+        while loop.time() < wait_until:
+            await asyncio.sleep(0.1)
+            if await self._load_shared_token(valid_for):
+                return
+
+        logger.warning("Timed out waiting for shared Banesco token, refreshing locally")
+        await self._request_new_token()
+        await self._store_shared_token()
+
+    async def _load_shared_token(self, valid_for: float = 0) -> bool:
+        """Adopt the token published in Redis if it is valid long enough."""
+        if self.cache is None:
+            return False
+
+        cached = await self.cache.get(
+            self.cache.get_banesco_token_cache_key(self.client_id)
+        )
+        if not cached:
+            return False
+
+        expires_at = datetime.fromisoformat(cached["expires_at"])
+        if (expires_at - datetime.utcnow()).total_seconds() <= valid_for:
+            return False
+
+        self.access_token = cached["access_token"]
+        self.token_expires_at = expires_at
+        self.token_lifetime = cached.get("lifetime")
+        return True
+
+    async def _store_shared_token(self) -> None:
+        """Publish the current token to Redis for other workers."""
+        if self.cache is None or not self.access_token or not self.token_expires_at:
+            return
+
+        ttl = int((self.token_expires_at - datetime.utcnow()).total_seconds())
+        await self.cache.set(
+            self.cache.get_banesco_token_cache_key(self.client_id),
+            {
+                "access_token": self.access_token,
+                "expires_at": self.token_expires_at.isoformat(),
+                "lifetime": self.token_lifetime,
+            },
+            ttl=max(ttl, 1),
+        )
+
+    def start_background_refresh(self) -> None:
+        """Start renewing the token ahead of its expiry in the background."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop_background_refresh(self) -> None:
+        """Stop the background token renewal task."""
+        if self._refresh_task is None:
+            return
+
+        self._refresh_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._refresh_task
+        self._refresh_task = None
+
+    def _refresh_margin(self) -> float:
+        """Seconds before expiry at which the token is renewed.
+
+        Short-lived tokens are renewed halfway through their lifetime
+        instead, so a renewed token is never already due for renewal.
+        """
+        if self.token_lifetime is None:
+            return self.refresh_ahead
+        return min(self.refresh_ahead, self.token_lifetime / 2)
+
+    def _seconds_until_refresh(self) -> float:
+        """Seconds to wait before the next refresh-ahead renewal."""
+        if not self._has_valid_token() or self.token_expires_at is None:
+            return self.min_refresh_interval
+
+        remaining = (self.token_expires_at - datetime.utcnow()).total_seconds()
+        margin = self._refresh_margin()
+        jitter = self._rng.uniform(0, min(self.refresh_jitter, margin / 2))
+        return max(remaining - margin - jitter, self.min_refresh_interval)
+
+    async def _refresh_loop(self) -> None:
+        """Renew the token before it expires so readers never wait on refresh."""
+        while True:
+            await asyncio.sleep(self._seconds_until_refresh())
+            try:
+                async with self._lock:
+                    await self._obtain_token(valid_for=self._refresh_margin())
+            except Exception as e:
+                # The current token stays in use until it actually expires
+                logger.warning("Background Banesco token refresh failed", error=str(e))
+                await asyncio.sleep(min(self.refresh_jitter, 30) or 1)
+
     async def _request_new_token(self) -> None:
+        """Request new access token, retrying failed attempts.
+
+        Retries stop early when the current request deadline cannot fit
+        another attempt or the retry budget is exhausted.
+        """
+        self.retry_budget.record_attempt()
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(3)
+            | stop_before_deadline(self.min_attempt_time)
+            | self.retry_budget.stop_when_exhausted("oauth_token"),
+            wait=wait_exponential(multiplier=1, min=2, max=10),
+            retry=retry_if_not_exception_type(DeadlineExceededError),
+        )
+        try:
+            await retrying(self._request_token_once)
+        finally:
+            banesco_api_attempts.labels(operation="oauth_token").observe(
+                retrying.statistics.get("attempt_number", 0)
+            )
+
+    async def _request_token_once(self) -> None:
         """Request new access token from Banesco OAuth server."""
         logger.info("Requesting new Banesco OAuth token")
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self.auth_url,
-                    data={
-                        "grant_type": "client_credentials",
-                        "client_id": self.client_id,
-                        "client_secret": self.client_secret,
-                    },
-                    timeout=30,
-                )
-                response.raise_for_status()
+        started_at = time.perf_counter()
+        status = "error"
+        error_type: str | None = None
+        try:
+            response = await self.http_client.post(
+                self.auth_url,
+                data={
+                    "grant_type": "client_credentials",
+                    "client_id": self.client_id,
+                    "client_secret": self.client_secret,
+                },
+                timeout=cap_timeout(30),
+            )
+            response.raise_for_status()
 
-                token_data = response.json()
-                self.access_token = token_data["access_token"]
-                expires_in = token_data.get("expires_in", 3600)
+            token_data = response.json()
+            self.access_token = token_data["access_token"]
+            expires_in = token_data.get("expires_in", 3600)
 
-                # Set expiration with 60 second buffer
-                self.token_expires_at = datetime.utcnow() + timedelta(
-                    seconds=expires_in - 60
-                )
+            # Set expiration with a 60 second buffer (a tenth of short lifetimes)
+            self.token_lifetime = expires_in - min(60, expires_in / 10)
+            self.token_expires_at = datetime.utcnow() + timedelta(
+                seconds=self.token_lifetime
+            )
 
-                logger.info(
-                    "Successfully obtained Banesco OAuth token",
-                    expires_in=expires_in,
-                )
+            status = "success"
+            logger.info(
+                "Successfully obtained Banesco OAuth token",
+                expires_in=expires_in,
+            )
 
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    "Failed to obtain Banesco OAuth token",
-                    status_code=e.response.status_code,
-                    error=str(e),
-                )
-                raise
-            except Exception as e:
-                logger.error(
-                    "Unexpected error obtaining Banesco OAuth token", error=str(e)
-                )
-                raise
+        except httpx.HTTPStatusError as e:
+            error_type = classify_error(e)
+            logger.error(
+                "Failed to obtain Banesco OAuth token",
+                status_code=e.response.status_code,
+                error=str(e),
+            )
+            raise
+        except Exception as e:
+            error_type = classify_error(e)
+            logger.error("Unexpected error obtaining Banesco OAuth token", error=str(e))
+            raise
+        finally:
+            record_api_call(
+                "oauth_token", status, time.perf_counter() - started_at, error_type
+            )
+
+    async def invalidate_token(self) -> None:
+        """Drop a token that Banesco rejected so the next call fetches a new one.
+
+        The shared copy in Redis is removed too if it is the same token.
+        """
+        rejected = self.access_token
+        self.access_token = None
+        self.token_expires_at = None
+        if self.cache is None or rejected is None:
+            return
+
+        key = self.cache.get_banesco_token_cache_key(self.client_id)
+        cached = await self.cache.get(key)
+        if cached and cached.get("access_token") == rejected:
+            await self.cache.delete(key)
+
+    async def close(self) -> None:
+        """Stop background refresh and close HTTP client if owned."""
+        await self.stop_background_refresh()
+        if self._owns_http_client:
+            await self.http_client.aclose()
 
 
 class BanescoAPIError(Exception):
@@ -96,16 +395,34 @@ class BanescoAPIError(Exception):
     pass
 
 
+class BanescoAuthError(BanescoAPIError):
+    """Raised when Banesco rejects the access token of a credential."""
+
+    pass
+
+
 class BanescoTimeoutError(Exception):
     """Raised when Banesco API request times out."""
 
     pass
 
 
+class BanescoDeadlineExceededError(BanescoTimeoutError):
+    """Raised when the caller's deadline expires before Banesco answers."""
+
+    pass
+
+
 class BanescoRateLimitError(Exception):
     """Raised when Banesco API rate limit is exceeded."""
 
-    pass
+    def __init__(
+        self,
+        message: str = "Banesco API rate limit exceeded",
+        retry_after: float | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class BanescoNotFoundError(Exception):
@@ -114,36 +431,247 @@ class BanescoNotFoundError(Exception):
     pass
 
 
+class BanescoCircuitOpenError(Exception):
+    """Raised when Banesco calls are short-circuited after repeated failures."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("Banesco API is temporarily unavailable")
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: object, max_seconds: float = 300.0) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date.
+
+    Args:
+        value: Header value
+        max_seconds: Longest wait honored; longer ones are capped
+
+    Returns:
+        Seconds to wait, or None if absent or invalid
+    """
+    if not isinstance(value, str):
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        # "inf" or "nan" would pause the throttle for good
+        if not math.isfinite(seconds) or seconds < 0:
+            return None
+        return min(seconds, max_seconds)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), max_seconds)
+
+
+def classify_error(error: Exception) -> str:
+    """Map an exception from a Banesco call to an ``error_type`` label."""
+    if isinstance(error, httpx.TimeoutException):
+        return "timeout"
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"http_{error.response.status_code}"
+    if isinstance(error, httpx.TransportError):
+        return "connection"
+    return "unexpected"
+
+
+def record_api_call(
+    operation: str, status: str, duration: float, error_type: str | None = None
+) -> None:
+    """Record one Banesco HTTP call in the API metrics.
+
+    Args:
+        operation: Operation name (``oauth_token``, ``get_transaction_status``)
+        status: Call outcome (``success``, ``not_modified``, ``error``, ...)
+        duration: Call duration in seconds
+        error_type: Error classification when the call failed (optional)
+    """
+    banesco_api_calls_total.labels(operation=operation, status=status).inc()
+    banesco_api_duration_seconds.labels(operation=operation).observe(duration)
+    if error_type is not None:
+        banesco_api_errors_total.labels(error_type=error_type).inc()
+
+
+def is_terminal_payload(payload: dict | None) -> bool:
+    """Check if a Banesco payload reports a final transaction status."""
+    if not payload:
+        return False
+    return str(payload.get("status", "")).upper() in TERMINAL_BANESCO_STATUSES
+
+
+def _is_overload(error: Exception) -> bool:
+    """Check if an error signals that Banesco is overloaded."""
+    if isinstance(error, BanescoDeadlineExceededError):
+        return False
+    return isinstance(error, BanescoTimeoutError | BanescoRateLimitError)
+
+
+_backoff = wait_exponential(multiplier=1, min=4, max=10)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Back off between attempts, except after a rejected credential.
+
+    A 401 says nothing about Banesco's health, so the next attempt, made
+    with a fresh token or another credential, starts right away.
+    """
+    if retry_state.outcome is not None and isinstance(
+        retry_state.outcome.exception(), BanescoAuthError
+    ):
+        return 0.0
+    return _backoff(retry_state)
+
+
+def _wait_bound(max_wait: float) -> float:
+    """Cap a queueing wait to the time left before the current deadline."""
+    remaining = remaining_time()
+    if remaining is None:
+        return max_wait
+    return min(max_wait, max(remaining, 0))
+
+
+def _is_upstream_failure(error: Exception) -> bool:
+    """Check if an error indicates Banesco is unhealthy."""
+    if _is_neutral_outcome(error):
+        return False
+    return isinstance(error, BanescoTimeoutError | BanescoAPIError)
+
+
+def _is_neutral_outcome(error: Exception) -> bool:
+    """Check if an error says nothing about Banesco's health.
+
+    The caller ran out of time, or one credential was rejected; such calls
+    neither count as failures nor as successes.
+    """
+    return isinstance(error, BanescoDeadlineExceededError | BanescoAuthError)
+
+
+@dataclass
+class BanescoStatusResult:
+    """Outcome of a single transaction lookup.
+
+    ``stale`` is set when Banesco failed and the last good response was
+    served instead; ``age_seconds`` then tells how old that response is.
+    """
+
+    transaction_id: str
+    data: dict | None = None
+    error: Exception | None = None
+    stale: bool = False
+    age_seconds: float | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Check if the lookup succeeded."""
+        return self.error is None
+
+
 class BanescoClient:
-    """Client for interacting with Banesco API."""
+    """Client for interacting with Banesco API.
+
+    Calls authenticate with ``oauth_client`` and are paced by ``throttle``,
+    unless a ``credential_pool`` is given: each call then picks a credential
+    from the pool and uses that credential's token and throttle.
+    """
 
     def __init__(
         self,
         base_url: str,
-        oauth_client: BanescoOAuth2Client,
+        oauth_client: BanescoOAuth2Client | None = None,
         timeout: int = 30,
+        http_client: httpx.AsyncClient | None = None,
+        batch_concurrency: int = 5,
+        circuit_breaker: CircuitBreaker | None = None,
+        throttle: AdaptiveTokenBucket | None = None,
+        concurrency_limiter: AIMDConcurrencyLimiter | None = None,
+        hedger: Hedger | None = None,
+        cache: CacheService | None = None,
+        cache_terminal_ttl: int = 86400,
+        cache_pending_ttl: int = 5,
+        cache_not_found_ttl: int = 30,
+        stale_if_error_ttl: int = 86400,
+        stale_revalidate_delay: float = 5.0,
+        stale_max_entries: int = 10000,
+        min_attempt_time: float = 0.5,
+        retry_budget: RetryBudget | None = None,
+        credential_pool: BanescoCredentialPool | None = None,
+        shared_call_timeout: float | None = None,
+        max_retry_after: float = 300.0,
     ) -> None:
+        if credential_pool is None:
+            if oauth_client is None:
+                raise ValueError("oauth_client or credential_pool is required")
+            credential_pool = BanescoCredentialPool(
+                [
+                    BanescoCredential(
+                        name="default",
+                        oauth_client=oauth_client,
+                        throttle=throttle
+                        or AdaptiveTokenBucket(
+                            tokens_metric=banesco_throttle_tokens_total,
+                            wait_metric=banesco_throttle_wait_seconds,
+                            rate_metric=banesco_throttle_rate,
+                        ),
+                    )
+                ]
+            )
         self.base_url = base_url
-        self.oauth_client = oauth_client
+        self.credential_pool = credential_pool
+        self.oauth_client = credential_pool.credentials[0].oauth_client
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=httpx.Timeout(timeout))
+        self.batch_concurrency = batch_concurrency
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            name="banesco", metric=banesco_circuit_breaker_state
+        )
+        self.concurrency_limiter = concurrency_limiter or AIMDConcurrencyLimiter(
+            limit_metric=banesco_concurrency_limit,
+            queue_metric=banesco_concurrency_queue_depth,
+            in_flight_metric=banesco_concurrency_in_flight,
+        )
+        self.hedger = hedger
+        self.cache = cache
+        self.cache_terminal_ttl = cache_terminal_ttl
+        self.cache_pending_ttl = cache_pending_ttl
+        self.cache_not_found_ttl = cache_not_found_ttl
+        self.stale_if_error_ttl = stale_if_error_ttl
+        self.stale_revalidate_delay = stale_revalidate_delay
+        self.stale_max_entries = stale_max_entries
+        self.min_attempt_time = min_attempt_time
+        self.shared_call_timeout = shared_call_timeout
+        self.max_retry_after = max_retry_after
+        self.retry_budget = retry_budget or RetryBudget(metric=banesco_retries_total)
+        self._last_good: OrderedDict[str, dict] = OrderedDict()
+        self._revalidations: dict[str, asyncio.Task[None]] = {}
+        self._owns_client = http_client is None
+        self.client = http_client or httpx.AsyncClient(timeout=httpx.Timeout(timeout))
+        self._status_flight: SingleFlight[dict | None] = SingleFlight(
+            metric=banesco_singleflight_calls_total
+        )
 
-    async def _get_headers(self) -> dict[str, str]:
-        """Get request headers with OAuth 2.0 token."""
-        access_token = await self.oauth_client.get_access_token()
+    async def _get_headers(self, credential: BanescoCredential) -> dict[str, str]:
+        """Get request headers with the OAuth 2.0 token of a credential."""
+        access_token = await credential.oauth_client.get_access_token()
         return {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
         }
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type(BanescoAPIError),
-    )
     async def get_transaction_status(self, transaction_id: str) -> dict | None:
         """Get transaction status from Banesco API.
 
+        Results are served from the response cache when available. Concurrent
+        calls for the same transaction share a single upstream request and
+        its result or error. If Banesco fails, the last good response is
+        returned instead (see ``get_transaction_status_result``).
+
         Args:
             transaction_id: Transaction ID to query
 
@@ -153,53 +681,566 @@ class BanescoClient:
         Raises:
             BanescoTimeoutError: If request times out
             BanescoRateLimitError: If rate limit exceeded
+            BanescoNotFoundError: If transaction does not exist
+            BanescoCircuitOpenError: If Banesco calls are short-circuited
             BanescoAPIError: For other API errors
         """
+        result = await self.get_transaction_status_result(transaction_id)
+        return result.data
+
+    async def get_transaction_status_result(
+        self, transaction_id: str
+    ) -> BanescoStatusResult:
+        """Get transaction status along with its freshness.
+
+        When Banesco times out, errors or the circuit is open, the last good
+        response for the transaction is served marked as stale with its age,
+        and a background revalidation is scheduled. Errors are raised only
+        when no previous response is available.
+
+        Args:
+            transaction_id: Transaction ID to query
+
+        Returns:
+            Lookup result with data and staleness information
+
+        Raises:
+            Same exceptions as ``get_transaction_status``
+        """
+        cached = await self.get_cached_transaction_status(transaction_id)
+        if cached is not None:
+            return BanescoStatusResult(transaction_id=transaction_id, data=cached)
+
         try:
-            headers = await self._get_headers()
-            response = await self.client.get(
-                f"{self.base_url}/transactions/{transaction_id}",
-                headers=headers,
+            data = await self._load_shared(transaction_id)
+        except (BanescoTimeoutError, BanescoCircuitOpenError, BanescoAPIError) as e:
+            last_good = await self._get_last_good(transaction_id)
+            if last_good is None:
+                raise
+
+            age_seconds = time.time() - last_good["fetched_at"]
+            banesco_stale_responses_total.inc()
+            logger.warning(
+                "Serving stale Banesco response",
+                transaction_id=transaction_id,
+                age_seconds=round(age_seconds, 1),
+                error=str(e),
+            )
+            self._schedule_revalidation(transaction_id)
+            return BanescoStatusResult(
+                transaction_id=transaction_id,
+                data=last_good["payload"],
+                stale=True,
+                age_seconds=age_seconds,
+            )
+
+        return BanescoStatusResult(transaction_id=transaction_id, data=data)
+
+    async def _load_shared(self, transaction_id: str) -> dict | None:
+        """Fetch a transaction once for all concurrent callers.
+
+        The shared fetch runs under ``shared_call_timeout`` rather than the
+        deadline of whichever caller started it; each caller waits for it
+        only within its own deadline.
+
+        Raises:
+            BanescoDeadlineExceededError: If the caller's deadline passes first
+        """
+        try:
+            return await self._status_flight.do(
+                transaction_id,
+                lambda: self._load_transaction_status(transaction_id),
+                timeout=self.shared_call_timeout,
+            )
+        except DeadlineExceededError as e:
+            raise BanescoDeadlineExceededError(
+                f"Deadline exceeded querying Banesco for {transaction_id}"
+            ) from e
+
+    async def get_cached_transaction_status(self, transaction_id: str) -> dict | None:
+        """Get a transaction status from the response cache only.
+
+        Args:
+            transaction_id: Transaction ID to look up
+
+        Returns:
+            Cached transaction data, or None on a cache miss
+
+        Raises:
+            BanescoNotFoundError: If a recent lookup found no such transaction
+        """
+        if self.cache is None:
+            return None
+
+        entry = await self.cache.get(
+            self.cache.get_banesco_transaction_cache_key(transaction_id)
+        )
+        if entry is None:
+            cache_operations_total.labels(operation="get", result="miss").inc()
+            return None
+
+        cache_operations_total.labels(operation="get", result="hit").inc()
+        if entry.get("not_found"):
+            raise BanescoNotFoundError(f"Transaction {transaction_id} not found")
+        return entry.get("payload")
+
+    async def _load_transaction_status(self, transaction_id: str) -> dict | None:
+        """Fetch a transaction from Banesco and populate the response cache.
+
+        The last good response's validators are sent along, so an unchanged
+        transaction costs Banesco a 304 instead of a full body.
+        """
+        previous = await self._get_last_good(transaction_id)
+        try:
+            entry = await self._fetch_transaction_status(transaction_id, previous)
+        except BanescoNotFoundError:
+            await self._cache_transaction_status(transaction_id, None, not_found=True)
+            raise
+
+        payload = entry["payload"]
+        await self._cache_transaction_status(transaction_id, payload)
+        await self._remember_last_good(transaction_id, entry)
+        return payload
+
+    async def _remember_last_good(self, transaction_id: str, entry: dict) -> None:
+        """Keep the latest successful response for stale-if-error serving.
+
+        Args:
+            transaction_id: Banesco transaction ID
+            entry: Response with ``payload`` and its ``etag``/``last_modified``
+                validators
+        """
+        if entry.get("payload") is None:
+            return
+
+        entry = {**entry, "fetched_at": time.time()}
+        self._last_good[transaction_id] = entry
+        self._last_good.move_to_end(transaction_id)
+        while len(self._last_good) > self.stale_max_entries:
+            self._last_good.popitem(last=False)
+
+        if self.cache is not None:
+            await self.cache.set(
+                self.cache.get_banesco_last_good_cache_key(transaction_id),
+                entry,
+                ttl=self.stale_if_error_ttl,
+            )
+
+    async def _get_last_good(self, transaction_id: str) -> dict | None:
+        """Get the last successful response if it is recent enough."""
+        entry = self._last_good.get(transaction_id)
+        if entry is None and self.cache is not None:
+            entry = await self.cache.get(
+                self.cache.get_banesco_last_good_cache_key(transaction_id)
             )
 
+        if entry is None:
+            return None
+        if time.time() - entry["fetched_at"] > self.stale_if_error_ttl:
+            return None
+        return entry
+
+    def _schedule_revalidation(self, transaction_id: str) -> None:
+        """Refresh a transaction served stale once Banesco may have recovered."""
+        if transaction_id in self._revalidations:
+            return
+
+        task = asyncio.create_task(self._revalidate(transaction_id))
+        self._revalidations[transaction_id] = task
+        task.add_done_callback(lambda _: self._revalidations.pop(transaction_id, None))
+
+    async def _revalidate(self, transaction_id: str) -> None:
+        """Fetch a transaction in the background after serving it stale."""
+        # Not bound by the deadline of the request that scheduled it
+        clear_deadline()
+        await asyncio.sleep(
+            max(self.stale_revalidate_delay, self.circuit_breaker.retry_after)
+        )
+        try:
+            await self._load_shared(transaction_id)
+        except Exception as e:
+            logger.info(
+                "Background Banesco revalidation failed",
+                transaction_id=transaction_id,
+                error=str(e),
+            )
+
+    async def _cache_transaction_status(
+        self, transaction_id: str, payload: dict | None, not_found: bool = False
+    ) -> None:
+        """Cache a lookup result with a TTL that depends on its status.
+
+        Final statuses are kept for a long time, in-progress ones for seconds
+        and not-found results briefly as negative entries.
+        """
+        if self.cache is None:
+            return
+
+        if not_found:
+            ttl = self.cache_not_found_ttl
+        elif is_terminal_payload(payload):
+            ttl = self.cache_terminal_ttl
+        else:
+            ttl = self.cache_pending_ttl
+
+        if ttl <= 0:
+            return
+
+        stored = await self.cache.set(
+            self.cache.get_banesco_transaction_cache_key(transaction_id),
+            {"payload": payload, "not_found": not_found},
+            ttl=ttl,
+        )
+        cache_operations_total.labels(
+            operation="set", result="success" if stored else "error"
+        ).inc()
+
+    async def get_transaction_statuses(
+        self,
+        transaction_ids: Iterable[str],
+        rate_limit_service: "RateLimitService | None" = None,
+        concurrency: int | None = None,
+    ) -> dict[str, BanescoStatusResult]:
+        """Get the status of many transactions with bounded concurrency.
+
+        Failures are reported per transaction instead of aborting the batch.
+        Cached results are served without counting against rate limits. When
+        a rate limit service is given, transactions over their
+        per-transaction limit are reported as rate limited without calling
+        Banesco.
+
+        Args:
+            transaction_ids: Transaction IDs to query
+            rate_limit_service: Per-transaction rate limiter (optional)
+            concurrency: Max concurrent lookups (defaults to batch_concurrency)
+
+        Returns:
+            Dict mapping each transaction ID to its lookup result
+        """
+        ids = list(dict.fromkeys(transaction_ids))
+        results: dict[str, BanescoStatusResult] = {}
+        admitted: list[str] = []
+
+        # Admission runs sequentially: the DB session cannot be shared by tasks
+        for transaction_id in ids:
+            try:
+                cached = await self.get_cached_transaction_status(transaction_id)
+            except BanescoNotFoundError as e:
+                results[transaction_id] = BanescoStatusResult(
+                    transaction_id=transaction_id, error=e
+                )
+                continue
+            if cached is not None:
+                results[transaction_id] = BanescoStatusResult(
+                    transaction_id=transaction_id, data=cached
+                )
+                continue
+
+            if rate_limit_service is None:
+                admitted.append(transaction_id)
+                continue
+
+            decision = await rate_limit_service.try_acquire(
+                "TRANSACTION_ID", transaction_id
+            )
+            if decision.allowed:
+                admitted.append(transaction_id)
+            else:
+                banesco_rate_limit_exceeded_total.labels(
+                    transaction_id=transaction_id
+                ).inc()
+                results[transaction_id] = BanescoStatusResult(
+                    transaction_id=transaction_id,
+                    error=BanescoRateLimitError(
+                        f"Rate limit exceeded for transaction {transaction_id}"
+                    ),
+                )
+
+        semaphore = asyncio.Semaphore(concurrency or self.batch_concurrency)
+
+        async def lookup(transaction_id: str) -> BanescoStatusResult:
+            async with semaphore:
+                try:
+                    return await self.get_transaction_status_result(transaction_id)
+                except Exception as e:
+                    return BanescoStatusResult(transaction_id=transaction_id, error=e)
+
+        for result in await asyncio.gather(*(lookup(t) for t in admitted)):
+            results[result.transaction_id] = result
+
+        logger.info(
+            "Completed Banesco batch lookup",
+            requested=len(ids),
+            failed=sum(not result.ok for result in results.values()),
+        )
+        return {transaction_id: results[transaction_id] for transaction_id in ids}
+
+    async def _fetch_transaction_status(
+        self, transaction_id: str, previous: dict | None = None
+    ) -> dict:
+        """Query Banesco for a transaction, retrying transient API errors.
+
+        Args:
+            transaction_id: Banesco transaction ID
+            previous: Last good response whose validators make the request
+                conditional (optional)
+
+        Returns:
+            Response entry with ``payload``, ``etag`` and ``last_modified``
+
+        Within a ``deadline_scope``, the token fetch, every attempt and the
+        backoff between attempts share the caller's deadline; retrying stops
+        once the time left cannot fit another attempt. Retries also draw from
+        the retry budget shared with the OAuth client, so a Banesco brownout
+        does not multiply the load we send it.
+        """
+        self.retry_budget.record_attempt()
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(3)
+            | stop_before_deadline(self.min_attempt_time)
+            | self.retry_budget.stop_when_exhausted("get_transaction_status"),
+            wait=_retry_wait,
+            retry=retry_if_exception_type(BanescoAPIError),
+            reraise=True,
+        )
+        try:
+            return await retrying(self._hedged_attempt, transaction_id, previous)
+        finally:
+            banesco_api_attempts.labels(operation="get_transaction_status").observe(
+                retrying.statistics.get("attempt_number", 0)
+            )
+
+    async def _hedged_attempt(
+        self, transaction_id: str, previous: dict | None = None
+    ) -> dict:
+        """Make one attempt, hedged with a second request if Banesco is slow.
+
+        Without a hedger this is a plain attempt. With one, a hedge is sent
+        once the attempt outlasts the hedger's latency percentile, provided
+        the retry budget allows it; the hedge also takes a throttle token and
+        a concurrency slot, without waiting for either.
+        """
+        if self.hedger is None:
+            return await self._attempt_transaction_status(transaction_id, previous)
+
+        return await self.hedger.run(
+            lambda: self._attempt_transaction_status(transaction_id, previous),
+            hedge_fn=lambda: self._attempt_transaction_status(
+                transaction_id, previous, hedge=True
+            ),
+            allow_hedge=lambda: self.retry_budget.try_retry("hedge"),
+            is_final=lambda e: isinstance(e, BanescoNotFoundError),
+        )
+
+    async def _attempt_transaction_status(
+        self, transaction_id: str, previous: dict | None = None, hedge: bool = False
+    ) -> dict:
+        """Make one throttled, circuit-protected attempt to query Banesco.
+
+        The attempt picks the least-loaded healthy credential and takes a
+        token from that credential's throttle, then waits for a slot of the
+        adaptive concurrency limiter, then goes through the circuit breaker;
+        once it opens, the remaining attempts fail fast instead of waiting on
+        Banesco. Hedges do not wait for a token or a slot.
+        """
+        credential = self.credential_pool.acquire()
+        try:
+            return await self._attempt_with_credential(
+                transaction_id, previous, credential, hedge
+            )
+        finally:
+            self.credential_pool.release(credential)
+
+    async def _attempt_with_credential(
+        self,
+        transaction_id: str,
+        previous: dict | None,
+        credential: BanescoCredential,
+        hedge: bool,
+    ) -> dict:
+        """Make one attempt with a credential picked from the pool."""
+        throttle_wait = 0.0 if hedge else _wait_bound(credential.throttle.max_wait)
+        slot_wait = 0.0 if hedge else _wait_bound(self.concurrency_limiter.max_wait)
+        try:
+            await credential.throttle.acquire(timeout=throttle_wait)
+        except ThrottleTimeoutError as e:
+            logger.warning(
+                "Banesco client-side throttle rejected call",
+                transaction_id=transaction_id,
+                credential=credential.name,
+                retry_after=e.retry_after,
+            )
+            raise BanescoRateLimitError(
+                "Banesco client-side rate limit exceeded", retry_after=e.retry_after
+            ) from e
+
+        try:
+            return await self.concurrency_limiter.call(
+                lambda: self.circuit_breaker.call(
+                    lambda: self._request_transaction_status(
+                        transaction_id, previous, credential
+                    ),
+                    is_failure=_is_upstream_failure,
+                    is_neutral=_is_neutral_outcome,
+                ),
+                is_overload=_is_overload,
+                timeout=slot_wait,
+            )
+        except ConcurrencyLimitExceededError as e:
+            logger.warning(
+                "Banesco concurrency limit reached",
+                transaction_id=transaction_id,
+                limit=self.concurrency_limiter.limit,
+                queue_depth=self.concurrency_limiter.queue_depth,
+            )
+            raise BanescoRateLimitError("Banesco concurrency limit reached") from e
+        except CircuitOpenError as e:
+            logger.warning(
+                "Banesco circuit open, failing fast",
+                transaction_id=transaction_id,
+                retry_after=e.retry_after,
+            )
+            raise BanescoCircuitOpenError(e.retry_after) from e
+
+    async def _request_transaction_status(
+        self,
+        transaction_id: str,
+        previous: dict | None = None,
+        credential: BanescoCredential | None = None,
+    ) -> dict:
+        """Send a single transaction status request to Banesco.
+
+        A 304 Not Modified answer to a conditional request returns the
+        previous payload with its validators refreshed. 429 and 401 answers
+        count against the credential used; a 401 also drops its token.
+        """
+        credential = credential or self.credential_pool.credentials[0]
+        started_at: float | None = None
+        timeout = self.timeout
+        status = "error"
+        error_type: str | None = None
+        try:
+            headers = await self._get_headers(credential)
+            if previous is not None:
+                if previous.get("etag"):
+                    headers["If-None-Match"] = previous["etag"]
+                if previous.get("last_modified"):
+                    headers["If-Modified-Since"] = previous["last_modified"]
+            conditional = "If-None-Match" in headers or "If-Modified-Since" in headers
+
+            # httpx timeouts apply per phase; wait_for bounds the whole request
+            timeout = cap_timeout(self.timeout)
+            started_at = time.perf_counter()
+            response = await asyncio.wait_for(
+                self.client.get(
+                    f"{self.base_url}/transactions/{transaction_id}",
+                    headers=headers,
+                    timeout=timeout,
+                ),
+                timeout=remaining_time(),
+            )
+
+            if response.status_code == 429:
+                status = error_type = "rate_limited"
+                retry_after = parse_retry_after(
+                    response.headers.get("Retry-After"), self.max_retry_after
+                )
+                credential.throttle.on_rate_limited(retry_after)
+                self.credential_pool.record_rejection(credential, "rate_limited")
+                logger.warning(
+                    "Rate limited by Banesco",
+                    transaction_id=transaction_id,
+                    credential=credential.name,
+                    retry_after=retry_after,
+                )
+                raise BanescoRateLimitError(retry_after=retry_after)
+
+            if response.status_code == 401:
+                status = error_type = "unauthorized"
+                await credential.oauth_client.invalidate_token()
+                self.credential_pool.record_rejection(credential, "unauthorized")
+                logger.warning(
+                    "Banesco rejected access token",
+                    transaction_id=transaction_id,
+                    credential=credential.name,
+                )
+                raise BanescoAuthError(
+                    f"Banesco rejected the token of credential {credential.name}"
+                )
+
+            # Only a complete answer shows Banesco and the credential are fine
+            if response.is_success or response.status_code in (304, 404):
+                credential.throttle.on_success()
+                self.credential_pool.record_success(credential)
+
+            if response.status_code == 304 and conditional:
+                status = "not_modified"
+                banesco_conditional_requests_total.labels(result="not_modified").inc()
+                logger.info(
+                    "Banesco transaction not modified",
+                    transaction_id=transaction_id,
+                )
+                return {
+                    "payload": previous["payload"],
+                    "etag": response.headers.get("ETag") or previous.get("etag"),
+                    "last_modified": response.headers.get("Last-Modified")
+                    or previous.get("last_modified"),
+                }
+
+            if conditional:
+                banesco_conditional_requests_total.labels(result="modified").inc()
+
             if response.status_code == 200:
+                status = "success"
                 logger.info(
                     "Successfully retrieved transaction from Banesco",
                     transaction_id=transaction_id,
                 )
-                return response.json()
+                return self._response_entry(response)
 
             if response.status_code == 404:
+                status = "not_found"
                 logger.warning(
                     "Transaction not found in Banesco",
                     transaction_id=transaction_id,
                 )
                 raise BanescoNotFoundError(f"Transaction {transaction_id} not found")
 
-            if response.status_code == 429:
-                logger.warning(
-                    "Rate limited by Banesco",
-                    transaction_id=transaction_id,
-                )
-                raise BanescoRateLimitError("Banesco API rate limit exceeded")
-
             response.raise_for_status()
-            return response.json()
+            status = "success"
+            return self._response_entry(response)
 
         except httpx.TimeoutException as e:
+            status = error_type = "timeout"
             logger.error(
                 "Banesco API timeout",
                 transaction_id=transaction_id,
                 error=str(e),
             )
+            if timeout < self.timeout:
+                raise BanescoDeadlineExceededError(
+                    f"Deadline exceeded querying Banesco for {transaction_id}"
+                ) from e
             raise BanescoTimeoutError(
                 f"Timeout querying Banesco for transaction {transaction_id}"
             ) from e
 
-        except (BanescoNotFoundError, BanescoRateLimitError):
+        except (DeadlineExceededError, TimeoutError) as e:
+            if started_at is not None:
+                status = error_type = "deadline_exceeded"
+            logger.warning(
+                "Deadline exceeded querying Banesco",
+                transaction_id=transaction_id,
+            )
+            raise BanescoDeadlineExceededError(
+                f"Deadline exceeded querying Banesco for {transaction_id}"
+            ) from e
+
+        except (BanescoNotFoundError, BanescoRateLimitError, BanescoAuthError):
             raise
 
         except Exception as e:
+            error_type = classify_error(e)
             logger.error(
                 "Banesco API error",
                 transaction_id=transaction_id,
@@ -207,9 +1248,31 @@ class BanescoClient:
             )
             raise BanescoAPIError(f"Error querying Banesco API: {e}") from e
 
+        finally:
+            # Token acquisition is timed separately as ``oauth_token``
+            if started_at is not None:
+                duration = time.perf_counter() - started_at
+                record_api_call("get_transaction_status", status, duration, error_type)
+                if self.hedger is not None and status in ANSWERED_STATUSES:
+                    self.hedger.observe(duration)
+
+    @staticmethod
+    def _response_entry(response: httpx.Response) -> dict:
+        """Extract the payload and cache validators from a response."""
+        return {
+            "payload": response.json(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+
     async def close(self) -> None:
-        """Close HTTP client."""
-        await self.client.aclose()
+        """Cancel background revalidations and close HTTP client if owned."""
+        tasks = list(self._revalidations.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._owns_client:
+            await self.client.aclose()
 
     async def __aenter__(self) -> "BanescoClient":
         """Async context manager entry."""
@@ -0,0 +1,178 @@
+"""Pool of Banesco API credentials with per-credential health."""
+
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import structlog
+from prometheus_client import Counter, Gauge
+
+from infrastructure.resilience import AdaptiveTokenBucket
+
+if TYPE_CHECKING:
+    from infrastructure.external.banesco_client import BanescoOAuth2Client
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class BanescoCredential:
+    """One Banesco client credential and its own token and rate state."""
+
+    name: str
+    oauth_client: "BanescoOAuth2Client"
+    throttle: AdaptiveTokenBucket
+    in_flight: int = 0
+    consecutive_rejections: int = 0
+    ejected_until: float = 0.0
+
+    @property
+    def load(self) -> float:
+        """Calls in flight relative to the credential's current rate."""
+        return self.in_flight / max(self.throttle.rate, 1e-9)
+
+
+class BanescoCredentialPool:
+    """Spreads Banesco calls over several credentials.
+
+    Each call goes to the healthy credential with the lowest load, i.e.
+    calls in flight divided by its current throttle rate, so a credential
+    slowed down by 429s receives less traffic; ties go to the credential
+    with the fewest recent rejections. A credential answered with
+    ``eject_after`` consecutive 429 or 401 responses is ejected for
+    ``eject_duration`` seconds; when it comes back a single further rejection
+    ejects it again, while a success makes it fully healthy.
+    """
+
+    def __init__(
+        self,
+        credentials: Sequence[BanescoCredential],
+        eject_after: int = 3,
+        eject_duration: float = 60.0,
+        healthy_metric: Gauge | None = None,
+        in_flight_metric: Gauge | None = None,
+        ejections_metric: Counter | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize credential pool.
+
+        Args:
+            credentials: Credentials to spread calls over (at least one)
+            eject_after: Consecutive 429/401 answers that eject a credential
+            eject_duration: Seconds an ejected credential is left out
+            healthy_metric: Gauge with a ``credential`` label, 1 while the
+                credential is in rotation (optional)
+            in_flight_metric: Gauge with a ``credential`` label (optional)
+            ejections_metric: Counter with ``credential`` and ``reason``
+                labels (optional)
+            clock: Monotonic clock (for tests)
+
+        Raises:
+            ValueError: If no credentials are given
+        """
+        if not credentials:
+            raise ValueError("At least one Banesco credential is required")
+
+        self.credentials = list(credentials)
+        self.eject_after = eject_after
+        self.eject_duration = eject_duration
+        self.healthy_metric = healthy_metric
+        self.in_flight_metric = in_flight_metric
+        self.ejections_metric = ejections_metric
+        self.clock = clock
+        for credential in self.credentials:
+            self._export(credential)
+
+    def is_healthy(self, credential: BanescoCredential) -> bool:
+        """Check if a credential is in rotation."""
+        return self.clock() >= credential.ejected_until
+
+    def healthy(self) -> list[BanescoCredential]:
+        """Credentials currently in rotation."""
+        return [c for c in self.credentials if self.is_healthy(c)]
+
+    def acquire(self) -> BanescoCredential:
+        """Pick the least-loaded healthy credential for a call.
+
+        When every credential is ejected, the one whose ejection ends first
+        is used rather than failing the call outright.
+
+        Returns:
+            Credential to use; pass it to ``release`` when the call ends
+        """
+        candidates = self.healthy()
+        if candidates:
+            credential = min(
+                candidates, key=lambda c: (c.load, c.consecutive_rejections)
+            )
+        else:
+            credential = min(self.credentials, key=lambda c: c.ejected_until)
+            logger.warning(
+                "All Banesco credentials ejected, using the next to recover",
+                credential=credential.name,
+            )
+
+        credential.in_flight += 1
+        # Also refreshes the health of credentials whose ejection has ended
+        for candidate in self.credentials:
+            self._export(candidate)
+        return credential
+
+    def release(self, credential: BanescoCredential) -> None:
+        """Mark a call made with ``credential`` as finished."""
+        credential.in_flight -= 1
+        self._export(credential)
+
+    def record_success(self, credential: BanescoCredential) -> None:
+        """Reset the rejection streak after Banesco accepted the credential."""
+        credential.consecutive_rejections = 0
+        self._export(credential)
+
+    def record_rejection(self, credential: BanescoCredential, reason: str) -> None:
+        """Count a 429 or 401 answer, ejecting the credential if it keeps failing.
+
+        Args:
+            credential: Credential that was rejected
+            reason: ``rate_limited`` or ``unauthorized``
+        """
+        credential.consecutive_rejections += 1
+        if credential.consecutive_rejections < self.eject_after:
+            return
+        if not self.is_healthy(credential):
+            return
+
+        credential.ejected_until = self.clock() + self.eject_duration
+        if self.ejections_metric is not None:
+            self.ejections_metric.labels(
+                credential=credential.name, reason=reason
+            ).inc()
+        logger.warning(
+            "Ejected Banesco credential",
+            credential=credential.name,
+            reason=reason,
+            rejections=credential.consecutive_rejections,
+            duration=self.eject_duration,
+        )
+        self._export(credential)
+
+    def start_background_refresh(self) -> None:
+        """Start renewing every credential's token in the background."""
+        for credential in self.credentials:
+            credential.oauth_client.start_background_refresh()
+
+    async def close(self) -> None:
+        """Stop token renewal and close the OAuth clients."""
+        for credential in self.credentials:
+            await credential.oauth_client.close()
+
+    def _export(self, credential: BanescoCredential) -> None:
+        """Publish a credential's health and in-flight calls to the metrics."""
+        if self.healthy_metric is not None:
+            self.healthy_metric.labels(credential=credential.name).set(
+                1 if self.is_healthy(credential) else 0
+            )
+        if self.in_flight_metric is not None:
+            self.in_flight_metric.labels(credential=credential.name).set(
+                credential.in_flight
+            )
@@ -0,0 +1,63 @@
+"""Signature scheme of Banesco webhook notifications."""
+
+import hashlib
+import hmac
+import math
+import time
+
+
+def sign_webhook(secret: str, timestamp: str, body: bytes) -> str:
+    """Compute the signature of a webhook body.
+
+    The signature is the hex HMAC-SHA256, keyed with the shared secret, of
+    ``"{timestamp}."`` followed by the raw body, so a captured notification
+    cannot be replayed with a different timestamp.
+
+    Args:
+        secret: Shared webhook secret
+        timestamp: Unix time in seconds, as sent in the timestamp header
+        body: Raw request body
+
+    Returns:
+        Hex-encoded signature
+    """
+    message = timestamp.encode() + b"." + body
+    return hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+def verify_webhook(
+    secret: str,
+    timestamp: str | None,
+    body: bytes,
+    signature: str | None,
+    tolerance: float = 300,
+    now: float | None = None,
+) -> bool:
+    """Check a webhook's signature and that it is recent.
+
+    Args:
+        secret: Shared webhook secret (an empty secret rejects everything)
+        timestamp: Timestamp header value
+        body: Raw request body
+        signature: Signature header value
+        tolerance: Maximum age (or clock skew) of the timestamp in seconds
+        now: Current Unix time (for tests)
+
+    Returns:
+        True if the notification is authentic and fresh
+    """
+    if not secret or not timestamp or not signature:
+        return False
+
+    try:
+        sent_at = float(timestamp)
+    except ValueError:
+        return False
+    # "nan" and "inf" parse as floats but are never within the tolerance
+    if not math.isfinite(sent_at):
+        return False
+    if abs((time.time() if now is None else now) - sent_at) > tolerance:
+        return False
+
+    expected = sign_webhook(secret, timestamp, body)
+    return hmac.compare_digest(expected, signature.lower())
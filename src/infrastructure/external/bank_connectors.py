@@ -0,0 +1,298 @@
+"""Bank connectors and the registry that routes lookups to them."""
+
+import asyncio
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.services.rate_limit_service import RateLimitService
+from domain.entities.transaction import BankType
+from domain.services.bank_connector import BankHealth, BankStatusResult, IBankConnector
+from infrastructure.external.banesco_client import (
+    BanescoClient,
+    BanescoNotFoundError,
+    BanescoRateLimitError,
+)
+from infrastructure.external.http_transport import SharedHTTPTransport
+from infrastructure.monitoring.metrics import (
+    bank_connector_healthy,
+    bank_lookup_duration_seconds,
+    bank_lookups_total,
+)
+from infrastructure.rate_limit import RateLimitBackend
+from infrastructure.resilience import CircuitState, deadline_scope, remaining_time
+
+logger = structlog.get_logger()
+
+
+class UnsupportedBankError(Exception):
+    """No connector is registered for a bank."""
+
+    def __init__(self, bank: BankType) -> None:
+        self.bank = bank
+        super().__init__(f"No connector registered for bank {bank.value}")
+
+
+class BanescoConnector(IBankConnector):
+    """Bank connector backed by ``BanescoClient``.
+
+    The client brings its own credential pool, concurrency limiter and
+    circuit breaker; the connector owns the client and its transport.
+    With a ``session_factory``, every lookup that reaches Banesco counts
+    against the per-transaction limit, whoever the caller is; cached
+    results are free.
+    """
+
+    bank = BankType.BANESCO
+
+    def __init__(
+        self,
+        client: BanescoClient,
+        transport: SharedHTTPTransport | None = None,
+        session_factory: Callable[[], Any] | None = None,
+        banesco_rate_limit: int = 2,
+        rate_limit_backend: RateLimitBackend | None = None,
+    ) -> None:
+        """Initialize Banesco connector.
+
+        Args:
+            client: Banesco API client
+            transport: Connection pool of the client, closed with the connector
+            session_factory: Creates database sessions for rate limit
+                admission (no admission when None)
+            banesco_rate_limit: Max Banesco queries per minute per transaction
+            rate_limit_backend: Redis rate limit counters (optional)
+        """
+        self.client = client
+        self.transport = transport
+        self.session_factory = session_factory
+        self.banesco_rate_limit = banesco_rate_limit
+        self.rate_limit_backend = rate_limit_backend
+
+    async def get_transaction_status(self, transaction_id: str) -> BankStatusResult:
+        """Look up one transaction at Banesco."""
+        try:
+            cached = await self.client.get_cached_transaction_status(transaction_id)
+            if cached is not None:
+                return BankStatusResult(
+                    bank=self.bank, transaction_id=transaction_id, data=cached
+                )
+            if self.session_factory is not None:
+                async with self.session_factory() as session:
+                    decision = await self._rate_limit_service(session).try_acquire(
+                        "TRANSACTION_ID", transaction_id
+                    )
+                if not decision.allowed:
+                    raise BanescoRateLimitError(
+                        f"Rate limit exceeded for transaction {transaction_id}",
+                        retry_after=decision.retry_after,
+                    )
+            result = await self.client.get_transaction_status_result(transaction_id)
+        except BanescoNotFoundError:
+            return BankStatusResult(bank=self.bank, transaction_id=transaction_id)
+        except Exception as e:
+            return BankStatusResult(
+                bank=self.bank, transaction_id=transaction_id, error=e
+            )
+        return BankStatusResult(
+            bank=self.bank,
+            transaction_id=transaction_id,
+            data=result.data,
+            stale=result.stale,
+        )
+
+    async def get_transaction_statuses(
+        self, transaction_ids: Iterable[str], concurrency: int | None = None
+    ) -> dict[str, BankStatusResult]:
+        """Look up many transactions at Banesco."""
+        if self.session_factory is None:
+            results = await self.client.get_transaction_statuses(
+                transaction_ids, concurrency=concurrency
+            )
+        else:
+            async with self.session_factory() as session:
+                results = await self.client.get_transaction_statuses(
+                    transaction_ids,
+                    rate_limit_service=self._rate_limit_service(session),
+                    concurrency=concurrency,
+                )
+        return {
+            transaction_id: BankStatusResult(
+                bank=self.bank,
+                transaction_id=transaction_id,
+                data=result.data,
+                error=(
+                    None
+                    if isinstance(result.error, BanescoNotFoundError)
+                    else result.error
+                ),
+                stale=result.stale,
+            )
+            for transaction_id, result in results.items()
+        }
+
+    async def health_check(self) -> BankHealth:
+        """Healthy while the circuit is not open and a credential is usable."""
+        circuit = self.client.circuit_breaker.state
+        credentials = len(self.client.credential_pool.healthy())
+        return BankHealth(
+            bank=self.bank,
+            healthy=circuit != CircuitState.OPEN and credentials > 0,
+            details={
+                "circuit": circuit.value,
+                "healthy_credentials": credentials,
+                "concurrency_limit": int(self.client.concurrency_limiter.limit),
+                "in_flight": self.client.concurrency_limiter.in_flight,
+            },
+        )
+
+    async def close(self) -> None:
+        """Close the client, its credentials and its connection pool."""
+        await self.client.credential_pool.close()
+        await self.client.close()
+        if self.transport is not None:
+            await self.transport.close()
+
+    def _rate_limit_service(self, session: AsyncSession) -> RateLimitService:
+        """Per-transaction limiter committing each admission at once."""
+        return RateLimitService(
+            session,
+            banesco_rate_limit=self.banesco_rate_limit,
+            redis_backend=self.rate_limit_backend,
+            autocommit=True,
+        )
+
+
+class BankConnectorRegistry:
+    """Routes transaction lookups to the connector of each bank.
+
+    Every lookup is bounded by ``timeout`` and recorded per bank in the
+    ``bank_lookups_total`` and ``bank_lookup_duration_seconds`` metrics.
+    Fan-out lookups query several banks concurrently and return whatever
+    each bank answered in time, so a slow bank delays nobody else past
+    its own timeout.
+    """
+
+    def __init__(
+        self, connectors: Iterable[IBankConnector], timeout: float = 10.0
+    ) -> None:
+        """Initialize registry.
+
+        Args:
+            connectors: One connector per bank
+            timeout: Seconds a single bank lookup may take
+
+        Raises:
+            ValueError: If two connectors serve the same bank
+        """
+        self.connectors: dict[BankType, IBankConnector] = {}
+        for connector in connectors:
+            if connector.bank in self.connectors:
+                raise ValueError(f"Duplicate connector for bank {connector.bank.value}")
+            self.connectors[connector.bank] = connector
+        self.timeout = timeout
+
+    @property
+    def banks(self) -> list[BankType]:
+        """Banks with a registered connector."""
+        return list(self.connectors)
+
+    def get(self, bank: BankType) -> IBankConnector:
+        """Get the connector of a bank.
+
+        Raises:
+            UnsupportedBankError: If the bank has no connector
+        """
+        try:
+            return self.connectors[bank]
+        except KeyError:
+            raise UnsupportedBankError(bank) from None
+
+    async def lookup(self, bank: BankType, transaction_id: str) -> BankStatusResult:
+        """Look up a transaction at one bank within the lookup timeout.
+
+        Raises:
+            UnsupportedBankError: If the bank has no connector
+        """
+        connector = self.get(bank)
+        started_at = time.perf_counter()
+        with deadline_scope(self.timeout):
+            try:
+                result = await asyncio.wait_for(
+                    connector.get_transaction_status(transaction_id),
+                    timeout=remaining_time(),
+                )
+            except TimeoutError:
+                result = BankStatusResult(
+                    bank=bank,
+                    transaction_id=transaction_id,
+                    error=TimeoutError(f"{bank.value} did not answer in time"),
+                )
+
+        bank_lookup_duration_seconds.labels(bank=bank.value).observe(
+            time.perf_counter() - started_at
+        )
+        bank_lookups_total.labels(bank=bank.value, result=self._outcome(result)).inc()
+        return result
+
+    async def fan_out(
+        self, transaction_id: str, banks: Iterable[BankType] | None = None
+    ) -> dict[BankType, BankStatusResult]:
+        """Look up a transaction at several banks concurrently.
+
+        Args:
+            transaction_id: Transaction ID or reference to look up
+            banks: Banks to query (defaults to every registered bank)
+
+        Returns:
+            Result of each bank, in the order the banks were given
+
+        Raises:
+            UnsupportedBankError: If a requested bank has no connector
+        """
+        targets = list(dict.fromkeys(banks)) if banks is not None else self.banks
+        for bank in targets:
+            self.get(bank)
+
+        results = await asyncio.gather(
+            *(self.lookup(bank, transaction_id) for bank in targets)
+        )
+        return dict(zip(targets, results, strict=True))
+
+    async def health(self) -> list[BankHealth]:
+        """Check every connector and publish the result."""
+        reports = []
+        for bank, connector in self.connectors.items():
+            try:
+                report = await connector.health_check()
+            except Exception as e:
+                report = BankHealth(bank=bank, healthy=False, details={"error": str(e)})
+            bank_connector_healthy.labels(bank=bank.value).set(
+                1 if report.healthy else 0
+            )
+            reports.append(report)
+        return reports
+
+    async def close(self) -> None:
+        """Close every connector."""
+        for bank, connector in self.connectors.items():
+            try:
+                await connector.close()
+            except Exception as e:
+                logger.warning(
+                    "Failed to close bank connector", bank=bank.value, error=str(e)
+                )
+
+    @staticmethod
+    def _outcome(result: BankStatusResult) -> str:
+        """Metric label for a lookup result."""
+        if isinstance(result.error, TimeoutError):
+            return "timeout"
+        if not result.ok:
+            return "error"
+        if result.stale:
+            return "stale"
+        return "found" if result.found else "not_found"
@@ -0,0 +1,426 @@
+"""Record and replay of outbound HTTP traffic ("cassettes").
+
+A recording transport captures every request and response exchanged with
+Banesco, with credentials redacted, into a gzip-compressed JSON Lines file.
+A replay transport answers from such a file with the recorded latencies
+(optionally scaled), so load tests can reproduce production upstream
+behavior and compare retry, caching and concurrency settings without a
+live bank connection.
+"""
+
+import asyncio
+import base64
+import gzip
+import json
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+import structlog
+
+if TYPE_CHECKING:
+    from infrastructure.external.banesco_client import BanescoClient
+
+logger = structlog.get_logger()
+
+CASSETTE_VERSION = 1
+REDACTED = "[REDACTED]"
+REDACTED_HEADERS = frozenset({"authorization", "cookie", "set-cookie", "x-api-key"})
+REDACTED_FIELDS = frozenset(
+    {"client_id", "client_secret", "password", "access_token", "refresh_token"}
+)
+# Bodies are stored decoded, so encoding and framing headers no longer apply
+_DROPPED_RESPONSE_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding", "connection"}
+)
+
+
+class CassetteMissError(httpx.TransportError):
+    """Replayed request has no recorded counterpart.
+
+    It is a transport error so clients handle it like a failed connection.
+    """
+
+    pass
+
+
+@dataclass
+class CassetteEntry:
+    """One recorded request and its response, or the error it failed with."""
+
+    method: str
+    url: str
+    status_code: int  # 0 when the request failed without a response
+    offset: float  # Seconds from the start of the recording to the request
+    duration: float  # Seconds until the response body was read
+    request_headers: dict[str, str] = field(default_factory=dict)
+    request_body: str | None = None
+    response_headers: dict[str, str] = field(default_factory=dict)
+    response_body: str = ""
+    response_body_base64: bool = False
+    error: str | None = None  # httpx exception class name of a failed request
+
+    @property
+    def key(self) -> tuple[str, str]:
+        """Method and path used to match replayed requests."""
+        return self.method, urlsplit(self.url).path
+
+    def response_content(self) -> bytes:
+        """Recorded response body as bytes."""
+        if self.response_body_base64:
+            return base64.b64decode(self.response_body)
+        return self.response_body.encode()
+
+
+def redact_headers(headers: Iterable[tuple[str, str]]) -> dict[str, str]:
+    """Copy headers, masking credentials."""
+    return {
+        name: REDACTED if name.lower() in REDACTED_HEADERS else value
+        for name, value in headers
+    }
+
+
+def redact_url(url: str) -> str:
+    """Copy a URL, masking credentials in its query string."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    fields = parse_qsl(parts.query, keep_blank_values=True)
+    query = urlencode([(k, REDACTED if k in REDACTED_FIELDS else v) for k, v in fields])
+    return urlunsplit(parts._replace(query=query))
+
+
+def redact_body(content: bytes, content_type: str) -> tuple[str, bool]:
+    """Mask credentials in a JSON or form body.
+
+    Returns:
+        Body as text (base64 for binary bodies) and whether it is base64
+    """
+    try:
+        text = content.decode()
+    except UnicodeDecodeError:
+        return base64.b64encode(content).decode(), True
+
+    if "json" in content_type:
+        try:
+            return json.dumps(_redact_json(json.loads(text))), False
+        except ValueError:
+            return text, False
+    if "x-www-form-urlencoded" in content_type:
+        fields = parse_qsl(text, keep_blank_values=True)
+        return urlencode(
+            [(k, REDACTED if k in REDACTED_FIELDS else v) for k, v in fields]
+        ), False
+    return text, False
+
+
+def _redact_json(value: object) -> object:
+    """Mask credential fields anywhere in a JSON document."""
+    if isinstance(value, dict):
+        return {
+            k: REDACTED if k in REDACTED_FIELDS else _redact_json(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact_json(v) for v in value]
+    return value
+
+
+def load_cassette(path: str | Path) -> list[CassetteEntry]:
+    """Read the entries of a cassette file, in recording order."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {header.get('version')}")
+        return [CassetteEntry(**json.loads(line)) for line in f if line.strip()]
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """httpx transport that forwards requests and records the exchanges.
+
+    Failed requests (timeouts, refused connections) are recorded with
+    their exception and how long they took to fail, then re-raised.
+    HEAD requests, which only warm up connections, are forwarded without
+    being recorded.
+
+    Entries are appended to the cassette file as they complete, each as
+    its own gzip member opened and closed around the write, so the
+    transport holds no file handle and a recording interrupted by a crash
+    keeps every entry it captured. The file is created on the first
+    write (or on ``aclose`` if nothing was recorded). Compression and file
+    writes run in a worker thread, one entry at a time, so they never
+    block the event loop.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        transport: httpx.AsyncBaseTransport | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize recording transport.
+
+        Args:
+            path: Cassette file to write (gzip JSON Lines, overwritten)
+            transport: Transport that performs the real requests
+            clock: Monotonic clock (for tests)
+        """
+        self.path = Path(path)
+        self.transport = transport or httpx.AsyncHTTPTransport()
+        self.clock = clock
+        self.entries = 0
+        self._started_at = clock()
+        self._write_lock = asyncio.Lock()
+        self._header: dict | None = {
+            "version": CASSETTE_VERSION,
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Forward a request and record it with its response."""
+        if request.method == "HEAD":
+            return await self.transport.handle_async_request(request)
+
+        request_body = await request.aread()
+        started_at = self.clock()
+        try:
+            response = await self.transport.handle_async_request(request)
+            try:
+                # Decoded body, so replays do not depend on the content encoding
+                content = await response.aread()
+            finally:
+                await response.aclose()
+        except httpx.TransportError as e:
+            await self._record(
+                CassetteEntry(
+                    method=request.method,
+                    url=redact_url(str(request.url)),
+                    status_code=0,
+                    offset=round(started_at - self._started_at, 6),
+                    duration=round(self.clock() - started_at, 6),
+                    request_headers=redact_headers(request.headers.items()),
+                    request_body=self._redact_request_body(request, request_body),
+                    error=type(e).__name__,
+                )
+            )
+            raise
+        duration = self.clock() - started_at
+
+        headers = [
+            (k, v)
+            for k, v in response.headers.items()
+            if k.lower() not in _DROPPED_RESPONSE_HEADERS
+        ]
+        response_body, is_base64 = redact_body(
+            content, response.headers.get("content-type", "")
+        )
+        entry = CassetteEntry(
+            method=request.method,
+            url=redact_url(str(request.url)),
+            status_code=response.status_code,
+            offset=round(started_at - self._started_at, 6),
+            duration=round(duration, 6),
+            request_headers=redact_headers(request.headers.items()),
+            request_body=self._redact_request_body(request, request_body),
+            response_headers=redact_headers(headers),
+            response_body=response_body,
+            response_body_base64=is_base64,
+        )
+        await self._record(entry)
+
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=content,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        """Finish the cassette file and close the wrapped transport."""
+        async with self._write_lock:
+            if self._header is not None:
+                # An empty recording still leaves a loadable cassette
+                await asyncio.to_thread(self._write)
+            logger.info(
+                "Closed HTTP cassette", path=str(self.path), entries=self.entries
+            )
+        await self.transport.aclose()
+
+    async def _record(self, entry: CassetteEntry) -> None:
+        """Append an entry to the cassette."""
+        async with self._write_lock:
+            await asyncio.to_thread(self._write, asdict(entry))
+            self.entries += 1
+
+    @staticmethod
+    def _redact_request_body(request: httpx.Request, body: bytes) -> str | None:
+        """Request body as stored in the cassette, if it has one."""
+        if not body:
+            return None
+        return redact_body(body, request.headers.get("content-type", ""))[0]
+
+    def _write(self, *records: dict) -> None:
+        """Append JSON lines, creating the file with its header first."""
+        mode = "at"
+        if self._header is not None:
+            records = (self._header, *records)
+            mode = "wt"
+        lines = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records)
+        with gzip.open(self.path, mode, encoding="utf-8") as f:
+            f.write(lines)
+        self._header = None
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """httpx transport that answers requests from a cassette.
+
+    Requests are matched on method and URL path; repeated requests to the
+    same path get the recorded responses in recording order, starting
+    over when ``loop`` is set and they run out. Each answer is delayed by
+    its recorded duration multiplied by ``time_scale`` (``1`` replays the
+    original latency, ``0.1`` ten times faster, ``0`` without waiting).
+    Recorded failures raise the same httpx exception after that delay.
+    """
+
+    def __init__(
+        self,
+        entries: list[CassetteEntry],
+        time_scale: float = 1.0,
+        loop: bool = True,
+        sleep: Callable[[float], Any] = asyncio.sleep,
+    ) -> None:
+        """Initialize replay transport.
+
+        Args:
+            entries: Recorded exchanges (see ``load_cassette``)
+            time_scale: Factor applied to the recorded latencies
+            loop: Restart a path's responses when they are used up
+            sleep: Async sleep function (for tests)
+        """
+        self.entries = entries
+        self.time_scale = time_scale
+        self.loop = loop
+        self.sleep = sleep
+        self.served = 0
+        self._recorded: dict[tuple[str, str], list[CassetteEntry]] = defaultdict(list)
+        for entry in entries:
+            self._recorded[entry.key].append(entry)
+        self._pending = {key: deque(items) for key, items in self._recorded.items()}
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str | Path,
+        time_scale: float = 1.0,
+        loop: bool = True,
+        sleep: Callable[[float], Any] = asyncio.sleep,
+    ) -> "ReplayTransport":
+        """Create a replay transport from a cassette file."""
+        return cls(load_cassette(path), time_scale=time_scale, loop=loop, sleep=sleep)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request with its next recorded response."""
+        entry = self._next_entry((request.method, request.url.path))
+        if self.time_scale > 0:
+            await self.sleep(entry.duration * self.time_scale)
+        self.served += 1
+        if entry.error is not None:
+            raise _replayed_error(entry, request)
+        return httpx.Response(
+            entry.status_code,
+            headers=entry.response_headers,
+            content=entry.response_content(),
+            request=request,
+        )
+
+    def _next_entry(self, key: tuple[str, str]) -> CassetteEntry:
+        """Take the next recorded exchange for a method and path."""
+        pending = self._pending.get(key)
+        if pending is None:
+            raise CassetteMissError(f"No recorded response for {key[0]} {key[1]}")
+        if not pending:
+            if not self.loop:
+                raise CassetteMissError(
+                    f"Recorded responses for {key[0]} {key[1]} used up"
+                )
+            pending.extend(self._recorded[key])
+        return pending.popleft()
+
+
+def _replayed_error(entry: CassetteEntry, request: httpx.Request) -> Exception:
+    """Rebuild the httpx exception a recorded request failed with."""
+    error_class = getattr(httpx, entry.error or "", None)
+    if not (
+        isinstance(error_class, type) and issubclass(error_class, httpx.TransportError)
+    ):
+        error_class = httpx.TransportError
+    return error_class(
+        f"Recorded {entry.error} for {entry.method} {urlsplit(entry.url).path}",
+        request=request,
+    )
+
+
+@dataclass
+class ReplayedLookup:
+    """Outcome of one replayed status lookup."""
+
+    transaction_id: str
+    latency: float
+    outcome: str  # success, stale or the error class name
+
+
+async def replay_status_lookups(
+    client: "BanescoClient",
+    entries: list[CassetteEntry],
+    time_scale: float = 1.0,
+    sleep: Callable[[float], Any] = asyncio.sleep,
+) -> list[ReplayedLookup]:
+    """Issue the recorded status lookups through a client, on their schedule.
+
+    Each ``GET .../transactions/{id}`` of the cassette becomes a
+    ``get_transaction_status_result`` call started at its recorded offset
+    times ``time_scale``, so the original arrival pattern (bursts included)
+    hits the client with whatever retry, caching and concurrency settings
+    it was built with. Point the client at a ``ReplayTransport`` to
+    reproduce the upstream latencies too.
+
+    Args:
+        client: Banesco client under test
+        entries: Recorded exchanges (see ``load_cassette``)
+        time_scale: Factor applied to the recorded offsets
+        sleep: Async sleep function (for tests)
+
+    Returns:
+        One result per replayed lookup, in schedule order
+    """
+    lookups = [
+        entry
+        for entry in entries
+        if entry.method == "GET" and "/transactions/" in urlsplit(entry.url).path
+    ]
+    if not lookups:
+        return []
+    first_offset = lookups[0].offset
+
+    async def lookup(entry: CassetteEntry) -> ReplayedLookup:
+        await sleep((entry.offset - first_offset) * time_scale)
+        transaction_id = urlsplit(entry.url).path.rsplit("/", 1)[-1]
+        started_at = time.perf_counter()
+        try:
+            result = await client.get_transaction_status_result(transaction_id)
+            outcome = "stale" if result.stale else "success"
+        except Exception as e:
+            outcome = type(e).__name__
+        return ReplayedLookup(
+            transaction_id=transaction_id,
+            latency=time.perf_counter() - started_at,
+            outcome=outcome,
+        )
+
+    return list(await asyncio.gather(*(lookup(entry) for entry in lookups)))
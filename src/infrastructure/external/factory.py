@@ -0,0 +1,269 @@
+"""Factories for application-scoped external service clients."""
+
+import importlib.util
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+from infrastructure.cache.redis_cache import CacheService
+from infrastructure.config.settings import settings
+from infrastructure.external.banesco_client import BanescoClient, BanescoOAuth2Client
+from infrastructure.external.banesco_credentials import (
+    BanescoCredential,
+    BanescoCredentialPool,
+)
+from infrastructure.external.bank_connectors import (
+    BanescoConnector,
+    BankConnectorRegistry,
+)
+from infrastructure.external.cassette import RecordingTransport, ReplayTransport
+from infrastructure.external.http_transport import SharedHTTPTransport
+from infrastructure.monitoring.metrics import (
+    banesco_circuit_breaker_state,
+    banesco_concurrency_in_flight,
+    banesco_concurrency_limit,
+    banesco_concurrency_queue_depth,
+    banesco_credential_ejections_total,
+    banesco_credential_healthy,
+    banesco_credential_in_flight,
+    banesco_credential_throttle_rate,
+    banesco_hedged_requests_total,
+    banesco_retries_total,
+    banesco_throttle_rate,
+    banesco_throttle_tokens_total,
+    banesco_throttle_wait_seconds,
+)
+from infrastructure.rate_limit import RateLimitBackend
+from infrastructure.resilience import (
+    AdaptiveTokenBucket,
+    AIMDConcurrencyLimiter,
+    CircuitBreaker,
+    Hedger,
+    RetryBudget,
+)
+
+
+def create_banesco_transport() -> SharedHTTPTransport:
+    """Create the pooled HTTP transport shared by all Banesco clients."""
+    return SharedHTTPTransport(
+        timeout=settings.banesco_timeout,
+        max_connections=settings.banesco_max_connections,
+        max_keepalive_connections=settings.banesco_max_keepalive_connections,
+        keepalive_expiry=settings.banesco_keepalive_expiry,
+        http2=settings.banesco_http2,
+        transport=create_cassette_transport(),
+    )
+
+
+def create_cassette_transport() -> httpx.AsyncBaseTransport | None:
+    """Create the record or replay transport selected by the settings.
+
+    Returns:
+        Transport for ``banesco_cassette_mode``, or None to talk to Banesco
+        directly
+
+    Raises:
+        ValueError: If the cassette mode is unknown
+    """
+    mode = settings.banesco_cassette_mode.lower()
+    if not mode:
+        return None
+    if mode == "replay":
+        return ReplayTransport.from_file(
+            settings.banesco_cassette_path,
+            time_scale=settings.banesco_cassette_time_scale,
+        )
+    if mode == "record":
+        # A custom transport replaces the client's own, so it needs the pool limits
+        http2 = settings.banesco_http2 and importlib.util.find_spec("h2") is not None
+        return RecordingTransport(
+            settings.banesco_cassette_path,
+            transport=httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=settings.banesco_max_connections,
+                    max_keepalive_connections=settings.banesco_max_keepalive_connections,
+                    keepalive_expiry=settings.banesco_keepalive_expiry,
+                ),
+                http2=http2,
+            ),
+        )
+    raise ValueError(f"Unknown Banesco cassette mode: {mode}")
+
+
+def create_banesco_client(
+    transport: SharedHTTPTransport, cache: CacheService | None = None
+) -> BanescoClient:
+    """Create a Banesco API client bound to the shared transport.
+
+    Args:
+        transport: Application-scoped HTTP transport
+        cache: Redis cache used to share state across workers (optional)
+
+    Returns:
+        Configured Banesco client
+    """
+    # One budget for status lookups and token refreshes alike
+    retry_budget = RetryBudget(
+        ratio=settings.banesco_retry_budget_ratio,
+        min_retries_per_second=settings.banesco_retry_budget_min_per_second,
+        metric=banesco_retries_total,
+    )
+    credential_pool = create_banesco_credential_pool(transport, retry_budget, cache)
+    circuit_breaker = CircuitBreaker(
+        name="banesco",
+        failure_rate_threshold=settings.banesco_circuit_failure_rate,
+        slow_call_rate_threshold=settings.banesco_circuit_slow_call_rate,
+        slow_call_duration=settings.banesco_circuit_slow_call_duration,
+        minimum_calls=settings.banesco_circuit_minimum_calls,
+        window_size=settings.banesco_circuit_window_size,
+        open_duration=settings.banesco_circuit_open_duration,
+        metric=banesco_circuit_breaker_state,
+    )
+    concurrency_limiter = AIMDConcurrencyLimiter(
+        initial_limit=settings.banesco_concurrency_initial_limit,
+        min_limit=settings.banesco_concurrency_min_limit,
+        max_limit=settings.banesco_concurrency_max_limit,
+        latency_target=settings.banesco_concurrency_latency_target,
+        max_queue=settings.banesco_concurrency_max_queue,
+        max_wait=settings.banesco_concurrency_max_wait,
+        limit_metric=banesco_concurrency_limit,
+        queue_metric=banesco_concurrency_queue_depth,
+        in_flight_metric=banesco_concurrency_in_flight,
+    )
+    hedger = None
+    if settings.banesco_hedging_enabled:
+        hedger = Hedger(
+            quantile=settings.banesco_hedge_quantile,
+            min_delay=settings.banesco_hedge_min_delay,
+            min_samples=settings.banesco_hedge_min_samples,
+            metric=banesco_hedged_requests_total,
+        )
+    return BanescoClient(
+        base_url=settings.banesco_api_url,
+        timeout=settings.banesco_timeout,
+        http_client=transport.client,
+        batch_concurrency=settings.banesco_batch_concurrency,
+        circuit_breaker=circuit_breaker,
+        concurrency_limiter=concurrency_limiter,
+        hedger=hedger,
+        cache=cache,
+        cache_terminal_ttl=settings.banesco_cache_terminal_ttl,
+        cache_pending_ttl=settings.banesco_cache_pending_ttl,
+        cache_not_found_ttl=settings.banesco_cache_not_found_ttl,
+        stale_if_error_ttl=settings.banesco_stale_if_error_ttl,
+        stale_revalidate_delay=settings.banesco_stale_revalidate_delay,
+        min_attempt_time=settings.banesco_min_attempt_time,
+        retry_budget=retry_budget,
+        credential_pool=credential_pool,
+        shared_call_timeout=settings.banesco_request_deadline,
+        max_retry_after=settings.banesco_max_retry_after,
+    )
+
+
+def create_banesco_credential_pool(
+    transport: SharedHTTPTransport,
+    retry_budget: RetryBudget,
+    cache: CacheService | None = None,
+) -> BanescoCredentialPool:
+    """Create the pool of Banesco credentials.
+
+    The configured client ID comes first, followed by every entry of
+    ``banesco_additional_credentials``. Each credential gets its own OAuth
+    client and throttle, so the throttle settings apply per credential.
+
+    Args:
+        transport: Application-scoped HTTP transport
+        retry_budget: Retry budget shared with status lookups
+        cache: Redis cache used to share tokens across workers (optional)
+
+    Returns:
+        Credential pool
+
+    Raises:
+        ValueError: If an additional credential is not ``client_id:client_secret``
+    """
+    pairs = [(settings.banesco_client_id, settings.banesco_client_secret)]
+    for entry in settings.banesco_additional_credentials:
+        client_id, separator, client_secret = entry.partition(":")
+        if not separator or not client_id:
+            raise ValueError("Banesco credentials must be 'client_id:client_secret'")
+        pairs.append((client_id, client_secret))
+
+    credentials = []
+    for client_id, client_secret in pairs:
+        oauth_client = BanescoOAuth2Client(
+            auth_url=settings.banesco_auth_url,
+            client_id=client_id,
+            client_secret=client_secret,
+            http_client=transport.client,
+            refresh_ahead=settings.banesco_token_refresh_ahead,
+            refresh_jitter=settings.banesco_token_refresh_jitter,
+            cache=cache,
+            min_attempt_time=settings.banesco_min_attempt_time,
+            retry_budget=retry_budget,
+        )
+        # A single credential keeps reporting on the unlabeled throttle gauge
+        rate_metric = (
+            banesco_throttle_rate
+            if len(pairs) == 1
+            else banesco_credential_throttle_rate.labels(credential=client_id)
+        )
+        throttle = AdaptiveTokenBucket(
+            rate=settings.banesco_throttle_rate,
+            burst=settings.banesco_throttle_burst,
+            min_rate=settings.banesco_throttle_min_rate,
+            max_waiters=settings.banesco_throttle_max_waiters,
+            max_wait=settings.banesco_throttle_max_wait,
+            tokens_metric=banesco_throttle_tokens_total,
+            wait_metric=banesco_throttle_wait_seconds,
+            rate_metric=rate_metric,
+        )
+        credentials.append(
+            BanescoCredential(
+                name=client_id, oauth_client=oauth_client, throttle=throttle
+            )
+        )
+
+    return BanescoCredentialPool(
+        credentials,
+        eject_after=settings.banesco_credential_eject_after,
+        eject_duration=settings.banesco_credential_eject_duration,
+        healthy_metric=banesco_credential_healthy,
+        in_flight_metric=banesco_credential_in_flight,
+        ejections_metric=banesco_credential_ejections_total,
+    )
+
+
+def create_bank_connectors(
+    banesco_client: BanescoClient,
+    banesco_transport: SharedHTTPTransport,
+    session_factory: Callable[[], Any] | None = None,
+    rate_limit_backend: RateLimitBackend | None = None,
+) -> BankConnectorRegistry:
+    """Create the registry of bank connectors.
+
+    Each bank keeps its own connection pool, concurrency limiter and
+    circuit breaker; Banesco's are the ones of ``banesco_client``.
+
+    Args:
+        banesco_client: Application-scoped Banesco client
+        banesco_transport: Connection pool of the Banesco client
+        session_factory: Creates database sessions for Banesco rate limiting
+        rate_limit_backend: Redis rate limit counters (optional)
+
+    Returns:
+        Registry with a connector per integrated bank
+    """
+    return BankConnectorRegistry(
+        [
+            BanescoConnector(
+                banesco_client,
+                banesco_transport,
+                session_factory=session_factory,
+                banesco_rate_limit=settings.banesco_rate_limit,
+                rate_limit_backend=rate_limit_backend,
+            )
+        ],
+        timeout=settings.bank_lookup_timeout,
+    )
@@ -0,0 +1,120 @@
+"""Shared, pooled HTTP transport for outbound integrations."""
+
+import asyncio
+import importlib.util
+from urllib.parse import urlsplit
+
+import httpx
+import structlog
+
+logger = structlog.get_logger()
+
+
+class SharedHTTPTransport:
+    """Application-scoped HTTP client with keep-alive connection pooling.
+
+    One instance is created at startup and its ``client`` is handed to every
+    Banesco client, so token refreshes and API calls reuse warm connections
+    instead of paying DNS, TCP and TLS setup on each request.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize shared transport.
+
+        Args:
+            timeout: Default request timeout in seconds
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum idle connections kept open
+            keepalive_expiry: Seconds an idle connection is kept alive
+            http2: Enable HTTP/2 (requires the optional ``h2`` package)
+            transport: Custom httpx transport (e.g. for tests)
+        """
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+            http2 = False
+
+        self.http2 = http2
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            transport=transport,
+        )
+
+    async def warm_up(
+        self,
+        urls: list[str],
+        connections_per_host: int = 1,
+        timeout: float = 5.0,
+    ) -> int:
+        """Pre-open keep-alive connections to the hosts of the given URLs.
+
+        Failures are logged and ignored; warm-up must never block startup.
+
+        Args:
+            urls: URLs whose origins should be warmed
+            connections_per_host: Number of concurrent connections to open per host
+            timeout: Timeout for each warm-up request in seconds
+
+        Returns:
+            Number of successful warm-up requests
+        """
+        origins = set()
+        for url in urls:
+            parts = urlsplit(url)
+            if parts.scheme and parts.netloc:
+                origins.add(f"{parts.scheme}://{parts.netloc}")
+
+        results = await asyncio.gather(
+            *(
+                self._probe(origin, timeout)
+                for origin in origins
+                for _ in range(connections_per_host)
+            )
+        )
+        warmed = sum(results)
+
+        logger.info(
+            "Warmed up outbound HTTP connections",
+            hosts=sorted(origins),
+            connections=warmed,
+        )
+        return warmed
+
+    async def _probe(self, origin: str, timeout: float) -> bool:
+        """Open a connection to the given origin with a lightweight request."""
+        try:
+            await self.client.head(origin, timeout=timeout)
+            return True
+        except httpx.HTTPError as e:
+            logger.warning("Connection warm-up failed", origin=origin, error=str(e))
+            return False
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "SharedHTTPTransport":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Async context manager exit."""
+        await self.close()
@@ -29,6 +29,24 @@ transactions_total = Counter(
     ["status", "bank", "transaction_type"],
 )
 
+transaction_reconciliations_total = Counter(
+    "transaction_reconciliations_total",
+    "In-progress transactions checked against the bank in the background",
+    ["result"],  # updated, superseded, pending, failed
+)
+
+banesco_webhook_notifications_total = Counter(
+    "banesco_webhook_notifications_total",
+    "Banesco webhook notifications by outcome",
+    ["result"],  # rejected, dropped, applied, duplicate, ignored, failed
+)
+
+banesco_webhook_batch_size = Histogram(
+    "banesco_webhook_batch_size",
+    "Notifications applied per webhook batch",
+    buckets=[1, 5, 10, 25, 50, 100, 200, 500],
+)
+
 transactions_in_progress = Gauge(
     "transactions_in_progress",
     "Number of transactions currently in progress",
@@ -52,7 +70,7 @@ banesco_api_duration_seconds = Histogram(
     "banesco_api_duration_seconds",
     "Banesco API call duration",
     ["operation"],
-    buckets=(0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0),
+    buckets=(0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0),
 )
 
 banesco_api_errors_total = Counter(
@@ -61,12 +79,163 @@ banesco_api_errors_total = Counter(
     ["error_type"],
 )
 
+banesco_api_attempts = Histogram(
+    "banesco_api_attempts",
+    "Attempts made per Banesco operation, including retries",
+    ["operation"],
+    buckets=(1, 2, 3, 4, 5),
+)
+
+banesco_retries_total = Counter(
+    "banesco_retries_total",
+    "Banesco retries by retry budget decision",
+    ["operation", "result"],  # result: allowed, refused
+)
+
+banesco_hedged_requests_total = Counter(
+    "banesco_hedged_requests_total",
+    "Hedge requests sent to Banesco and how many answered first",
+    ["result"],  # sent, won
+)
+
+banesco_token_refresh_duration_seconds = Histogram(
+    "banesco_token_refresh_duration_seconds",
+    "Time to obtain a Banesco OAuth token, including shared-cache coordination",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0),
+)
+
+banesco_singleflight_calls_total = Counter(
+    "banesco_singleflight_calls_total",
+    "Banesco status lookups by single-flight role",
+    ["role"],  # leader, coalesced
+)
+
+banesco_circuit_breaker_state = Gauge(
+    "banesco_circuit_breaker_state",
+    "Banesco circuit breaker state (0=closed, 1=half-open, 2=open)",
+    ["name"],
+)
+
+banesco_throttle_tokens_total = Counter(
+    "banesco_throttle_tokens_total",
+    "Tokens taken from the Banesco client-side throttle",
+)
+
+banesco_throttle_wait_seconds = Histogram(
+    "banesco_throttle_wait_seconds",
+    "Time spent waiting for a Banesco throttle token",
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+banesco_throttle_rate = Gauge(
+    "banesco_throttle_rate",
+    "Current Banesco client-side throttle rate (calls per second)",
+)
+
+banesco_concurrency_limit = Gauge(
+    "banesco_concurrency_limit",
+    "Current adaptive limit of concurrent Banesco calls",
+)
+
+banesco_concurrency_in_flight = Gauge(
+    "banesco_concurrency_in_flight",
+    "Banesco calls currently in flight",
+)
+
+banesco_concurrency_queue_depth = Gauge(
+    "banesco_concurrency_queue_depth",
+    "Callers waiting for a Banesco concurrency slot",
+)
+
+banesco_credential_healthy = Gauge(
+    "banesco_credential_healthy",
+    "Whether a Banesco credential is in rotation (1) or ejected (0)",
+    ["credential"],
+)
+
+banesco_credential_in_flight = Gauge(
+    "banesco_credential_in_flight",
+    "Banesco calls in flight per credential",
+    ["credential"],
+)
+
+banesco_credential_ejections_total = Counter(
+    "banesco_credential_ejections_total",
+    "Banesco credentials ejected after repeated rejections",
+    ["credential", "reason"],  # reason: rate_limited, unauthorized
+)
+
+banesco_credential_throttle_rate = Gauge(
+    "banesco_credential_throttle_rate",
+    "Current client-side throttle rate per Banesco credential",
+    ["credential"],
+)
+
+banesco_stale_responses_total = Counter(
+    "banesco_stale_responses_total",
+    "Banesco lookups answered with the last good response after an error",
+)
+
+banesco_conditional_requests_total = Counter(
+    "banesco_conditional_requests_total",
+    "Banesco status requests sent with cache validators",
+    ["result"],  # not_modified, modified
+)
+
+banesco_rate_limit_deferrals_total = Counter(
+    "banesco_rate_limit_deferrals_total",
+    "Banesco lookups over the per-transaction limit, by deferral outcome",
+    ["result"],  # deferred, joined, rejected
+)
+
+rate_limit_backend_fallbacks_total = Counter(
+    "rate_limit_backend_fallbacks_total",
+    "Rate limit operations served by the fallback backend (Redis unavailable)",
+    ["operation"],  # acquire, count, reset
+)
+
+rate_limit_lease_decisions_total = Counter(
+    "rate_limit_lease_decisions_total",
+    "Leased rate limit decisions by where they were made",
+    ["source"],  # local, redis
+)
+
+rate_limit_lease_tokens_returned_total = Counter(
+    "rate_limit_lease_tokens_returned_total",
+    "Unused leased rate limit tokens returned to Redis",
+)
+
+rate_limit_windows_purged_total = Counter(
+    "rate_limit_windows_purged_total",
+    "Expired rate limit windows deleted from the database",
+)
+
 banesco_rate_limit_exceeded_total = Counter(
     "banesco_rate_limit_exceeded_total",
     "Total Banesco rate limit violations",
     ["transaction_id"],
 )
 
+# Bank Connector Metrics
+bank_lookups_total = Counter(
+    "bank_lookups_total",
+    "Transaction lookups through bank connectors",
+    ["bank", "result"],  # found, not_found, stale, error, timeout
+)
+
+bank_lookup_duration_seconds = Histogram(
+    "bank_lookup_duration_seconds",
+    "Bank connector lookup duration in seconds",
+    ["bank"],
+    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+)
+
+bank_connector_healthy = Gauge(
+    "bank_connector_healthy",
+    "Bank connector health as of the last check (1 = healthy)",
+    ["bank"],
+)
+
 # Authentication Metrics
 auth_attempts_total = Counter(
     "auth_attempts_total",
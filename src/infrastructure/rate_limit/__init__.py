@@ -0,0 +1,17 @@
+"""Rate limit counter backends."""
+
+from .base import LeaseGrant, RateLimitBackend, RateLimitDecision
+from .database_backend import DatabaseRateLimitBackend
+from .fallback_backend import FallbackRateLimitBackend
+from .leased_backend import LeasedRateLimitBackend
+from .redis_backend import RedisRateLimitBackend
+
+__all__ = [
+    "DatabaseRateLimitBackend",
+    "FallbackRateLimitBackend",
+    "LeaseGrant",
+    "LeasedRateLimitBackend",
+    "RateLimitBackend",
+    "RateLimitDecision",
+    "RedisRateLimitBackend",
+]
@@ -0,0 +1,64 @@
+"""Rate limit backend interface."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of counting a request against its limit.
+
+    ``count`` includes the request when it was allowed. ``retry_after`` is
+    the number of seconds until a request would be allowed again (0 when
+    allowed).
+    """
+
+    allowed: bool
+    count: int
+    retry_after: float = 0.0
+
+
+@dataclass(frozen=True)
+class LeaseGrant:
+    """Tokens of a resource's quota reserved at once for local use.
+
+    ``count`` includes the granted tokens. ``retry_after`` is the number
+    of seconds until tokens would be granted again (0 when some were).
+    """
+
+    lease_id: str
+    granted: int
+    count: int
+    retry_after: float = 0.0
+
+
+class RateLimitBackend(ABC):
+    """Storage of per-resource request counters."""
+
+    @abstractmethod
+    async def acquire(
+        self,
+        resource_type: str,
+        resource_identifier: str,
+        limit: int | None,
+        window: float,
+    ) -> RateLimitDecision:
+        """Count a request if it fits within ``limit`` requests per ``window``.
+
+        The check and the increment are a single step: concurrent callers
+        can never exceed the limit together. A ``limit`` of None counts the
+        request unconditionally.
+        """
+        pass
+
+    @abstractmethod
+    async def count(
+        self, resource_type: str, resource_identifier: str, window: float
+    ) -> int:
+        """Requests counted for a resource in the current window."""
+        pass
+
+    @abstractmethod
+    async def reset(self, resource_type: str, resource_identifier: str) -> None:
+        """Forget the requests counted for a resource."""
+        pass
@@ -0,0 +1,115 @@
+"""Rate limit counters in the ``rate_limits`` table."""
+
+import math
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database.models import RateLimitModel
+from infrastructure.rate_limit.base import RateLimitBackend, RateLimitDecision
+
+
+class DatabaseRateLimitBackend(RateLimitBackend):
+    """Fixed-window counters stored in Postgres.
+
+    Each resource gets one row per window (``window`` seconds aligned to
+    the epoch, i.e. calendar minutes for 60 seconds), unique on resource
+    and window start. Counting a request is a single upsert that only
+    increments while the row is under the limit, so concurrent requests
+    cannot exceed it. The upsert locks the counter row until the session's
+    transaction ends, even when it refuses the request, so callers should
+    commit soon after acquiring.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize database backend.
+
+        Args:
+            session: Database session of the current request
+        """
+        self.session = session
+
+    async def acquire(
+        self,
+        resource_type: str,
+        resource_identifier: str,
+        limit: int | None,
+        window: float,
+    ) -> RateLimitDecision:
+        """Count a request in the current window if it fits."""
+        window_start, retry_after = self._current_window(window)
+        if limit is not None and limit <= 0:
+            return RateLimitDecision(allowed=False, count=0, retry_after=retry_after)
+
+        stmt = insert(RateLimitModel).values(
+            resource_type=resource_type,
+            resource_identifier=resource_identifier,
+            window_start=window_start,
+            request_count=1,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="unique_rate_limit_window",
+            set_={
+                "request_count": RateLimitModel.request_count + 1,
+                "updated_at": func.now(),
+            },
+            where=(RateLimitModel.request_count < limit) if limit is not None else None,
+        ).returning(RateLimitModel.request_count)
+
+        count = (await self.session.execute(stmt)).scalar_one_or_none()
+        if count is None:
+            # The row exists and is at the limit, so the update was skipped
+            return RateLimitDecision(
+                allowed=False, count=limit, retry_after=retry_after
+            )
+        return RateLimitDecision(allowed=True, count=count)
+
+    async def count(
+        self, resource_type: str, resource_identifier: str, window: float
+    ) -> int:
+        """Requests counted in the current window."""
+        window_start, _ = self._current_window(window)
+        stmt = select(RateLimitModel.request_count).where(
+            RateLimitModel.resource_type == resource_type,
+            RateLimitModel.resource_identifier == resource_identifier,
+            RateLimitModel.window_start == window_start,
+        )
+        return (await self.session.execute(stmt)).scalar_one_or_none() or 0
+
+    async def reset(self, resource_type: str, resource_identifier: str) -> None:
+        """Delete the counter of the current minute."""
+        window_start, _ = self._current_window(60)
+        await self.session.execute(
+            delete(RateLimitModel).where(
+                RateLimitModel.resource_type == resource_type,
+                RateLimitModel.resource_identifier == resource_identifier,
+                RateLimitModel.window_start == window_start,
+            )
+        )
+
+    async def purge_expired(self, before: datetime, limit: int = 5000) -> int:
+        """Delete up to ``limit`` counters of windows that started before ``before``.
+
+        Returns:
+            Number of rows deleted
+        """
+        expired = (
+            select(RateLimitModel.id)
+            .where(RateLimitModel.window_start < before)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            delete(RateLimitModel).where(RateLimitModel.id.in_(expired))
+        )
+        return result.rowcount
+
+    @staticmethod
+    def _current_window(window: float) -> tuple[datetime, float]:
+        """Start of the current window and seconds until the next one."""
+        now = time.time()
+        start = math.floor(now / window) * window
+        return datetime.fromtimestamp(start, timezone.utc), start + window - now
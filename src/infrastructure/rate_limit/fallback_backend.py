@@ -0,0 +1,75 @@
+"""Rate limit backend that falls back to another when it fails."""
+
+import structlog
+
+from infrastructure.monitoring.metrics import rate_limit_backend_fallbacks_total
+from infrastructure.rate_limit.base import RateLimitBackend, RateLimitDecision
+
+logger = structlog.get_logger()
+
+
+class FallbackRateLimitBackend(RateLimitBackend):
+    """Uses ``primary`` and switches to ``fallback`` for calls it fails.
+
+    Meant for Redis in front of the database: while Redis is unreachable,
+    requests are counted in the database instead of failing or going
+    unlimited. The two stores do not share counts, so a resource can get
+    up to one extra limit's worth of requests when Redis goes down or
+    comes back mid-window.
+    """
+
+    def __init__(self, primary: RateLimitBackend, fallback: RateLimitBackend) -> None:
+        """Initialize fallback backend.
+
+        Args:
+            primary: Preferred backend
+            fallback: Backend used when the primary raises
+        """
+        self.primary = primary
+        self.fallback = fallback
+
+    async def acquire(
+        self,
+        resource_type: str,
+        resource_identifier: str,
+        limit: int | None,
+        window: float,
+    ) -> RateLimitDecision:
+        """Count a request with the primary backend, else the fallback."""
+        try:
+            return await self.primary.acquire(
+                resource_type, resource_identifier, limit, window
+            )
+        except Exception as e:
+            self._log_fallback("acquire", e)
+        return await self.fallback.acquire(
+            resource_type, resource_identifier, limit, window
+        )
+
+    async def count(
+        self, resource_type: str, resource_identifier: str, window: float
+    ) -> int:
+        """Count with the primary backend, else the fallback."""
+        try:
+            return await self.primary.count(resource_type, resource_identifier, window)
+        except Exception as e:
+            self._log_fallback("count", e)
+        return await self.fallback.count(resource_type, resource_identifier, window)
+
+    async def reset(self, resource_type: str, resource_identifier: str) -> None:
+        """Reset the counters of both backends."""
+        try:
+            await self.primary.reset(resource_type, resource_identifier)
+        except Exception as e:
+            self._log_fallback("reset", e)
+        await self.fallback.reset(resource_type, resource_identifier)
+
+    @staticmethod
+    def _log_fallback(operation: str, error: Exception) -> None:
+        """Record a switch to the fallback backend."""
+        rate_limit_backend_fallbacks_total.labels(operation=operation).inc()
+        logger.warning(
+            "Rate limit backend failed, using fallback",
+            operation=operation,
+            error=str(error),
+        )
@@ -0,0 +1,226 @@
+"""Process-local leases of Redis rate limit quotas."""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import structlog
+
+from infrastructure.monitoring.metrics import (
+    rate_limit_lease_decisions_total,
+    rate_limit_lease_tokens_returned_total,
+)
+from infrastructure.rate_limit.base import (
+    LeaseGrant,
+    RateLimitBackend,
+    RateLimitDecision,
+)
+from infrastructure.rate_limit.redis_backend import RedisRateLimitBackend
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class _Lease:
+    """Tokens of one resource held by this process."""
+
+    grant: LeaseGrant
+    expires_at: float
+    used: int = 0
+
+    @property
+    def remaining(self) -> int:
+        """Tokens not handed out yet."""
+        return self.grant.granted - self.used
+
+
+class LeasedRateLimitBackend(RateLimitBackend):
+    """Serves high-limit resources from locally leased slices of the quota.
+
+    Instead of one Redis round trip per request, the process reserves up
+    to ``lease_size`` requests of a resource's quota in one round trip
+    and hands them out from memory. A lease lasts ``lease_ttl`` seconds
+    (at most one window); its unused tokens are then returned to Redis so
+    other processes can use them. After a refused lease, requests for the
+    resource are refused locally until Redis said capacity frees up.
+    Resources whose limit is below ``min_limit`` (or unlimited) go to Redis
+    on every request, unchanged.
+
+    Accuracy: the global counter never grants more than ``limit`` tokens
+    in any ``window``, but a token is logged when it is leased rather than
+    when it is used, up to ``lease_ttl`` later. Any ``window`` of real time
+    therefore admits at most ``limit + P * lease_size`` requests with ``P``
+    processes holding leases, and tokens held idle by one process can make
+    another refuse requests until they are returned; requests are never
+    admitted past that bound. Round trips drop to about one per
+    ``lease_size`` requests, plus one per lease returned with leftovers.
+    """
+
+    def __init__(
+        self,
+        backend: RedisRateLimitBackend,
+        lease_size: int = 10,
+        lease_ttl: float = 5.0,
+        min_limit: int = 20,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize leased backend.
+
+        Args:
+            backend: Redis counters holding the global quota
+            lease_size: Most tokens reserved per round trip
+            lease_ttl: Seconds a lease is used before its leftovers go back
+            min_limit: Smallest per-window limit served from leases
+            clock: Monotonic clock (for tests)
+        """
+        self.backend = backend
+        self.lease_size = lease_size
+        self.lease_ttl = lease_ttl
+        self.min_limit = min_limit
+        self.clock = clock
+        self._leases: dict[tuple[str, str], _Lease] = {}
+        self._refused_until: dict[tuple[str, str], tuple[float, int]] = {}
+        self._locks: dict[tuple[str, str], asyncio.Lock] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def acquire(
+        self,
+        resource_type: str,
+        resource_identifier: str,
+        limit: int | None,
+        window: float,
+    ) -> RateLimitDecision:
+        """Count a request against the local lease, leasing more when needed."""
+        if limit is None or limit < self.min_limit:
+            return await self.backend.acquire(
+                resource_type, resource_identifier, limit, window
+            )
+
+        key = (resource_type, resource_identifier)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            now = self.clock()
+            lease = self._leases.get(key)
+            if lease is not None and lease.expires_at <= now:
+                await self._return(key, self._leases.pop(key))
+                lease = None
+
+            if lease is not None and lease.remaining > 0:
+                lease.used += 1
+                rate_limit_lease_decisions_total.labels(source="local").inc()
+                return RateLimitDecision(
+                    allowed=True, count=lease.grant.count - lease.remaining
+                )
+
+            refused_until, count = self._refused_until.get(key, (0.0, 0))
+            if now < refused_until:
+                rate_limit_lease_decisions_total.labels(source="local").inc()
+                return RateLimitDecision(
+                    allowed=False, count=count, retry_after=refused_until - now
+                )
+
+            grant = await self.backend.lease(
+                resource_type,
+                resource_identifier,
+                min(self.lease_size, limit),
+                limit,
+                window,
+            )
+            rate_limit_lease_decisions_total.labels(source="redis").inc()
+            if grant.granted == 0:
+                self._leases.pop(key, None)
+                self._refused_until[key] = (now + grant.retry_after, grant.count)
+                return RateLimitDecision(
+                    allowed=False, count=grant.count, retry_after=grant.retry_after
+                )
+
+            self._refused_until.pop(key, None)
+            self._leases[key] = _Lease(
+                grant=grant,
+                expires_at=now + min(self.lease_ttl, window),
+                used=1,
+            )
+            return RateLimitDecision(
+                allowed=True, count=grant.count - grant.granted + 1
+            )
+
+    async def count(
+        self, resource_type: str, resource_identifier: str, window: float
+    ) -> int:
+        """Requests counted in Redis, including leased tokens not used yet."""
+        return await self.backend.count(resource_type, resource_identifier, window)
+
+    async def reset(self, resource_type: str, resource_identifier: str) -> None:
+        """Drop the local lease and the Redis counter of a resource."""
+        key = (resource_type, resource_identifier)
+        self._leases.pop(key, None)
+        self._refused_until.pop(key, None)
+        await self.backend.reset(resource_type, resource_identifier)
+
+    async def release_expired(self) -> int:
+        """Return the leftovers of expired leases and forget stale state.
+
+        Returns:
+            Number of tokens returned
+        """
+        now = self.clock()
+        returned = 0
+        for key, lease in list(self._leases.items()):
+            lock = self._locks.get(key)
+            if lease.expires_at <= now and not (lock and lock.locked()):
+                returned += await self._return(key, self._leases.pop(key))
+        for key, (refused_until, _) in list(self._refused_until.items()):
+            if refused_until <= now:
+                del self._refused_until[key]
+        for key, lock in list(self._locks.items()):
+            if (
+                key not in self._leases
+                and key not in self._refused_until
+                and not lock.locked()
+            ):
+                del self._locks[key]
+        return returned
+
+    def start(self) -> None:
+        """Start returning expired leases in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and return every lease's leftovers."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        for key in list(self._leases):
+            await self._return(key, self._leases.pop(key))
+
+    async def _run(self) -> None:
+        """Return expired leases every ``lease_ttl`` seconds."""
+        while True:
+            await asyncio.sleep(self.lease_ttl)
+            try:
+                await self.release_expired()
+            except Exception as e:
+                logger.warning("Failed to return rate limit leases", error=str(e))
+
+    async def _return(self, key: tuple[str, str], lease: _Lease) -> int:
+        """Give a lease's unused tokens back to Redis."""
+        if lease.remaining <= 0:
+            return 0
+        try:
+            await self.backend.release(key[0], key[1], lease.grant, lease.remaining)
+        except Exception as e:
+            # The tokens stay counted until they leave the window
+            logger.warning(
+                "Failed to return rate limit lease",
+                resource_type=key[0],
+                error=str(e),
+            )
+            return 0
+        rate_limit_lease_tokens_returned_total.inc(lease.remaining)
+        return lease.remaining
@@ -0,0 +1,186 @@
+"""Sliding-window rate limit counters in Redis."""
+
+import uuid
+
+import redis.asyncio as redis
+
+from infrastructure.rate_limit.base import (
+    LeaseGrant,
+    RateLimitBackend,
+    RateLimitDecision,
+)
+
+# Sliding-window log: one sorted-set member per counted request, scored by
+# its time in milliseconds. Expired members are trimmed, then the request is
+# added only if the set still holds fewer than the limit (negative limit:
+# unlimited). The Redis clock is used so workers need not agree on time.
+# Returns {allowed, count, retry_after_ms}.
+ACQUIRE_SCRIPT = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now - window)
+local count = redis.call("ZCARD", KEYS[1])
+if limit >= 0 and count >= limit then
+    local oldest = redis.call("ZRANGE", KEYS[1], 0, 0, "WITHSCORES")
+    local retry_after = window
+    if oldest[2] then
+        retry_after = tonumber(oldest[2]) + window - now
+    end
+    return {0, count, retry_after}
+end
+
+redis.call("ZADD", KEYS[1], now, ARGV[3])
+redis.call("PEXPIRE", KEYS[1], window)
+return {1, count + 1, 0}
+"""
+
+# Same log, reserving up to ARGV[3] requests at once as members
+# "<lease id>:1" .. "<lease id>:<granted>". Returns {granted, count,
+# retry_after_ms}.
+LEASE_SCRIPT = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local tokens = tonumber(ARGV[3])
+
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now - window)
+local count = redis.call("ZCARD", KEYS[1])
+local granted = tokens
+if limit >= 0 then
+    granted = math.min(tokens, limit - count)
+end
+if granted <= 0 then
+    local oldest = redis.call("ZRANGE", KEYS[1], 0, 0, "WITHSCORES")
+    local retry_after = window
+    if oldest[2] then
+        retry_after = tonumber(oldest[2]) + window - now
+    end
+    return {0, count, retry_after}
+end
+
+local members = {}
+for i = 1, granted do
+    members[#members + 1] = now
+    members[#members + 1] = ARGV[4] .. ":" .. i
+end
+redis.call("ZADD", KEYS[1], unpack(members))
+redis.call("PEXPIRE", KEYS[1], window)
+return {granted, count + granted, 0}
+"""
+
+COUNT_SCRIPT = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+return redis.call("ZCOUNT", KEYS[1], now - tonumber(ARGV[1]) + 1, "+inf")
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Sliding-window counters kept in Redis.
+
+    Each check-and-increment is one Lua script run, i.e. a single round
+    trip that Redis executes atomically, and a resource never gets more
+    than ``limit`` requests in any ``window`` seconds (not just per
+    calendar window).
+    """
+
+    def __init__(self, client: redis.Redis, prefix: str = "ratelimit") -> None:
+        """Initialize Redis backend.
+
+        Args:
+            client: Redis client (e.g. ``CacheService.redis_client``)
+            prefix: Prefix of the counter keys
+        """
+        self.client = client
+        self.prefix = prefix
+        self._acquire = client.register_script(ACQUIRE_SCRIPT)
+        self._count = client.register_script(COUNT_SCRIPT)
+        self._lease = client.register_script(LEASE_SCRIPT)
+
+    async def acquire(
+        self,
+        resource_type: str,
+        resource_identifier: str,
+        limit: int | None,
+        window: float,
+    ) -> RateLimitDecision:
+        """Count a request in the sliding window if it fits."""
+        allowed, count, retry_after_ms = await self._acquire(
+            keys=[self._key(resource_type, resource_identifier)],
+            args=[
+                -1 if limit is None else limit,
+                int(window * 1000),
+                uuid.uuid4().hex,
+            ],
+        )
+        return RateLimitDecision(
+            allowed=bool(allowed),
+            count=int(count),
+            retry_after=max(int(retry_after_ms), 0) / 1000,
+        )
+
+    async def lease(
+        self,
+        resource_type: str,
+        resource_identifier: str,
+        tokens: int,
+        limit: int | None,
+        window: float,
+    ) -> LeaseGrant:
+        """Count up to ``tokens`` requests at once, as many as fit."""
+        lease_id = uuid.uuid4().hex
+        granted, count, retry_after_ms = await self._lease(
+            keys=[self._key(resource_type, resource_identifier)],
+            args=[-1 if limit is None else limit, int(window * 1000), tokens, lease_id],
+        )
+        return LeaseGrant(
+            lease_id=lease_id,
+            granted=int(granted),
+            count=int(count),
+            retry_after=max(int(retry_after_ms), 0) / 1000,
+        )
+
+    async def release(
+        self,
+        resource_type: str,
+        resource_identifier: str,
+        grant: LeaseGrant,
+        unused: int,
+    ) -> None:
+        """Uncount the last ``unused`` tokens of a lease.
+
+        Only the lease's own members are removed, so tokens that already
+        left the window are not taken from other requests.
+        """
+        if unused <= 0:
+            return
+        await self.client.zrem(
+            self._key(resource_type, resource_identifier),
+            *(
+                f"{grant.lease_id}:{i}"
+                for i in range(grant.granted - unused + 1, grant.granted + 1)
+            ),
+        )
+
+    async def count(
+        self, resource_type: str, resource_identifier: str, window: float
+    ) -> int:
+        """Requests counted in the last ``window`` seconds."""
+        return int(
+            await self._count(
+                keys=[self._key(resource_type, resource_identifier)],
+                args=[int(window * 1000)],
+            )
+        )
+
+    async def reset(self, resource_type: str, resource_identifier: str) -> None:
+        """Delete the counter of a resource."""
+        await self.client.delete(self._key(resource_type, resource_identifier))
+
+    def _key(self, resource_type: str, resource_identifier: str) -> str:
+        """Redis key of a resource's counter."""
+        return f"{self.prefix}:{resource_type}:{resource_identifier}"
@@ -0,0 +1,42 @@
+"""Resilience primitives for outbound calls."""
+
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    CircuitTicket,
+)
+from .concurrency_limiter import AIMDConcurrencyLimiter, ConcurrencyLimitExceededError
+from .deadline import (
+    DeadlineExceededError,
+    cap_timeout,
+    clear_deadline,
+    deadline_scope,
+    remaining_time,
+    stop_before_deadline,
+)
+from .hedging import Hedger
+from .retry_budget import RetryBudget
+from .single_flight import SingleFlight
+from .throttle import AdaptiveTokenBucket, ThrottleQueueFullError, ThrottleTimeoutError
+
+__all__ = [
+    "AIMDConcurrencyLimiter",
+    "AdaptiveTokenBucket",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "CircuitTicket",
+    "ConcurrencyLimitExceededError",
+    "DeadlineExceededError",
+    "Hedger",
+    "RetryBudget",
+    "SingleFlight",
+    "ThrottleQueueFullError",
+    "ThrottleTimeoutError",
+    "cap_timeout",
+    "clear_deadline",
+    "deadline_scope",
+    "remaining_time",
+    "stop_before_deadline",
+]
@@ -0,0 +1,271 @@
+"""Circuit breaker with half-open probing."""
+
+import asyncio
+import enum
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+import structlog
+from prometheus_client import Gauge
+
+T = TypeVar("T")
+
+logger = structlog.get_logger()
+
+
+class CircuitState(str, enum.Enum):
+    """Circuit breaker state enumeration."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+# Numeric value exported for each state
+STATE_GAUGE_VALUES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(f"Circuit '{name}' is open")
+        self.name = name
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class CircuitTicket:
+    """Admission of one call, needed to record its outcome.
+
+    ``generation`` identifies the circuit state the call was admitted in;
+    outcomes of calls admitted before the last state change are ignored.
+    """
+
+    generation: int
+    probe: bool = False
+
+
+class CircuitBreaker:
+    """Count-based circuit breaker.
+
+    Closed: calls pass and outcomes are recorded in a sliding window. When the
+    failure rate or the slow-call rate over the window reaches its threshold
+    the circuit opens.
+
+    Open: calls fail fast with ``CircuitOpenError`` until ``open_duration``
+    has elapsed.
+
+    Half-open: a single probe call is let through; its success closes the
+    circuit, its failure opens it again. Other calls fail fast meanwhile.
+
+    Outcomes are recorded against the ``CircuitTicket`` returned by
+    ``allow``. Calls admitted before the last state change (e.g. slow calls
+    still running when the circuit opened) do not count: they cannot close
+    a half-open circuit, reopen it, or fill the window of a new state.
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        failure_rate_threshold: float = 0.5,
+        slow_call_rate_threshold: float = 0.8,
+        slow_call_duration: float = 5.0,
+        minimum_calls: int = 10,
+        window_size: int = 20,
+        open_duration: float = 30.0,
+        metric: Gauge | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize circuit breaker.
+
+        Args:
+            name: Circuit name used in errors, logs and metrics
+            failure_rate_threshold: Failure ratio (0-1) that opens the circuit
+            slow_call_rate_threshold: Slow-call ratio (0-1) that opens the circuit
+            slow_call_duration: Seconds after which a call counts as slow
+            minimum_calls: Calls required in the window before evaluating rates
+            window_size: Number of most recent calls considered
+            open_duration: Seconds to stay open before probing
+            metric: Gauge with a ``name`` label set to the state (optional)
+            clock: Monotonic clock (for tests)
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.metric = metric
+        self.clock = clock
+        self.state = CircuitState.CLOSED
+        self._outcomes: deque[tuple[bool, bool]] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._generation = 0
+        self._probe_in_flight = False
+        self._export_state()
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the circuit will allow a probe call."""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return max(self._opened_at + self.open_duration - self.clock(), 0.0)
+
+    def allow(self) -> CircuitTicket:
+        """Admit a call or raise if the circuit rejects it.
+
+        Returns:
+            Ticket to record the call's outcome with
+
+        Raises:
+            CircuitOpenError: If the circuit is open or a probe is running
+        """
+        if self.state == CircuitState.OPEN:
+            if self.retry_after > 0:
+                raise CircuitOpenError(self.name, self.retry_after)
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self._probe_in_flight:
+                raise CircuitOpenError(self.name, self.open_duration)
+            self._probe_in_flight = True
+            return CircuitTicket(self._generation, probe=True)
+        return CircuitTicket(self._generation)
+
+    def record_success(self, ticket: CircuitTicket, duration: float) -> None:
+        """Record a call that completed.
+
+        Args:
+            ticket: Admission of the call
+            duration: Call duration in seconds
+        """
+        if not self._is_current(ticket):
+            return
+        slow = duration >= self.slow_call_duration
+        if ticket.probe:
+            self._probe_in_flight = False
+            self._transition(CircuitState.OPEN if slow else CircuitState.CLOSED)
+            return
+
+        self._outcomes.append((False, slow))
+        self._evaluate()
+
+    def record_failure(self, ticket: CircuitTicket, duration: float) -> None:
+        """Record a call that failed.
+
+        Args:
+            ticket: Admission of the call
+            duration: Call duration in seconds
+        """
+        if not self._is_current(ticket):
+            return
+        if ticket.probe:
+            self._probe_in_flight = False
+            self._transition(CircuitState.OPEN)
+            return
+
+        self._outcomes.append((True, duration >= self.slow_call_duration))
+        self._evaluate()
+
+    def release(self, ticket: CircuitTicket) -> None:
+        """Forget a call that ended without an outcome (e.g. cancelled).
+
+        Args:
+            ticket: Admission of the call
+        """
+        if ticket.probe and self._is_current(ticket):
+            self._probe_in_flight = False
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        is_failure: Callable[[Exception], bool] = lambda e: True,
+        is_neutral: Callable[[Exception], bool] = lambda e: False,
+    ) -> T:
+        """Run ``fn`` through the circuit.
+
+        Args:
+            fn: Coroutine factory to execute
+            is_failure: Whether an exception counts as a failure; exceptions
+                for which it returns False count as successful calls
+            is_neutral: Whether an exception says nothing about upstream
+                health; such calls are released without an outcome
+
+        Returns:
+            Result of ``fn``
+
+        Raises:
+            CircuitOpenError: If the circuit rejects the call
+        """
+        ticket = self.allow()
+        started_at = self.clock()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # A cancelled call says nothing about upstream health
+            self.release(ticket)
+            raise
+        except Exception as e:
+            if is_neutral(e):
+                self.release(ticket)
+            elif is_failure(e):
+                self.record_failure(ticket, self.clock() - started_at)
+            else:
+                self.record_success(ticket, self.clock() - started_at)
+            raise
+
+        self.record_success(ticket, self.clock() - started_at)
+        return result
+
+    def _is_current(self, ticket: CircuitTicket) -> bool:
+        """Check if a call was admitted in the current state."""
+        return ticket.generation == self._generation
+
+    def _evaluate(self) -> None:
+        """Open the circuit if the window exceeds a threshold."""
+        total = len(self._outcomes)
+        if total < self.minimum_calls:
+            return
+
+        failures = sum(failed for failed, _ in self._outcomes)
+        slow_calls = sum(slow for _, slow in self._outcomes)
+        if (
+            failures / total >= self.failure_rate_threshold
+            or slow_calls / total >= self.slow_call_rate_threshold
+        ):
+            self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        """Move to a new state."""
+        if state == self.state:
+            if state == CircuitState.OPEN:
+                self._opened_at = self.clock()
+            return
+
+        logger.warning(
+            "Circuit breaker state changed",
+            circuit=self.name,
+            old_state=self.state.value,
+            new_state=state.value,
+        )
+        self.state = state
+        self._generation += 1
+        self._probe_in_flight = False
+        if state == CircuitState.OPEN:
+            self._opened_at = self.clock()
+        if state == CircuitState.CLOSED:
+            self._outcomes.clear()
+        self._export_state()
+
+    def _export_state(self) -> None:
+        """Publish the current state to the metric."""
+        if self.metric is not None:
+            self.metric.labels(name=self.name).set(STATE_GAUGE_VALUES[self.state])
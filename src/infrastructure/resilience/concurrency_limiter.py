@@ -0,0 +1,202 @@
+"""Adaptive (AIMD) concurrency limiter for outbound calls."""
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from prometheus_client import Gauge
+
+T = TypeVar("T")
+
+
+class ConcurrencyLimitExceededError(Exception):
+    """Raised when a caller cannot get a slot within its wait bound."""
+
+
+class AIMDConcurrencyLimiter:
+    """Limits in-flight calls with a limit learned from upstream behavior.
+
+    Additive increase: every successful call faster than ``latency_target``
+    grows the limit by ``increase_step / limit``, i.e. about ``increase_step``
+    per limit's worth of calls, as long as the limit is actually being used.
+
+    Multiplicative decrease: every overload signal (timeout, 429) multiplies
+    the limit by ``decrease_factor``.
+
+    Callers above the limit wait in FIFO order for at most ``max_wait``
+    seconds; no more than ``max_queue`` callers wait at a time.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        latency_target: float = 1.0,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.7,
+        max_queue: int = 100,
+        max_wait: float = 2.0,
+        limit_metric: Gauge | None = None,
+        queue_metric: Gauge | None = None,
+        in_flight_metric: Gauge | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize concurrency limiter.
+
+        Args:
+            initial_limit: Starting concurrency limit
+            min_limit: Lowest limit after repeated decreases
+            max_limit: Highest limit reached by increases
+            latency_target: Calls slower than this (seconds) do not grow the limit
+            increase_step: Limit growth per limit's worth of fast successes
+            decrease_factor: Multiplier applied to the limit on overload
+            max_queue: Maximum callers waiting for a slot
+            max_wait: Default maximum seconds a caller waits for a slot
+            limit_metric: Gauge set to the current limit (optional)
+            queue_metric: Gauge set to the number of waiting callers (optional)
+            in_flight_metric: Gauge set to the number of running calls (optional)
+            clock: Monotonic clock (for tests)
+        """
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.limit_metric = limit_metric
+        self.queue_metric = queue_metric
+        self.in_flight_metric = in_flight_metric
+        self.clock = clock
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._export()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self, timeout: float | None = None) -> None:
+        """Wait for a slot.
+
+        Args:
+            timeout: Maximum seconds to wait (defaults to ``max_wait``)
+
+        Raises:
+            ConcurrencyLimitExceededError: If the queue is full or no slot
+                frees up in time
+        """
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            self._export()
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            raise ConcurrencyLimitExceededError("Concurrency limit queue is full")
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._export()
+        try:
+            await asyncio.wait_for(
+                waiter, timeout=self.max_wait if timeout is None else timeout
+            )
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we gave up; pass it on
+                self.release()
+            else:
+                self._remove_waiter(waiter)
+            if isinstance(e, TimeoutError):
+                raise ConcurrencyLimitExceededError(
+                    "Timed out waiting for a concurrency slot"
+                ) from e
+            raise
+
+    def release(self) -> None:
+        """Free a slot, handing it to the next waiter if the limit allows."""
+        self.in_flight -= 1
+        self._wake_waiters()
+        self._export()
+
+    def on_success(self, latency: float) -> None:
+        """Grow the limit after a call that was fast enough.
+
+        Args:
+            latency: Call duration in seconds
+        """
+        # Only grow while the limit is actually used, or it drifts upward idle
+        if latency < self.latency_target and self.in_flight * 2 >= self.limit:
+            self.limit = min(
+                self.limit + self.increase_step / self.limit, self.max_limit
+            )
+            self._wake_waiters()
+            self._export()
+
+    def on_overload(self) -> None:
+        """Shrink the limit after a timeout or rate-limit answer."""
+        self.limit = max(self.limit * self.decrease_factor, float(self.min_limit))
+        self._export()
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        is_overload: Callable[[Exception], bool] = lambda e: False,
+        timeout: float | None = None,
+    ) -> T:
+        """Run ``fn`` within a slot and adapt the limit to its outcome.
+
+        Args:
+            fn: Coroutine factory to execute
+            is_overload: Whether an exception signals upstream overload;
+                other exceptions leave the limit unchanged
+            timeout: Maximum seconds to wait for a slot (defaults to ``max_wait``)
+
+        Returns:
+            Result of ``fn``
+
+        Raises:
+            ConcurrencyLimitExceededError: If no slot is available in time
+        """
+        await self.acquire(timeout)
+        started_at = self.clock()
+        try:
+            result = await fn()
+        except Exception as e:
+            if is_overload(e):
+                self.on_overload()
+            raise
+        else:
+            self.on_success(self.clock() - started_at)
+            return result
+        finally:
+            self.release()
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to waiters in FIFO order."""
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def _remove_waiter(self, waiter: asyncio.Future[None]) -> None:
+        """Drop a waiter that gave up."""
+        with contextlib.suppress(ValueError):
+            self._waiters.remove(waiter)
+        self._export()
+
+    def _export(self) -> None:
+        """Publish limit, queue depth and in-flight calls to the metrics."""
+        if self.limit_metric is not None:
+            self.limit_metric.set(self.limit)
+        if self.queue_metric is not None:
+            self.queue_metric.set(len(self._waiters))
+        if self.in_flight_metric is not None:
+            self.in_flight_metric.set(self.in_flight)
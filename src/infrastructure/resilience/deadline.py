@@ -0,0 +1,95 @@
+"""Request-scoped deadlines propagated through context variables."""
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from tenacity import RetryCallState
+
+# Absolute deadline on the ``time.monotonic`` clock, or None when unbounded
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceededError(Exception):
+    """Raised when the current deadline leaves no time for an operation."""
+
+
+@contextmanager
+def deadline_scope(timeout: float | None) -> Iterator[None]:
+    """Bound the time spent by everything awaited inside the block.
+
+    Nested scopes can only shorten the enclosing deadline. Tasks created
+    inside the block inherit it.
+
+    Args:
+        timeout: Seconds available from now (None keeps the current deadline)
+    """
+    deadline = _deadline.get()
+    if timeout is not None:
+        candidate = time.monotonic() + timeout
+        deadline = candidate if deadline is None else min(deadline, candidate)
+
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def clear_deadline() -> None:
+    """Drop the deadline in the current context (e.g. for background tasks)."""
+    _deadline.set(None)
+
+
+def remaining_time() -> float | None:
+    """Seconds left before the current deadline, or None when unbounded."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def cap_timeout(timeout: float) -> float:
+    """Shorten a timeout so it ends no later than the current deadline.
+
+    Args:
+        timeout: Timeout the operation would use without a deadline
+
+    Returns:
+        The smaller of ``timeout`` and the remaining time
+
+    Raises:
+        DeadlineExceededError: If the deadline has already passed
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise DeadlineExceededError("Request deadline exceeded")
+    return min(timeout, remaining)
+
+
+def stop_before_deadline(
+    min_attempt_time: float,
+) -> Callable[[RetryCallState], bool]:
+    """Build a tenacity stop condition that respects the current deadline.
+
+    Retrying stops when the time left after the upcoming backoff sleep is
+    shorter than ``min_attempt_time``, i.e. when another attempt could not
+    complete before the deadline anyway.
+
+    Args:
+        min_attempt_time: Seconds an attempt needs to have a chance to succeed
+
+    Returns:
+        Stop condition taking a tenacity ``RetryCallState``
+    """
+
+    def stop(retry_state: RetryCallState) -> bool:
+        remaining = remaining_time()
+        if remaining is None:
+            return False
+        return remaining - (retry_state.upcoming_sleep or 0) < min_attempt_time
+
+    return stop
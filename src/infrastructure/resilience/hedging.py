@@ -0,0 +1,109 @@
+"""Hedged requests with a delay taken from live latency."""
+
+import asyncio
+import math
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from prometheus_client import Counter
+
+T = TypeVar("T")
+
+
+class Hedger:
+    """Sends a backup call when the first one is slower than usual.
+
+    Latencies of recent successful calls are kept in a rolling window. When
+    a call has not answered after the window's ``quantile`` latency, a hedge
+    call is started (if ``allow_hedge`` agrees) and whichever answers first
+    wins; the other is cancelled. Only use it for idempotent calls.
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        min_delay: float = 0.05,
+        window: int = 500,
+        min_samples: int = 20,
+        metric: Counter | None = None,
+    ) -> None:
+        """Initialize hedger.
+
+        Args:
+            quantile: Latency quantile (0-1) after which a hedge is sent
+            min_delay: Lower bound for the hedge delay in seconds
+            window: Number of recent latencies kept
+            min_samples: Latencies required before hedging starts
+            metric: Counter with a ``result`` label (``sent``, ``won``) (optional)
+        """
+        self.quantile = quantile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.metric = metric
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    def observe(self, latency: float) -> None:
+        """Record the latency of a successful call.
+
+        Args:
+            latency: Call duration in seconds
+        """
+        self._latencies.append(latency)
+
+    def delay(self) -> float | None:
+        """Seconds to wait before hedging, or None while there is too little data."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(math.ceil(self.quantile * len(ordered)) - 1, len(ordered) - 1)
+        return max(ordered[max(index, 0)], self.min_delay)
+
+    async def run(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        hedge_fn: Callable[[], Awaitable[T]] | None = None,
+        allow_hedge: Callable[[], bool] = lambda: True,
+        is_final: Callable[[Exception], bool] = lambda e: False,
+    ) -> T:
+        """Run ``fn``, hedging it with ``hedge_fn`` if it is slow.
+
+        Args:
+            fn: Coroutine factory for the first call
+            hedge_fn: Coroutine factory for the hedge (defaults to ``fn``)
+            allow_hedge: Called when the delay expires; returning False
+                skips the hedge (e.g. no retry budget left)
+            is_final: Whether an exception is a definitive answer (e.g. not
+                found) rather than a failure to wait out
+
+        Returns:
+            Result of the call that answered first
+        """
+        delay = self.delay()
+        if delay is None:
+            return await fn()
+
+        primary = asyncio.ensure_future(fn())
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not allow_hedge():
+            return await primary
+
+        if self.metric is not None:
+            self.metric.labels(result="sent").inc()
+        hedge = asyncio.ensure_future((hedge_fn or fn)())
+        pending = {primary, hedge}
+        try:
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Prefer a success when both calls finished together
+                for task in sorted(done, key=lambda t: t.exception() is not None):
+                    error = task.exception()
+                    if error is None or not pending or is_final(error):
+                        if task is hedge and error is None and self.metric is not None:
+                            self.metric.labels(result="won").inc()
+                        return task.result()
+        finally:
+            for task in (primary, hedge):
+                task.cancel()
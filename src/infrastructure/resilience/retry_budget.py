@@ -0,0 +1,111 @@
+"""Retry budget shared by the callers of an upstream service."""
+
+import time
+from collections import deque
+from collections.abc import Callable
+
+from prometheus_client import Counter
+from tenacity import RetryCallState
+
+
+class RetryBudget:
+    """Caps retries to a fraction of recent first attempts.
+
+    Every first attempt earns ``ratio`` retries, valid for ``window`` seconds,
+    on top of a floor of ``min_retries_per_second`` so that low-traffic
+    callers can still retry. A retry is allowed only while retries made in
+    the window stay within what was earned. During a brownout, when most
+    calls fail, the extra load retries add is therefore bounded by ``ratio``
+    instead of multiplying traffic by the number of attempts.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_retries_per_second: float = 1.0,
+        window: float = 10.0,
+        metric: Counter | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize retry budget.
+
+        Args:
+            ratio: Retries allowed per first attempt (0.1 = 10%)
+            min_retries_per_second: Retries always allowed regardless of traffic
+            window: Seconds of history considered
+            metric: Counter with ``operation`` and ``result`` labels (optional)
+            clock: Monotonic clock (for tests)
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+        self.metric = metric
+        self.clock = clock
+        # One [second, first_attempts, retries] bucket per second of history
+        self._buckets: deque[list[int]] = deque()
+
+    def record_attempt(self) -> None:
+        """Record a first attempt, earning retry budget."""
+        self._current_bucket()[1] += 1
+
+    def try_retry(self, operation: str = "default") -> bool:
+        """Spend budget on a retry if any is left.
+
+        Args:
+            operation: Operation label for the metric
+
+        Returns:
+            True if the retry may proceed
+        """
+        bucket = self._current_bucket()
+        allowed = self.available() >= 1
+        if allowed:
+            bucket[2] += 1
+
+        if self.metric is not None:
+            self.metric.labels(
+                operation=operation, result="allowed" if allowed else "refused"
+            ).inc()
+        return allowed
+
+    def available(self) -> float:
+        """Retries that can still be made in the current window."""
+        self._expire()
+        attempts = sum(bucket[1] for bucket in self._buckets)
+        retries = sum(bucket[2] for bucket in self._buckets)
+        earned = attempts * self.ratio + self.min_retries_per_second * self.window
+        return earned - retries
+
+    def stop_when_exhausted(
+        self, operation: str = "default"
+    ) -> Callable[[RetryCallState], bool]:
+        """Build a tenacity stop condition that spends budget on each retry.
+
+        Combine it last in a ``stop=a | b | ...`` chain so budget is only
+        spent on retries that the other conditions would allow.
+
+        Args:
+            operation: Operation label for the metric
+
+        Returns:
+            Stop condition taking a tenacity ``RetryCallState``
+        """
+
+        def stop(retry_state: RetryCallState) -> bool:
+            return not self.try_retry(operation)
+
+        return stop
+
+    def _current_bucket(self) -> list[int]:
+        """Get the bucket for the current second, creating it if needed."""
+        self._expire()
+        second = int(self.clock())
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append([second, 0, 0])
+        return self._buckets[-1]
+
+    def _expire(self) -> None:
+        """Drop buckets older than the window."""
+        oldest = self.clock() - self.window
+        while self._buckets and self._buckets[0][0] < oldest:
+            self._buckets.popleft()
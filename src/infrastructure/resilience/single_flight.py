@@ -0,0 +1,109 @@
+"""Single-flight deduplication of concurrent calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+from prometheus_client import Counter
+
+from .deadline import (
+    DeadlineExceededError,
+    clear_deadline,
+    deadline_scope,
+    remaining_time,
+)
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Share one in-flight call between concurrent callers with the same key.
+
+    The first caller for a key (the leader) starts the call; callers arriving
+    while it is running are coalesced onto the same future and receive its
+    result or exception. The call runs as a task, so a cancelled caller does
+    not cancel the call for the others.
+
+    The shared call does not inherit any caller's deadline: it runs under
+    its own ``timeout``. Each caller, the leader included, waits for it only
+    until its own deadline, so a caller with little time left gives up
+    without failing the call for callers that have more.
+    """
+
+    def __init__(self, metric: Counter | None = None) -> None:
+        """Initialize single-flight group.
+
+        Args:
+            metric: Counter with a ``role`` label incremented per call (optional)
+        """
+        self.metric = metric
+        self.leader_calls = 0
+        self.coalesced_calls = 0
+        self._calls: dict[str, asyncio.Task[T]] = {}
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        timeout: float | None = None,
+    ) -> T:
+        """Run ``fn`` once for all concurrent callers sharing ``key``.
+
+        Args:
+            key: Deduplication key
+            fn: Coroutine factory executed by the leader
+            timeout: Deadline of the shared call in seconds (None: unbounded)
+
+        Returns:
+            Result of the shared call
+
+        Raises:
+            DeadlineExceededError: If the caller's deadline passes first
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_detached(fn, timeout))
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self._record("leader")
+        else:
+            self._record("coalesced")
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), remaining_time())
+        except TimeoutError:
+            if task.done():
+                raise
+            raise DeadlineExceededError(
+                f"Deadline exceeded waiting for shared call {key}"
+            ) from None
+
+    def in_flight(self) -> int:
+        """Number of keys with a call currently running."""
+        return len(self._calls)
+
+    @staticmethod
+    async def _run_detached(fn: Callable[[], Awaitable[T]], timeout: float | None) -> T:
+        """Run the shared call under its own deadline, not the leader's."""
+        clear_deadline()
+        with deadline_scope(timeout):
+            return await fn()
+
+    def _record(self, role: str) -> None:
+        """Count a leader or coalesced call."""
+        if role == "leader":
+            self.leader_calls += 1
+        else:
+            self.coalesced_calls += 1
+
+        if self.metric is not None:
+            self.metric.labels(role=role).inc()
+
+    def _forget(self, key: str, task: asyncio.Task[T]) -> None:
+        """Drop a finished call so the next caller starts a fresh one."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+        # Mark the exception as retrieved even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,177 @@
+"""Adaptive token bucket for pacing outbound calls."""
+
+import asyncio
+import time
+from collections.abc import Callable
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from infrastructure.resilience.deadline import remaining_time
+
+
+class ThrottleTimeoutError(Exception):
+    """Raised when a token cannot be obtained before the caller's deadline."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ThrottleQueueFullError(ThrottleTimeoutError):
+    """Raised when too many callers are already waiting for a token."""
+
+
+class AdaptiveTokenBucket:
+    """Token bucket whose rate adapts to upstream rate-limit signals.
+
+    Each call consumes one token; tokens refill at ``rate`` per second up to
+    ``burst``. When upstream answers 429 the rate is cut multiplicatively and,
+    if it sent ``Retry-After``, the bucket pauses until then. Every success
+    raises the rate additively back toward ``max_rate``.
+
+    Callers reserve their token on arrival, so they are served in FIFO
+    order and only sleep after reserving. A caller is rejected immediately
+    when the queue is full or when the wait would exceed its timeout or
+    the current deadline, however many callers are already waiting.
+    """
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: int = 10,
+        min_rate: float = 0.2,
+        max_rate: float | None = None,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.1,
+        max_waiters: int = 100,
+        max_wait: float = 5.0,
+        tokens_metric: Counter | None = None,
+        wait_metric: Histogram | None = None,
+        rate_metric: Gauge | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize token bucket.
+
+        Args:
+            rate: Initial refill rate in tokens per second
+            burst: Bucket capacity
+            min_rate: Lowest rate after repeated decreases
+            max_rate: Highest rate reached by recovery (defaults to ``rate``)
+            decrease_factor: Multiplier applied to the rate on a 429
+            increase_step: Tokens per second added to the rate per success
+            max_waiters: Maximum callers waiting for a token
+            max_wait: Default maximum seconds a caller waits
+            tokens_metric: Counter incremented per token used (optional)
+            wait_metric: Histogram of seconds spent waiting (optional)
+            rate_metric: Gauge set to the current rate (optional)
+            clock: Monotonic clock (for tests)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.max_waiters = max_waiters
+        self.max_wait = max_wait
+        self.tokens_metric = tokens_metric
+        self.wait_metric = wait_metric
+        self.rate_metric = rate_metric
+        self.clock = clock
+        self.waiters = 0
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._export_rate()
+
+    async def acquire(self, timeout: float | None = None) -> float:
+        """Wait for a token.
+
+        Args:
+            timeout: Maximum seconds to wait (defaults to ``max_wait``),
+                further capped by the current deadline
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            ThrottleQueueFullError: If too many callers are already waiting
+            ThrottleTimeoutError: If no token is available before the deadline
+        """
+        if self.waiters >= self.max_waiters:
+            raise ThrottleQueueFullError(
+                "Throttle queue is full", retry_after=self._time_until_token()
+            )
+
+        max_wait = self.max_wait if timeout is None else timeout
+        remaining = remaining_time()
+        if remaining is not None:
+            max_wait = min(max_wait, max(remaining, 0))
+
+        started_at = self.clock()
+        wait = self._time_until_token()
+        if wait > max_wait:
+            raise ThrottleTimeoutError(
+                "Throttle wait exceeds deadline", retry_after=wait
+            )
+        # Reserved tokens go negative; later callers wait for them to refill
+        self._tokens -= 1
+        if wait > 0:
+            self.waiters += 1
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._tokens = min(self._tokens + 1, float(self.burst))
+                raise
+            finally:
+                self.waiters -= 1
+
+        waited = self.clock() - started_at
+        if self.tokens_metric is not None:
+            self.tokens_metric.inc()
+        if self.wait_metric is not None:
+            self.wait_metric.observe(waited)
+        return waited
+
+    def on_rate_limited(self, retry_after: float | None = None) -> None:
+        """Slow down after upstream rejected a call with 429.
+
+        Args:
+            retry_after: Seconds upstream asked us to wait (optional)
+        """
+        self._refill()
+        self.rate = max(self.rate * self.decrease_factor, self.min_rate)
+        # Tokens already reserved by waiting callers stay reserved
+        self._tokens = min(self._tokens, 0.0)
+        if retry_after:
+            self._paused_until = max(self._paused_until, self.clock() + retry_after)
+        self._export_rate()
+
+    def on_success(self) -> None:
+        """Recover the rate after upstream accepted a call."""
+        if self.rate < self.max_rate:
+            self._refill()
+            self.rate = min(self.rate + self.increase_step, self.max_rate)
+            self._export_rate()
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last update."""
+        now = self.clock()
+        elapsed = max(now - max(self._updated_at, self._paused_until), 0.0)
+        self._tokens = min(self._tokens + elapsed * self.rate, float(self.burst))
+        self._updated_at = max(now, self._updated_at)
+
+    def _time_until_token(self) -> float:
+        """Seconds until a token is available."""
+        self._refill()
+        now = self.clock()
+        if now < self._paused_until:
+            return self._paused_until - now + max(1 - self._tokens, 0) / self.rate
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def _export_rate(self) -> None:
+        """Publish the current rate to the metric."""
+        if self.rate_metric is not None:
+            self.rate_metric.set(self.rate)
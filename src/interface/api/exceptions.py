@@ -14,6 +14,7 @@ class StandardHTTPException(HTTPException):
         error_code: str,
         message: str,
         details: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
     ) -> None:
         """Initialize standard HTTP exception.
 
@@ -22,6 +23,7 @@ class StandardHTTPException(HTTPException):
             error_code: Internal error code for client handling
             message: Human-readable error message
             details: Additional error details (optional)
+            headers: Additional response headers (optional)
         """
         detail: dict[str, Any] = {
             "error_code": error_code,
@@ -30,7 +32,7 @@ class StandardHTTPException(HTTPException):
         if details:
             detail["details"] = details
 
-        super().__init__(status_code=status_code, detail=detail)
+        super().__init__(status_code=status_code, detail=detail, headers=headers)
 
 
 # Authentication Errors
@@ -155,15 +157,36 @@ class ExternalServiceError(StandardHTTPException):
         )
 
 
+class ServiceUnavailableError(StandardHTTPException):
+    """503 Service unavailable error."""
+
+    def __init__(self, service: str, retry_after: int | None = None):
+        details: dict[str, Any] = {"service": service}
+        headers = None
+        if retry_after:
+            details["retry_after"] = retry_after
+            headers = {"Retry-After": str(retry_after)}
+
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            error_code="SERVICE_UNAVAILABLE",
+            message=f"{service} is temporarily unavailable",
+            details=details,
+            headers=headers,
+        )
+
+
 # Rate Limiting
 class RateLimitExceededError(StandardHTTPException):
     """429 Rate limit exceeded error."""
 
     def __init__(self, retry_after: int | None = None):
         details = {"retry_after": retry_after} if retry_after else None
+        headers = {"Retry-After": str(retry_after)} if retry_after else None
         super().__init__(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             error_code="RATE_LIMIT_EXCEEDED",
             message="Rate limit exceeded. Please try again later.",
             details=details,
+            headers=headers,
         )
@@ -6,8 +6,19 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from application.services.rate_limit_purge_service import RateLimitPurgeService
+from application.services.reconciliation_service import ReconciliationService
+from application.services.webhook_service import BanescoWebhookProcessor
+from infrastructure.cache.redis_cache import CacheService
 from infrastructure.config.settings import settings
-from interface.api.routes import auth, health, transactions
+from infrastructure.database.connection import AsyncSessionLocal
+from infrastructure.external.factory import (
+    create_bank_connectors,
+    create_banesco_client,
+    create_banesco_transport,
+)
+from infrastructure.rate_limit import LeasedRateLimitBackend, RedisRateLimitBackend
+from interface.api.routes import auth, health, transactions, webhooks
 
 
 # Configure logging
@@ -21,10 +32,84 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up %s v%s", settings.app_name, settings.app_version)
 
+    cache = CacheService(settings.redis_url)
+    banesco_transport = create_banesco_transport()
+    app.state.cache = cache
+    app.state.rate_limit_backend = None
+    if settings.rate_limit_backend.lower() == "redis":
+        app.state.rate_limit_backend = RedisRateLimitBackend(cache.redis_client)
+        if settings.rate_limit_lease_size > 0:
+            app.state.rate_limit_backend = LeasedRateLimitBackend(
+                app.state.rate_limit_backend,
+                lease_size=settings.rate_limit_lease_size,
+                lease_ttl=settings.rate_limit_lease_ttl,
+                min_limit=settings.rate_limit_lease_min_limit,
+            )
+            app.state.rate_limit_backend.start()
+    app.state.banesco_transport = banesco_transport
+    app.state.banesco_client = create_banesco_client(banesco_transport, cache)
+    app.state.bank_connectors = create_bank_connectors(
+        app.state.banesco_client,
+        banesco_transport,
+        session_factory=AsyncSessionLocal,
+        rate_limit_backend=app.state.rate_limit_backend,
+    )
+    if settings.banesco_auth_url:
+        app.state.banesco_client.credential_pool.start_background_refresh()
+
+    # A replayed cassette has no connections to warm
+    if (
+        settings.banesco_prewarm_connections > 0
+        and settings.banesco_cassette_mode.lower() != "replay"
+    ):
+        await banesco_transport.warm_up(
+            [settings.banesco_api_url, settings.banesco_auth_url],
+            connections_per_host=settings.banesco_prewarm_connections,
+        )
+
+    app.state.reconciliation_service = ReconciliationService(
+        AsyncSessionLocal,
+        app.state.banesco_client,
+        banesco_rate_limit=settings.banesco_rate_limit,
+        rate_limit_backend=app.state.rate_limit_backend,
+        interval=settings.reconciliation_interval,
+        batch_size=settings.reconciliation_batch_size,
+        base_delay=settings.reconciliation_base_delay,
+        max_delay=settings.reconciliation_max_delay,
+        doubling_age=settings.reconciliation_doubling_age,
+        max_age=settings.reconciliation_max_age,
+    )
+    if settings.reconciliation_enabled and settings.banesco_auth_url:
+        app.state.reconciliation_service.start()
+
+    app.state.webhook_processor = BanescoWebhookProcessor(
+        AsyncSessionLocal,
+        queue_size=settings.banesco_webhook_queue_size,
+        batch_size=settings.banesco_webhook_batch_size,
+        flush_interval=settings.banesco_webhook_flush_interval,
+    )
+    app.state.webhook_processor.start()
+
+    app.state.rate_limit_purge_service = RateLimitPurgeService(
+        AsyncSessionLocal,
+        interval=settings.rate_limit_purge_interval,
+        retention=settings.rate_limit_purge_retention,
+        batch_size=settings.rate_limit_purge_batch_size,
+    )
+    if settings.rate_limit_purge_enabled:
+        app.state.rate_limit_purge_service.start()
+
     yield
 
     # Shutdown
     logger.info("Shutting down %s", settings.app_name)
+    await app.state.webhook_processor.stop()
+    await app.state.reconciliation_service.stop()
+    await app.state.rate_limit_purge_service.stop()
+    if isinstance(app.state.rate_limit_backend, LeasedRateLimitBackend):
+        await app.state.rate_limit_backend.stop()
+    await app.state.bank_connectors.close()
+    await cache.close()
 
 
 # Create FastAPI application
@@ -51,6 +136,7 @@ app.add_middleware(
 app.include_router(health.router, tags=["Health"])
 app.include_router(auth.router, tags=["Authentication"])
 app.include_router(transactions.router)  # Router already has tags defined
+app.include_router(webhooks.router)
 
 
 # Root endpoint
@@ -1,5 +1,5 @@
 """API routes package."""
 
-from interface.api.routes import auth, health, transactions
+from interface.api.routes import auth, health, transactions, webhooks
 
-__all__ = ["auth", "health", "transactions"]
+__all__ = ["auth", "health", "transactions", "webhooks"]
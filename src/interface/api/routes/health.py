@@ -1,6 +1,6 @@
 """Health check routes."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
 router = APIRouter()
 
@@ -16,3 +16,16 @@ async def readiness_check():
     """Readiness check endpoint."""
     # TODO: Add database and external services checks
     return {"status": "ready", "service": "areamedica-api"}
+
+
+@router.get("/health/banks")
+async def bank_health_check(request: Request) -> dict:
+    """Health of each bank connector."""
+    reports = await request.app.state.bank_connectors.health()
+    return {
+        "status": "healthy" if all(r.healthy for r in reports) else "degraded",
+        "banks": [
+            {"bank": r.bank.value, "healthy": r.healthy, "details": r.details}
+            for r in reports
+        ],
+    }
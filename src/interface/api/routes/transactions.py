@@ -1,24 +1,53 @@
 """Transaction API routes."""
 
+import math
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from application.dto.transaction_dto import (
+    BankStatusItem,
+    BankStatusLookupResponse,
+    BanescoStatusResponse,
     CreateTransactionRequest,
     TransactionListResponse,
     TransactionResponse,
 )
+from application.services.rate_limit_service import (
+    RateLimitDeferralError,
+    RateLimitService,
+)
 from application.services.transaction_service import TransactionService
 from domain.entities.transaction import BankType, TransactionStatus, TransactionType
 from domain.entities.user import User
+from infrastructure.config.settings import settings
 from infrastructure.database.connection import get_db_session
 from infrastructure.database.repositories.transaction_repository import (
     TransactionRepository,
 )
+from infrastructure.external.bank_connectors import (
+    BankConnectorRegistry,
+    UnsupportedBankError,
+)
+from infrastructure.external.banesco_client import (
+    BanescoAPIError,
+    BanescoCircuitOpenError,
+    BanescoClient,
+    BanescoNotFoundError,
+    BanescoRateLimitError,
+    BanescoTimeoutError,
+)
+from infrastructure.resilience import DeadlineExceededError, deadline_scope
 from interface.api.routes.auth import get_current_user
-from interface.api.exceptions import NotFoundError, ValidationError, AlreadyExistsError
+from interface.api.exceptions import (
+    AlreadyExistsError,
+    ExternalServiceError,
+    NotFoundError,
+    RateLimitExceededError,
+    ServiceUnavailableError,
+    ValidationError,
+)
 
 router = APIRouter(prefix="/api/v1/transactions", tags=["Transactions"])
 
@@ -31,6 +60,40 @@ def get_transaction_service(
     return TransactionService(transaction_repo=transaction_repo)
 
 
+def get_rate_limit_service(
+    request: Request,
+    session: AsyncSession = Depends(get_db_session),
+) -> RateLimitService:
+    """Dependency to get rate limit service."""
+    return RateLimitService(
+        session,
+        banesco_rate_limit=settings.banesco_rate_limit,
+        max_deferred_waiters=settings.banesco_rate_limit_defer_max_waiters,
+        redis_backend=getattr(request.app.state, "rate_limit_backend", None),
+    )
+
+
+def get_banesco_client(request: Request) -> BanescoClient:
+    """Dependency to get the application-scoped Banesco client."""
+    return request.app.state.banesco_client
+
+
+def _bank_error_message(error: BaseException) -> str:
+    """Fixed client-facing message for a failed bank lookup."""
+    if isinstance(error, (TimeoutError, BanescoTimeoutError, DeadlineExceededError)):
+        return "Bank did not answer in time"
+    if isinstance(error, BanescoRateLimitError):
+        return "Rate limit exceeded for this transaction"
+    if isinstance(error, BanescoCircuitOpenError):
+        return "Bank temporarily unavailable"
+    return "Lookup failed"
+
+
+def get_bank_connectors(request: Request) -> BankConnectorRegistry:
+    """Dependency to get the application-scoped bank connectors."""
+    return request.app.state.bank_connectors
+
+
 @router.post(
     "",
     response_model=TransactionResponse,
@@ -261,3 +324,158 @@ async def get_transaction_by_transaction_id(
         created_at=transaction.created_at.isoformat(),
         updated_at=transaction.updated_at.isoformat(),
     )
+
+
+@router.get(
+    "/external/{transaction_id}/banesco-status",
+    response_model=BanescoStatusResponse,
+    summary="Get transaction status from Banesco",
+    description="Query Banesco for the current status of a transaction",
+)
+async def get_banesco_transaction_status(
+    transaction_id: str,
+    response: Response,
+    request_timeout: float | None = Header(
+        None,
+        alias="X-Request-Timeout",
+        gt=0,
+        description="Seconds the caller will wait (capped by the server default)",
+    ),
+    current_user: User = Depends(get_current_user),
+    banesco_client: BanescoClient = Depends(get_banesco_client),
+    rate_limit_service: RateLimitService = Depends(get_rate_limit_service),
+    session: AsyncSession = Depends(get_db_session),
+) -> BanescoStatusResponse:
+    """
+    Get the upstream Banesco status of a transaction.
+
+    Cached results are returned without counting against the limit of
+    BANESCO_RATE_LIMIT Banesco queries per minute per transaction_id.
+    If Banesco fails, the last good response is returned with stale=true,
+    its age and a Warning header. Returns 503 with Retry-After while Banesco
+    calls are short-circuited and no previous response is available.
+
+    The Banesco lookup (token, retries and backoff) is bounded by
+    BANESCO_REQUEST_DEADLINE seconds, or by X-Request-Timeout if shorter.
+
+    With BANESCO_RATE_LIMIT_DEFER enabled, a request over the limit waits
+    for the next window instead of failing when that window opens within
+    the deadline; concurrent requests for the same transaction then share
+    one Banesco call.
+    """
+    try:
+        data = await banesco_client.get_cached_transaction_status(transaction_id)
+        if data is not None:
+            return BanescoStatusResponse(transaction_id=transaction_id, data=data)
+
+        deadline = settings.banesco_request_deadline
+        if request_timeout is not None:
+            deadline = min(deadline, request_timeout)
+        with deadline_scope(deadline):
+            if settings.banesco_rate_limit_defer:
+                result = await rate_limit_service.execute_or_defer(
+                    "TRANSACTION_ID",
+                    transaction_id,
+                    lambda: banesco_client.get_transaction_status_result(
+                        transaction_id
+                    ),
+                    max_wait=settings.banesco_rate_limit_defer_max_wait,
+                    min_run_time=settings.banesco_min_attempt_time,
+                )
+            else:
+                decision = await rate_limit_service.try_acquire(
+                    "TRANSACTION_ID", transaction_id
+                )
+                if not decision.allowed:
+                    raise RateLimitExceededError(
+                        retry_after=max(math.ceil(decision.retry_after), 1)
+                    )
+                await session.commit()
+                result = await banesco_client.get_transaction_status_result(
+                    transaction_id
+                )
+    except RateLimitDeferralError as e:
+        raise RateLimitExceededError(
+            retry_after=max(math.ceil(e.retry_after), 1)
+        ) from e
+    except BanescoNotFoundError as e:
+        raise NotFoundError(
+            resource="Banesco transaction", identifier=transaction_id
+        ) from e
+    except BanescoCircuitOpenError as e:
+        raise ServiceUnavailableError(
+            service="Banesco", retry_after=max(math.ceil(e.retry_after), 1)
+        ) from e
+    except BanescoRateLimitError as e:
+        raise RateLimitExceededError(
+            retry_after=math.ceil(e.retry_after) if e.retry_after else None
+        ) from e
+    except (BanescoTimeoutError, BanescoAPIError, DeadlineExceededError) as e:
+        raise ExternalServiceError(service="Banesco", message=str(e)) from e
+
+    if result.stale:
+        response.headers["Warning"] = '110 - "Response is Stale"'
+        response.headers["Age"] = str(int(result.age_seconds or 0))
+
+    return BanescoStatusResponse(
+        transaction_id=transaction_id,
+        data=result.data,
+        stale=result.stale,
+        age_seconds=result.age_seconds,
+    )
+
+
+@router.get(
+    "/reference/{reference}/bank-status",
+    response_model=BankStatusLookupResponse,
+    summary="Look up a reference at several banks",
+    description="Query every integrated bank (or the given ones) concurrently",
+)
+async def get_bank_statuses_by_reference(
+    reference: str,
+    banks: list[BankType] | None = Query(
+        None, alias="bank", description="Banks to query (default: all integrated)"
+    ),
+    current_user: User = Depends(get_current_user),
+    service: TransactionService = Depends(get_transaction_service),
+    bank_connectors: BankConnectorRegistry = Depends(get_bank_connectors),
+) -> BankStatusLookupResponse:
+    """
+    Look up the transaction with a reference at several banks at once.
+
+    The reference is resolved to its transaction, whose transaction_id is
+    what the banks are queried for. Each bank is queried through its own
+    connector, with its own connection
+    pool, concurrency limit and circuit breaker, and may take up to
+    BANK_LOOKUP_TIMEOUT seconds; banks that fail or do not answer in time
+    are reported with an error instead of failing the whole lookup.
+    Banesco lookups count against the same BANESCO_RATE_LIMIT per
+    transaction_id as /banesco-status; a transaction over the limit is
+    reported as a Banesco error.
+    """
+    transaction = await service.get_transaction_by_reference(reference)
+    if not transaction:
+        raise NotFoundError(resource="Transaction", identifier=reference)
+
+    try:
+        results = await bank_connectors.fan_out(transaction.transaction_id, banks=banks)
+    except UnsupportedBankError as e:
+        raise ValidationError(
+            message=str(e),
+            details={"supported_banks": [b.value for b in bank_connectors.banks]},
+        ) from e
+
+    return BankStatusLookupResponse(
+        reference=reference,
+        transaction_id=transaction.transaction_id,
+        results=[
+            BankStatusItem(
+                bank=bank,
+                found=result.found,
+                data=result.data,
+                stale=result.stale,
+                error=None if result.ok else _bank_error_message(result.error),
+            )
+            for bank, result in results.items()
+        ],
+    )
@@ -0,0 +1,72 @@
+"""Webhook routes for bank notifications."""
+
+from fastapi import APIRouter, Depends, Header, Request, status
+from pydantic import ValidationError as PydanticValidationError
+
+from application.dto.transaction_dto import (
+    BanescoWebhookNotification,
+    WebhookAcceptedResponse,
+)
+from application.services.webhook_service import BanescoWebhookProcessor
+from infrastructure.config.settings import settings
+from infrastructure.external.banesco_webhooks import verify_webhook
+from infrastructure.monitoring.metrics import banesco_webhook_notifications_total
+from interface.api.exceptions import (
+    ServiceUnavailableError,
+    UnauthorizedError,
+    ValidationError,
+)
+
+router = APIRouter(prefix="/api/v1/webhooks", tags=["Webhooks"])
+
+
+def get_webhook_processor(request: Request) -> BanescoWebhookProcessor:
+    """Dependency to get the application-scoped webhook processor."""
+    return request.app.state.webhook_processor
+
+
+@router.post(
+    "/banesco",
+    response_model=WebhookAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Receive a Banesco status notification",
+    description="Verifies a signed Banesco notification and queues it for processing",
+)
+async def receive_banesco_webhook(
+    request: Request,
+    x_banesco_signature: str | None = Header(None),
+    x_banesco_timestamp: str | None = Header(None),
+    processor: BanescoWebhookProcessor = Depends(get_webhook_processor),
+) -> WebhookAcceptedResponse:
+    """
+    Receive a Banesco transaction status notification.
+
+    The notification is acknowledged as soon as it is queued; its status is
+    applied shortly after, together with other queued notifications.
+    """
+    body = await request.body()
+    if not verify_webhook(
+        settings.banesco_webhook_secret,
+        x_banesco_timestamp,
+        body,
+        x_banesco_signature,
+        tolerance=settings.banesco_webhook_tolerance,
+    ):
+        banesco_webhook_notifications_total.labels(result="rejected").inc()
+        raise UnauthorizedError(message="Invalid webhook signature")
+
+    try:
+        notification = BanescoWebhookNotification.model_validate_json(body)
+    except PydanticValidationError as e:
+        raise ValidationError(
+            message="Invalid webhook payload",
+            details={"errors": e.errors(include_url=False, include_context=False)},
+        ) from e
+
+    if not processor.submit(notification):
+        raise ServiceUnavailableError(
+            service="Webhook processing",
+            retry_after=max(1, round(processor.flush_interval)),
+        )
+
+    return WebhookAcceptedResponse()
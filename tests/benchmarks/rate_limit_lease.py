@@ -0,0 +1,321 @@
+"""Benchmark of leased against per-request rate limiting.
+
+Several simulated processes hammer one hot resource, each through its own
+limiter, and the run reports the round trips to the shared counter, the
+requests admitted and the most admitted in any window, first with one
+round trip per request and then with leases.
+
+The shared counter is Redis when ``--redis-url`` is given, otherwise an
+in-memory stand-in with the same semantics that adds ``--latency`` seconds
+per round trip::
+
+    PYTHONPATH=src python tests/benchmarks/rate_limit_lease.py --processes 4 \\
+        --requests 2000 --limit 1000 --lease-size 20 --latency 0.0005
+"""
+
+import argparse
+import asyncio
+import bisect
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+
+from infrastructure.rate_limit import (
+    LeasedRateLimitBackend,
+    LeaseGrant,
+    RateLimitBackend,
+    RateLimitDecision,
+    RedisRateLimitBackend,
+)
+
+RESOURCE = ("BENCHMARK", "hot-key")
+
+
+class InMemoryRedisBackend(RedisRateLimitBackend):
+    """Sliding-window log in memory, behaving like the Redis scripts."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Initialize in-memory backend.
+
+        Args:
+            latency: Seconds added to every call, like a network round trip
+        """
+        self.latency = latency
+        self.log: dict[str, list[tuple[float, str]]] = defaultdict(list)
+
+    async def acquire(
+        self,
+        resource_type: str,
+        resource_identifier: str,
+        limit: int | None,
+        window: float,
+    ) -> RateLimitDecision:
+        """Count one request if it fits."""
+        grant = await self.lease(resource_type, resource_identifier, 1, limit, window)
+        return RateLimitDecision(
+            allowed=grant.granted > 0, count=grant.count, retry_after=grant.retry_after
+        )
+
+    async def lease(
+        self,
+        resource_type: str,
+        resource_identifier: str,
+        tokens: int,
+        limit: int | None,
+        window: float,
+    ) -> LeaseGrant:
+        """Count up to ``tokens`` requests, as many as fit."""
+        await self._round_trip()
+        now = time.monotonic()
+        log = self._trim(resource_type, resource_identifier, now, window)
+        lease_id = uuid.uuid4().hex
+        granted = tokens if limit is None else min(tokens, limit - len(log))
+        if granted <= 0:
+            return LeaseGrant(
+                lease_id=lease_id,
+                granted=0,
+                count=len(log),
+                retry_after=log[0][0] + window - now if log else window,
+            )
+        log.extend((now, f"{lease_id}:{i}") for i in range(1, granted + 1))
+        return LeaseGrant(lease_id=lease_id, granted=granted, count=len(log))
+
+    async def release(
+        self,
+        resource_type: str,
+        resource_identifier: str,
+        grant: LeaseGrant,
+        unused: int,
+    ) -> None:
+        """Uncount the last ``unused`` tokens of a lease."""
+        await self._round_trip()
+        members = {
+            f"{grant.lease_id}:{i}"
+            for i in range(grant.granted - unused + 1, grant.granted + 1)
+        }
+        key = self._key(resource_type, resource_identifier)
+        self.log[key] = [entry for entry in self.log[key] if entry[1] not in members]
+
+    async def count(
+        self, resource_type: str, resource_identifier: str, window: float
+    ) -> int:
+        """Requests counted in the last ``window`` seconds."""
+        await self._round_trip()
+        return len(
+            self._trim(resource_type, resource_identifier, time.monotonic(), window)
+        )
+
+    async def reset(self, resource_type: str, resource_identifier: str) -> None:
+        """Forget a resource's requests."""
+        await self._round_trip()
+        self.log.pop(self._key(resource_type, resource_identifier), None)
+
+    def _key(self, resource_type: str, resource_identifier: str) -> str:
+        """Log key of a resource."""
+        return f"{resource_type}:{resource_identifier}"
+
+    def _trim(
+        self, resource_type: str, resource_identifier: str, now: float, window: float
+    ) -> list[tuple[float, str]]:
+        """Drop entries older than the window and return the rest."""
+        key = self._key(resource_type, resource_identifier)
+        self.log[key] = [entry for entry in self.log[key] if entry[0] > now - window]
+        return self.log[key]
+
+    async def _round_trip(self) -> None:
+        """Wait like a network round trip."""
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        else:
+            await asyncio.sleep(0)
+
+
+class RoundTripCounter(RedisRateLimitBackend):
+    """Counts the calls that reach the shared counter."""
+
+    def __init__(self, backend: RedisRateLimitBackend) -> None:
+        """Initialize counter.
+
+        Args:
+            backend: Shared counter to forward calls to
+        """
+        self.backend = backend
+        self.round_trips = 0
+
+    async def acquire(self, *args: object) -> RateLimitDecision:
+        """Forward an acquisition."""
+        self.round_trips += 1
+        return await self.backend.acquire(*args)
+
+    async def lease(self, *args: object) -> LeaseGrant:
+        """Forward a lease."""
+        self.round_trips += 1
+        return await self.backend.lease(*args)
+
+    async def release(self, *args: object) -> None:
+        """Forward a release."""
+        self.round_trips += 1
+        await self.backend.release(*args)
+
+    async def count(self, *args: object) -> int:
+        """Forward a count."""
+        self.round_trips += 1
+        return await self.backend.count(*args)
+
+    async def reset(self, *args: object) -> None:
+        """Forward a reset."""
+        await self.backend.reset(*args)
+
+
+@dataclass
+class BenchmarkResult:
+    """Outcome of one benchmark run."""
+
+    mode: str
+    requests: int
+    admitted: int
+    max_admitted_per_window: int
+    round_trips: int
+    elapsed: float
+
+    @property
+    def requests_per_round_trip(self) -> float:
+        """Requests decided per call to the shared counter."""
+        return self.requests / max(self.round_trips, 1)
+
+
+def max_in_window(timestamps: list[float], window: float) -> int:
+    """Most timestamps in any interval of ``window`` seconds."""
+    timestamps = sorted(timestamps)
+    return max(
+        (
+            bisect.bisect_left(timestamps, t + window) - i
+            for i, t in enumerate(timestamps)
+        ),
+        default=0,
+    )
+
+
+async def run_benchmark(
+    backend: RedisRateLimitBackend,
+    processes: int = 4,
+    requests: int = 1000,
+    concurrency: int = 10,
+    limit: int = 500,
+    window: float = 60.0,
+    lease_size: int = 0,
+    lease_ttl: float = 5.0,
+) -> BenchmarkResult:
+    """Send ``requests`` per process for one resource and measure the limiter.
+
+    Args:
+        backend: Shared counter (Redis or ``InMemoryRedisBackend``)
+        processes: Simulated processes, each with its own limiter
+        requests: Requests sent by each process
+        concurrency: Requests in flight per process
+        limit: Requests allowed per window
+        window: Window in seconds
+        lease_size: Tokens per lease (0: one round trip per request)
+        lease_ttl: Seconds a lease is used before its leftovers go back
+    """
+    counter = RoundTripCounter(backend)
+    await backend.reset(*RESOURCE)
+    limiters: list[RateLimitBackend] = [
+        LeasedRateLimitBackend(
+            counter, lease_size=lease_size, lease_ttl=lease_ttl, min_limit=1
+        )
+        if lease_size > 0
+        else counter
+        for _ in range(processes)
+    ]
+    admitted_at: list[float] = []
+
+    async def send(limiter: RateLimitBackend, count: int) -> None:
+        for _ in range(count):
+            decision = await limiter.acquire(*RESOURCE, limit, window)
+            if decision.allowed:
+                admitted_at.append(time.monotonic())
+
+    started_at = time.perf_counter()
+    await asyncio.gather(
+        *(
+            send(limiter, requests // concurrency)
+            for limiter in limiters
+            for _ in range(concurrency)
+        )
+    )
+    elapsed = time.perf_counter() - started_at
+    for limiter in limiters:
+        if isinstance(limiter, LeasedRateLimitBackend):
+            await limiter.stop()
+    await backend.reset(*RESOURCE)
+
+    return BenchmarkResult(
+        mode=f"leased ({lease_size})" if lease_size > 0 else "per request",
+        requests=processes * (requests // concurrency) * concurrency,
+        admitted=len(admitted_at),
+        max_admitted_per_window=max_in_window(admitted_at, window),
+        round_trips=counter.round_trips,
+        elapsed=elapsed,
+    )
+
+
+async def _main(args: argparse.Namespace) -> None:
+    """Run both modes and print a comparison."""
+    client = None
+    if args.redis_url:
+        import redis.asyncio as redis
+
+        client = redis.from_url(args.redis_url, decode_responses=True)
+        backend: RedisRateLimitBackend = RedisRateLimitBackend(
+            client, prefix=f"benchmark-{uuid.uuid4().hex}"
+        )
+    else:
+        backend = InMemoryRedisBackend(latency=args.latency)
+
+    print(
+        f"{'mode':<14}{'requests':>10}{'admitted':>10}{'max/window':>12}"
+        f"{'round trips':>13}{'req/trip':>10}{'seconds':>10}"
+    )
+    for lease_size in (0, args.lease_size):
+        result = await run_benchmark(
+            backend,
+            processes=args.processes,
+            requests=args.requests,
+            concurrency=args.concurrency,
+            limit=args.limit,
+            window=args.window,
+            lease_size=lease_size,
+            lease_ttl=args.lease_ttl,
+        )
+        print(
+            f"{result.mode:<14}{result.requests:>10}{result.admitted:>10}"
+            f"{result.max_admitted_per_window:>12}{result.round_trips:>13}"
+            f"{result.requests_per_round_trip:>10.1f}{result.elapsed:>10.3f}"
+        )
+    print(
+        f"bound with leases: limit + processes * lease_size = "
+        f"{args.limit + args.processes * args.lease_size}"
+    )
+    if client is not None:
+        await client.aclose()
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--redis-url", default="")
+    parser.add_argument("--latency", type=float, default=0.0005)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--window", type=float, default=60.0)
+    parser.add_argument("--lease-size", type=int, default=20)
+    parser.add_argument("--lease-ttl", type=float, default=5.0)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
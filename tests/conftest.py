@@ -5,16 +5,20 @@ import os
 from collections.abc import AsyncGenerator
 from uuid import uuid4
 
+import httpx
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
+from infrastructure.cache.redis_cache import CacheService
 from infrastructure.database.models.base import Base
 from infrastructure.database.models.transaction import TransactionModel
 from infrastructure.database.models.user import UserModel
+from infrastructure.external.banesco_client import BanescoClient, BanescoOAuth2Client
 from interface.api.main import app
+from stubs.banesco_server import BanescoStandIn, create_app
 
 
 # Test database URL - use the development database for tests
@@ -24,6 +28,85 @@ TEST_DATABASE_URL = "postgresql+asyncpg://areamedica:password@db:5432/areamedica
 os.environ["SECRET_KEY"] = "test-secret-key"
 
 
+class InMemoryCacheService(CacheService):
+    """CacheService stand-in that keeps values in a dict instead of Redis."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, object] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key: str):
+        return self.store.get(key)
+
+    async def set(self, key: str, value, ttl: int = 300) -> bool:
+        self.store[key] = value
+        self.ttls[key] = ttl
+        return True
+
+    async def delete(self, key: str) -> bool:
+        self.ttls.pop(key, None)
+        return self.store.pop(key, None) is not None
+
+    async def exists(self, key: str) -> bool:
+        return key in self.store
+
+    async def ping(self) -> bool:
+        return True
+
+    async def acquire_lock(self, key: str, ttl: int = 30) -> str | None:
+        if key in self.store:
+            return None
+        self.store[key] = "lock-token"
+        return "lock-token"
+
+    async def release_lock(self, key: str, token: str) -> bool:
+        if self.store.get(key) != token:
+            return False
+        del self.store[key]
+        return True
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def memory_cache() -> InMemoryCacheService:
+    """Create an in-memory cache service."""
+    return InMemoryCacheService()
+
+
+@pytest.fixture
+def banesco_stand_in() -> BanescoStandIn:
+    """Create a local Banesco API stand-in; tweak ``.config`` per test."""
+    return BanescoStandIn()
+
+
+@pytest_asyncio.fixture
+async def banesco_stand_in_client(
+    banesco_stand_in: BanescoStandIn,
+) -> AsyncGenerator[BanescoClient, None]:
+    """Create a BanescoClient talking to the stand-in in-process over ASGI."""
+    http_client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=create_app(banesco_stand_in))
+    )
+    oauth_client = BanescoOAuth2Client(
+        auth_url="http://banesco/oauth/token",
+        client_id="test-client-id",
+        client_secret="test-client-secret",
+        http_client=http_client,
+    )
+    client = BanescoClient(
+        base_url="http://banesco",
+        oauth_client=oauth_client,
+        http_client=http_client,
+    )
+
+    yield client
+
+    await client.close()
+    await http_client.aclose()
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
@@ -1,16 +1,30 @@
 """Integration tests for Banesco client."""
 
+import asyncio
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
+from prometheus_client import REGISTRY
+from stubs.banesco_server import BanescoStandIn
 
+from infrastructure.cache.redis_cache import CacheService
 from infrastructure.external.banesco_client import (
+    BanescoCircuitOpenError,
     BanescoClient,
     BanescoNotFoundError,
     BanescoOAuth2Client,
     BanescoRateLimitError,
     BanescoTimeoutError,
+    parse_retry_after,
+)
+from infrastructure.rate_limit import RateLimitDecision
+from infrastructure.resilience import (
+    AdaptiveTokenBucket,
+    CircuitBreaker,
+    Hedger,
+    RetryBudget,
 )
 
 
@@ -46,6 +60,219 @@ class TestBanescoOAuth2Client:
         assert token == "new-access-token"
         assert oauth_client.access_token == "new-access-token"
 
+    @pytest.mark.asyncio
+    async def test_token_refresh_uses_shared_client(self) -> None:
+        """Test token refresh reuses the injected client and records latency."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, json={"access_token": "shared-token", "expires_in": 3600}
+            )
+
+        shared_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        oauth_client = BanescoOAuth2Client(
+            auth_url="https://api.banesco.com/oauth/token",
+            client_id="test-client-id",
+            client_secret="test-client-secret",
+            http_client=shared_client,
+        )
+        labels = {"operation": "oauth_token"}
+        before = (
+            REGISTRY.get_sample_value("banesco_api_duration_seconds_count", labels) or 0
+        )
+
+        token = await oauth_client.get_access_token()
+        await oauth_client.close()
+
+        assert token == "shared-token"
+        assert oauth_client.http_client is shared_client
+        assert not shared_client.is_closed
+        assert (
+            REGISTRY.get_sample_value("banesco_api_duration_seconds_count", labels)
+            == before + 1
+        )
+        await shared_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_token_refresh_time_is_recorded(
+        self, oauth_client: BanescoOAuth2Client
+    ) -> None:
+        """Test obtaining a token records its duration and attempt count."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"access_token": "t", "expires_in": 3600}
+        mock_response.raise_for_status = Mock()
+        before = (
+            REGISTRY.get_sample_value("banesco_token_refresh_duration_seconds_count")
+            or 0
+        )
+        attempts_before = (
+            REGISTRY.get_sample_value(
+                "banesco_api_attempts_count", {"operation": "oauth_token"}
+            )
+            or 0
+        )
+
+        with patch("httpx.AsyncClient.post", return_value=mock_response):
+            await oauth_client.get_access_token()
+
+        assert (
+            REGISTRY.get_sample_value("banesco_token_refresh_duration_seconds_count")
+            == before + 1
+        )
+        assert (
+            REGISTRY.get_sample_value(
+                "banesco_api_attempts_count", {"operation": "oauth_token"}
+            )
+            == attempts_before + 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_valid_token_is_read_without_lock(
+        self, oauth_client: BanescoOAuth2Client
+    ) -> None:
+        """Test readers do not wait on the lock while a valid token exists."""
+        oauth_client.access_token = "cached-token"
+        oauth_client.token_expires_at = datetime.utcnow() + timedelta(minutes=10)
+
+        async with oauth_client._lock:
+            token = await asyncio.wait_for(oauth_client.get_access_token(), 1)
+
+        assert token == "cached-token"
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_renews_before_expiry(
+        self, oauth_client: BanescoOAuth2Client
+    ) -> None:
+        """Test the background task renews a token that is about to expire."""
+        oauth_client.access_token = "old-token"
+        oauth_client.token_expires_at = datetime.utcnow() + timedelta(seconds=60)
+        oauth_client.refresh_ahead = 120
+        oauth_client.min_refresh_interval = 0.01
+        refreshed = asyncio.Event()
+
+        async def fake_refresh() -> None:
+            oauth_client.access_token = "renewed-token"
+            oauth_client.token_expires_at = datetime.utcnow() + timedelta(hours=1)
+            refreshed.set()
+
+        with patch.object(oauth_client, "_request_new_token", side_effect=fake_refresh):
+            oauth_client.start_background_refresh()
+            await asyncio.wait_for(refreshed.wait(), 1)
+            await oauth_client.stop_background_refresh()
+
+        assert oauth_client.access_token == "renewed-token"
+        assert oauth_client._refresh_task is None
+
+    @pytest.mark.asyncio
+    async def test_short_lived_token_is_renewed_halfway(
+        self, oauth_client: BanescoOAuth2Client, mock_cache: Mock
+    ) -> None:
+        """Test a token shorter than refresh_ahead is renewed halfway through."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"access_token": "t", "expires_in": 120}
+        mock_response.raise_for_status = Mock()
+        oauth_client.refresh_jitter = 0
+
+        with patch("httpx.AsyncClient.post", return_value=mock_response):
+            await oauth_client.get_access_token()
+
+        # 108s lifetime after the buffer, renewed with half of it left
+        assert oauth_client.token_lifetime == 108
+        assert 53 < oauth_client._seconds_until_refresh() <= 54
+
+        # Another worker's token of the same lifetime is still adopted
+        mock_cache.get.return_value = {
+            "access_token": "shared-token",
+            "expires_at": oauth_client.token_expires_at.isoformat(),
+            "lifetime": oauth_client.token_lifetime,
+        }
+        oauth_client.cache = mock_cache
+        assert await oauth_client._load_shared_token(oauth_client._refresh_margin())
+        assert oauth_client.access_token == "shared-token"
+
+    def test_expired_token_waits_the_minimum_interval(
+        self, oauth_client: BanescoOAuth2Client
+    ) -> None:
+        """Test the refresh loop never spins without sleeping."""
+        oauth_client.access_token = "old-token"
+        oauth_client.token_expires_at = datetime.utcnow() - timedelta(seconds=1)
+
+        assert oauth_client._seconds_until_refresh() == 1.0
+
+    @pytest.fixture
+    def mock_cache(self) -> Mock:
+        """Create mock cache service."""
+        cache = Mock(spec=CacheService)
+        cache.get_banesco_token_cache_key.return_value = "banesco:oauth:token:test"
+        cache.get_banesco_token_lock_key.return_value = "banesco:oauth:lock:test"
+        cache.get = AsyncMock(return_value=None)
+        cache.set = AsyncMock(return_value=True)
+        cache.acquire_lock = AsyncMock(return_value="lock-token")
+        cache.release_lock = AsyncMock(return_value=True)
+        cache.ping = AsyncMock(return_value=True)
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_shared_token_is_adopted_from_cache(
+        self, oauth_client: BanescoOAuth2Client, mock_cache: Mock
+    ) -> None:
+        """Test a token published by another worker is reused."""
+        expires_at = datetime.utcnow() + timedelta(minutes=30)
+        mock_cache.get.return_value = {
+            "access_token": "shared-token",
+            "expires_at": expires_at.isoformat(),
+        }
+        oauth_client.cache = mock_cache
+
+        with patch.object(oauth_client, "_request_new_token") as request_token:
+            token = await oauth_client.get_access_token()
+
+        assert token == "shared-token"
+        assert oauth_client.token_expires_at == expires_at
+        request_token.assert_not_called()
+        mock_cache.acquire_lock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lock_holder_refreshes_and_publishes_token(
+        self, oauth_client: BanescoOAuth2Client, mock_cache: Mock
+    ) -> None:
+        """Test the worker holding the lock refreshes and shares the token."""
+        oauth_client.cache = mock_cache
+
+        async def fake_refresh() -> None:
+            oauth_client.access_token = "fresh-token"
+            oauth_client.token_expires_at = datetime.utcnow() + timedelta(hours=1)
+
+        with patch.object(oauth_client, "_request_new_token", side_effect=fake_refresh):
+            token = await oauth_client.get_access_token()
+
+        assert token == "fresh-token"
+        stored_key, stored_value = mock_cache.set.call_args.args
+        assert stored_key == "banesco:oauth:token:test"
+        assert stored_value["access_token"] == "fresh-token"
+        mock_cache.release_lock.assert_awaited_once_with(
+            "banesco:oauth:lock:test", "lock-token"
+        )
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_refresh_when_redis_down(
+        self, oauth_client: BanescoOAuth2Client, mock_cache: Mock
+    ) -> None:
+        """Test the token is refreshed in-process when Redis is unavailable."""
+        mock_cache.acquire_lock.return_value = None
+        mock_cache.ping.return_value = False
+        oauth_client.cache = mock_cache
+
+        async def fake_refresh() -> None:
+            oauth_client.access_token = "local-token"
+            oauth_client.token_expires_at = datetime.utcnow() + timedelta(hours=1)
+
+        with patch.object(oauth_client, "_request_new_token", side_effect=fake_refresh):
+            token = await oauth_client.get_access_token()
+
+        assert token == "local-token"
+        mock_cache.set.assert_not_called()
+
 
 class TestBanescoClient:
     """Test suite for BanescoClient."""
@@ -112,6 +339,44 @@ class TestBanescoClient:
         with pytest.raises(BanescoRateLimitError):
             await banesco_client.get_transaction_status("REF123")
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_retry_after_is_honored(
+        self, banesco_client: BanescoClient
+    ) -> None:
+        """Test a 429 Retry-After pauses the throttle for later callers."""
+        credential = banesco_client.credential_pool.credentials[0]
+        credential.throttle = AdaptiveTokenBucket(rate=10.0, burst=5, max_wait=1)
+        mock_response = Mock()
+        mock_response.status_code = 429
+        mock_response.headers = {"Retry-After": "30"}
+        banesco_client.client.get = AsyncMock(return_value=mock_response)
+
+        with pytest.raises(BanescoRateLimitError) as first:
+            await banesco_client.get_transaction_status("REF123")
+        with pytest.raises(BanescoRateLimitError) as second:
+            await banesco_client.get_transaction_status("REF123")
+
+        assert first.value.retry_after == 30
+        assert second.value.retry_after == pytest.approx(30, abs=1)
+        assert credential.throttle.rate == 5.0
+        assert banesco_client.client.get.await_count == 1
+
+    def test_parse_retry_after(self) -> None:
+        """Test Retry-After parsing for seconds, dates and invalid values."""
+        assert parse_retry_after("12") == 12
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_parse_retry_after_rejects_unusable_values(self) -> None:
+        """Test non-finite and negative values are ignored, huge ones capped."""
+        assert parse_retry_after("inf") is None
+        assert parse_retry_after("nan") is None
+        assert parse_retry_after("-5") is None
+        assert parse_retry_after("1e12") == 300
+        assert parse_retry_after("1e12", max_seconds=60) == 60
+        assert parse_retry_after("Fri, 01 Jan 9999 00:00:00 GMT") == 300
+
     @pytest.mark.asyncio
     async def test_get_transaction_status_timeout(
         self, banesco_client: BanescoClient
@@ -123,3 +388,377 @@ class TestBanescoClient:
 
         with pytest.raises(BanescoTimeoutError):
             await banesco_client.get_transaction_status("REF123")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_are_coalesced(
+        self, banesco_client: BanescoClient
+    ) -> None:
+        """Test concurrent lookups for one transaction make one upstream call."""
+        release = asyncio.Event()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"status": "approved"}
+
+        async def slow_get(*args: object, **kwargs: object) -> Mock:
+            await release.wait()
+            return mock_response
+
+        banesco_client.client.get = AsyncMock(side_effect=slow_get)
+
+        lookups = [
+            asyncio.create_task(banesco_client.get_transaction_status("REF123"))
+            for _ in range(4)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*lookups)
+
+        assert results == [{"status": "approved"}] * 4
+        assert banesco_client.client.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_lookup_reports_errors_per_item(
+        self, banesco_client: BanescoClient
+    ) -> None:
+        """Test batch lookups map each id to its own result or error."""
+
+        async def fake_get(url: str, **kwargs: object) -> Mock:
+            response = Mock()
+            transaction_id = url.rsplit("/", 1)[-1]
+            if transaction_id == "MISSING":
+                response.status_code = 404
+            elif transaction_id == "SLOW":
+                raise httpx.TimeoutException("Timeout")
+            else:
+                response.status_code = 200
+                response.json.return_value = {"reference": transaction_id}
+            return response
+
+        banesco_client.client.get = AsyncMock(side_effect=fake_get)
+
+        results = await banesco_client.get_transaction_statuses(
+            ["REF1", "MISSING", "SLOW", "REF1"]
+        )
+
+        assert list(results) == ["REF1", "MISSING", "SLOW"]
+        assert results["REF1"].ok
+        assert results["REF1"].data == {"reference": "REF1"}
+        assert isinstance(results["MISSING"].error, BanescoNotFoundError)
+        assert isinstance(results["SLOW"].error, BanescoTimeoutError)
+
+    @pytest.mark.asyncio
+    async def test_batch_lookup_respects_rate_limits_and_concurrency(
+        self, banesco_client: BanescoClient
+    ) -> None:
+        """Test rate-limited ids are skipped and fan-out stays bounded."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_get(url: str, **kwargs: object) -> Mock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {"status": "approved"}
+            return response
+
+        banesco_client.client.get = AsyncMock(side_effect=fake_get)
+        rate_limit_service = Mock()
+        rate_limit_service.try_acquire = AsyncMock(
+            side_effect=lambda resource_type, identifier: RateLimitDecision(
+                allowed=identifier != "LIMITED", count=1
+            )
+        )
+        ids = [f"REF{i}" for i in range(6)] + ["LIMITED"]
+
+        results = await banesco_client.get_transaction_statuses(
+            ids, rate_limit_service=rate_limit_service, concurrency=2
+        )
+
+        assert isinstance(results["LIMITED"].error, BanescoRateLimitError)
+        assert all(results[f"REF{i}"].ok for i in range(6))
+        assert rate_limit_service.try_acquire.await_count == 7
+        assert banesco_client.client.get.await_count == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self, mock_oauth_client: Mock) -> None:
+        """Test calls are short-circuited once the breaker opens."""
+        client = BanescoClient(
+            base_url="https://api.banesco.com",
+            oauth_client=mock_oauth_client,
+            circuit_breaker=CircuitBreaker(minimum_calls=1, window_size=1),
+        )
+        client.client.get = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
+
+        with pytest.raises(BanescoTimeoutError):
+            await client.get_transaction_status("REF123")
+        with pytest.raises(BanescoCircuitOpenError) as exc_info:
+            await client.get_transaction_status("REF123")
+
+        assert exc_info.value.retry_after > 0
+        assert client.client.get.await_count == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_cache_ttl_depends_on_status(
+        self, banesco_client: BanescoClient, memory_cache: CacheService
+    ) -> None:
+        """Test final statuses are cached longer than in-progress ones."""
+        banesco_client.cache = memory_cache
+
+        async def fake_get(url: str, **kwargs: object) -> Mock:
+            transaction_id = url.rsplit("/", 1)[-1]
+            response = Mock()
+            response.status_code = 404 if transaction_id == "MISSING" else 200
+            response.json.return_value = {
+                "status": "completed" if transaction_id == "DONE" else "pending"
+            }
+            return response
+
+        banesco_client.client.get = AsyncMock(side_effect=fake_get)
+
+        await banesco_client.get_transaction_status("DONE")
+        await banesco_client.get_transaction_status("PENDING")
+        with pytest.raises(BanescoNotFoundError):
+            await banesco_client.get_transaction_status("MISSING")
+
+        ttls = memory_cache.ttls
+        assert ttls["banesco:transaction:DONE"] == banesco_client.cache_terminal_ttl
+        assert ttls["banesco:transaction:PENDING"] == banesco_client.cache_pending_ttl
+        assert ttls["banesco:transaction:MISSING"] == banesco_client.cache_not_found_ttl
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_skip_upstream(
+        self, banesco_client: BanescoClient, memory_cache: CacheService
+    ) -> None:
+        """Test repeated polls are served from cache, including not-found."""
+        banesco_client.cache = memory_cache
+        await memory_cache.set(
+            "banesco:transaction:DONE",
+            {"payload": {"status": "completed"}, "not_found": False},
+        )
+        await memory_cache.set(
+            "banesco:transaction:MISSING", {"payload": None, "not_found": True}
+        )
+        banesco_client.client.get = AsyncMock()
+
+        for _ in range(5):
+            assert await banesco_client.get_transaction_status("DONE") == {
+                "status": "completed"
+            }
+        with pytest.raises(BanescoNotFoundError):
+            await banesco_client.get_transaction_status("MISSING")
+        results = await banesco_client.get_transaction_statuses(["DONE"])
+
+        assert results["DONE"].data == {"status": "completed"}
+        banesco_client.client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_last_good_response_is_served_stale_on_failure(
+        self, banesco_client: BanescoClient
+    ) -> None:
+        """Test an upstream failure serves the last good response marked stale."""
+        ok_response = Mock()
+        ok_response.status_code = 200
+        ok_response.json.return_value = {"status": "pending"}
+        banesco_client.stale_revalidate_delay = 3600
+        banesco_client.client.get = AsyncMock(
+            side_effect=[ok_response, httpx.TimeoutException("Timeout")]
+        )
+        stale_before = REGISTRY.get_sample_value("banesco_stale_responses_total") or 0
+
+        fresh = await banesco_client.get_transaction_status_result("REF123")
+        stale = await banesco_client.get_transaction_status_result("REF123")
+
+        assert not fresh.stale
+        assert stale.ok
+        assert stale.stale
+        assert stale.data == {"status": "pending"}
+        assert stale.age_seconds is not None and stale.age_seconds >= 0
+        assert "REF123" in banesco_client._revalidations
+        assert REGISTRY.get_sample_value("banesco_stale_responses_total") == (
+            stale_before + 1
+        )
+        await banesco_client.close()
+        assert not banesco_client._revalidations
+
+    @pytest.mark.asyncio
+    async def test_failure_without_last_good_response_raises(
+        self, banesco_client: BanescoClient
+    ) -> None:
+        """Test failures propagate when there is nothing to serve stale."""
+        banesco_client.client.get = AsyncMock(
+            side_effect=httpx.TimeoutException("Timeout")
+        )
+
+        with pytest.raises(BanescoTimeoutError):
+            await banesco_client.get_transaction_status_result("REF123")
+
+        assert not banesco_client._revalidations
+
+    @pytest.mark.asyncio
+    async def test_calls_and_retries_are_recorded(
+        self, banesco_client: BanescoClient
+    ) -> None:
+        """Test each attempt and the attempt count are recorded in metrics."""
+        failed = httpx.Response(
+            503, request=httpx.Request("GET", "https://api.banesco.com")
+        )
+        ok = httpx.Response(200, json={"status": "pending"})
+        banesco_client.client.get = AsyncMock(side_effect=[failed, ok])
+
+        def sample(name: str, **labels: str) -> float:
+            return REGISTRY.get_sample_value(name, labels) or 0
+
+        operation = {"operation": "get_transaction_status"}
+        before = {
+            "success": sample("banesco_api_calls_total", status="success", **operation),
+            "error": sample("banesco_api_calls_total", status="error", **operation),
+            "http_503": sample("banesco_api_errors_total", error_type="http_503"),
+            "duration": sample("banesco_api_duration_seconds_count", **operation),
+            "attempts": sample("banesco_api_attempts_sum", **operation),
+        }
+
+        with patch("asyncio.sleep", new=AsyncMock()):
+            result = await banesco_client.get_transaction_status("REF123")
+
+        assert result == {"status": "pending"}
+        assert sample("banesco_api_calls_total", status="success", **operation) == (
+            before["success"] + 1
+        )
+        assert sample("banesco_api_calls_total", status="error", **operation) == (
+            before["error"] + 1
+        )
+        assert sample("banesco_api_errors_total", error_type="http_503") == (
+            before["http_503"] + 1
+        )
+        assert sample("banesco_api_duration_seconds_count", **operation) == (
+            before["duration"] + 2
+        )
+        assert sample("banesco_api_attempts_sum", **operation) == (
+            before["attempts"] + 2
+        )
+
+    @pytest.mark.asyncio
+    async def test_server_errors_do_not_count_as_success(
+        self, banesco_client: BanescoClient
+    ) -> None:
+        """Test only answered calls raise the throttle and reset rejections."""
+        credential = banesco_client.credential_pool.credentials[0]
+        failed = httpx.Response(
+            503, request=httpx.Request("GET", "https://api.banesco.com")
+        )
+        ok = httpx.Response(200, json={"status": "pending"})
+        banesco_client.client.get = AsyncMock(side_effect=[failed, ok])
+
+        with (
+            patch("asyncio.sleep", new=AsyncMock()),
+            patch.object(credential.throttle, "on_success") as on_success,
+            patch.object(banesco_client.credential_pool, "record_success") as record,
+        ):
+            await banesco_client.get_transaction_status("REF123")
+
+        on_success.assert_called_once_with()
+        record.assert_called_once_with(credential)
+
+    @pytest.mark.asyncio
+    async def test_slow_lookup_is_hedged_within_retry_budget(
+        self, banesco_client: BanescoClient
+    ) -> None:
+        """Test a slow lookup is hedged and the hedge spends retry budget."""
+        banesco_client.hedger = Hedger(min_delay=0, min_samples=1)
+        banesco_client.hedger.observe(0.01)
+        banesco_client.retry_budget = RetryBudget(ratio=0, min_retries_per_second=0.1)
+        responses = iter([10, 0])
+
+        async def fake_get(url: str, **kwargs: object) -> httpx.Response:
+            await asyncio.sleep(next(responses))
+            return httpx.Response(200, json={"status": "approved"})
+
+        banesco_client.client.get = AsyncMock(side_effect=fake_get)
+
+        result = await asyncio.wait_for(
+            banesco_client.get_transaction_status("REF123"), timeout=2
+        )
+
+        assert result == {"status": "approved"}
+        assert banesco_client.client.get.await_count == 2
+        assert not banesco_client.retry_budget.try_retry()
+        assert banesco_client.concurrency_limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_close_keeps_shared_client_open(
+        self, mock_oauth_client: Mock
+    ) -> None:
+        """Test closing the client does not close an injected shared client."""
+        shared_client = httpx.AsyncClient()
+        client = BanescoClient(
+            base_url="https://api.banesco.com",
+            oauth_client=mock_oauth_client,
+            http_client=shared_client,
+        )
+
+        await client.close()
+
+        assert client.client is shared_client
+        assert not shared_client.is_closed
+        await shared_client.aclose()
+
+
+class TestConditionalRequests:
+    """Test suite for ETag/Last-Modified revalidation against the stand-in."""
+
+    @pytest.fixture
+    def stand_in(self, banesco_stand_in: BanescoStandIn) -> BanescoStandIn:
+        """Seed the Banesco stand-in with one pending transaction."""
+        banesco_stand_in.set_transaction("TRX-1", {"status": "pending", "amount": 10.0})
+        return banesco_stand_in
+
+    @pytest.mark.asyncio
+    async def test_unchanged_transaction_is_revalidated_with_304(
+        self, banesco_stand_in_client: BanescoClient, stand_in: BanescoStandIn
+    ) -> None:
+        """Test re-polls send validators and reuse the payload on 304."""
+        banesco_client = banesco_stand_in_client
+        first = await banesco_client.get_transaction_status("TRX-1")
+        body_bytes = stand_in.stats.body_bytes
+        before = (
+            REGISTRY.get_sample_value(
+                "banesco_conditional_requests_total", {"result": "not_modified"}
+            )
+            or 0
+        )
+
+        for _ in range(3):
+            assert await banesco_client.get_transaction_status("TRX-1") == first
+
+        assert stand_in.stats.not_modified == 3
+        assert stand_in.stats.body_bytes == body_bytes
+        assert (
+            REGISTRY.get_sample_value(
+                "banesco_conditional_requests_total", {"result": "not_modified"}
+            )
+            == before + 3
+        )
+
+    @pytest.mark.asyncio
+    async def test_changed_transaction_is_downloaded_again(
+        self, banesco_stand_in_client: BanescoClient, stand_in: BanescoStandIn
+    ) -> None:
+        """Test a changed transaction returns the new payload and validators."""
+        banesco_client = banesco_stand_in_client
+        await banesco_client.get_transaction_status("TRX-1")
+        stand_in.set_transaction("TRX-1", {"status": "completed", "amount": 10.0})
+
+        result = await banesco_client.get_transaction_status("TRX-1")
+
+        assert result == {"status": "completed", "amount": 10.0}
+        assert stand_in.stats.not_modified == 0
+        assert (
+            banesco_client._last_good["TRX-1"]["etag"]
+            == stand_in.transactions["TRX-1"].etag
+        )
@@ -0,0 +1,223 @@
+"""Integration tests for BanescoClient against the local Banesco stand-in."""
+
+import asyncio
+import random
+import time
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+from stubs.banesco_server import BanescoStandIn, LatencyDistribution, create_app
+
+from infrastructure.external.banesco_client import (
+    BanescoAPIError,
+    BanescoClient,
+    BanescoDeadlineExceededError,
+    BanescoNotFoundError,
+    BanescoOAuth2Client,
+    BanescoRateLimitError,
+)
+from infrastructure.external.banesco_credentials import (
+    BanescoCredential,
+    BanescoCredentialPool,
+)
+from infrastructure.monitoring.metrics import banesco_retries_total
+from infrastructure.resilience import (
+    AdaptiveTokenBucket,
+    CircuitState,
+    RetryBudget,
+    deadline_scope,
+)
+
+
+class TestLatencyDistribution:
+    """Test suite for stand-in latency specs."""
+
+    def test_parse_and_sample(self) -> None:
+        """Test specs parse and samples stay within their bounds."""
+        rng = random.Random(1)
+
+        assert LatencyDistribution.parse("fixed:0.2").sample(rng) == 0.2
+        assert 0.1 <= LatencyDistribution.parse("uniform:0.1,0.3").sample(rng) <= 0.3
+        assert LatencyDistribution.parse("lognormal:0.05,0.5").sample(rng) > 0
+        assert LatencyDistribution.parse("exponential:0.05").sample(rng) >= 0
+
+    def test_invalid_spec_is_rejected(self) -> None:
+        """Test malformed specs raise ValueError."""
+        with pytest.raises(ValueError):
+            LatencyDistribution.parse("uniform:0.1")
+        with pytest.raises(ValueError):
+            LatencyDistribution.parse("gamma:1,2")
+
+
+class TestBanescoStandIn:
+    """Test suite for BanescoClient behavior under stand-in conditions."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_load(
+        self,
+        banesco_stand_in: BanescoStandIn,
+        banesco_stand_in_client: BanescoClient,
+    ) -> None:
+        """Test many concurrent lookups with latency share one token."""
+        banesco_stand_in_client.credential_pool.credentials[
+            0
+        ].throttle = AdaptiveTokenBucket(rate=1000, burst=100)
+        banesco_stand_in.config.auto_create = True
+        banesco_stand_in.config.latency = LatencyDistribution.parse(
+            "uniform:0.001,0.01"
+        )
+
+        results = await asyncio.gather(
+            *(
+                banesco_stand_in_client.get_transaction_status(f"TRX-{i}")
+                for i in range(50)
+            )
+        )
+
+        assert all(result["status"] == "pending" for result in results)
+        assert banesco_stand_in.stats.responses[200] == 50
+        assert banesco_stand_in.stats.token_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_injected_not_found_and_rate_limit(
+        self,
+        banesco_stand_in: BanescoStandIn,
+        banesco_stand_in_client: BanescoClient,
+    ) -> None:
+        """Test injected 404 and 429 answers surface as client errors."""
+        banesco_stand_in.config.auto_create = True
+        banesco_stand_in.config.not_found_rate = 1.0
+        with pytest.raises(BanescoNotFoundError):
+            await banesco_stand_in_client.get_transaction_status("TRX-1")
+
+        banesco_stand_in.config.rate_limit_rate = 1.0
+        banesco_stand_in.config.retry_after = 7
+        with pytest.raises(BanescoRateLimitError) as exc_info:
+            await banesco_stand_in_client.get_transaction_status("TRX-2")
+
+        assert exc_info.value.retry_after == 7
+        # Only the 429 is an overload signal for the concurrency limit
+        assert banesco_stand_in_client.concurrency_limiter.limit == 10 * 0.7
+        assert banesco_stand_in.stats.responses[404] == 1
+        assert banesco_stand_in.stats.responses[429] == 1
+
+    @pytest.mark.asyncio
+    async def test_short_lived_tokens_are_renewed(
+        self,
+        banesco_stand_in: BanescoStandIn,
+        banesco_stand_in_client: BanescoClient,
+    ) -> None:
+        """Test tokens that expire quickly are reused, then renewed in time."""
+        banesco_stand_in.config.auto_create = True
+        banesco_stand_in.config.token_ttl = 1
+
+        for i in range(3):
+            await banesco_stand_in_client.get_transaction_status(f"TRX-{i}")
+        await asyncio.sleep(1)
+        await banesco_stand_in_client.get_transaction_status("TRX-3")
+
+        assert banesco_stand_in.stats.token_requests == 2
+        assert banesco_stand_in.stats.responses[401] == 0
+
+    @pytest.mark.asyncio
+    async def test_deadline_caps_slow_call(
+        self,
+        banesco_stand_in: BanescoStandIn,
+        banesco_stand_in_client: BanescoClient,
+    ) -> None:
+        """Test a slow Banesco is abandoned at the caller's deadline."""
+        banesco_stand_in.config.auto_create = True
+        banesco_stand_in.config.latency = LatencyDistribution.parse("fixed:5")
+        banesco_stand_in_client.circuit_breaker.minimum_calls = 1
+
+        started_at = time.monotonic()
+        with deadline_scope(0.2), pytest.raises(BanescoDeadlineExceededError):
+            await banesco_stand_in_client.get_transaction_status("TRX-1")
+
+        assert time.monotonic() - started_at < 1.0
+        # Running out of caller budget does not count against Banesco
+        assert banesco_stand_in_client.circuit_breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_retries_stop_when_deadline_cannot_fit_backoff(
+        self,
+        banesco_stand_in: BanescoStandIn,
+        banesco_stand_in_client: BanescoClient,
+    ) -> None:
+        """Test a failed attempt is not retried past the shared call's deadline."""
+        banesco_stand_in.config.auto_create = True
+        banesco_stand_in.config.error_rate = 1.0
+        # The lookup is shared, so it runs under its own deadline
+        banesco_stand_in_client.shared_call_timeout = 2.0
+
+        started_at = time.monotonic()
+        with pytest.raises(BanescoAPIError):
+            await banesco_stand_in_client.get_transaction_status("TRX-1")
+
+        assert time.monotonic() - started_at < 1.0
+        assert banesco_stand_in.stats.responses[500] == 1
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retry_budget_refuses_retries(
+        self,
+        banesco_stand_in: BanescoStandIn,
+        banesco_stand_in_client: BanescoClient,
+    ) -> None:
+        """Test failures are not retried once the shared budget is spent."""
+        banesco_stand_in.config.auto_create = True
+        banesco_stand_in.config.error_rate = 1.0
+        banesco_stand_in_client.retry_budget = RetryBudget(
+            ratio=0, min_retries_per_second=0, metric=banesco_retries_total
+        )
+        labels = {"operation": "get_transaction_status", "result": "refused"}
+        before = REGISTRY.get_sample_value("banesco_retries_total", labels) or 0
+
+        with pytest.raises(BanescoAPIError):
+            await banesco_stand_in_client.get_transaction_status("TRX-1")
+
+        assert banesco_stand_in.stats.responses[500] == 1
+        assert REGISTRY.get_sample_value("banesco_retries_total", labels) == (
+            before + 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_revoked_credential_is_ejected_from_pool(
+        self, banesco_stand_in: BanescoStandIn
+    ) -> None:
+        """Test lookups move to a healthy credential when one is revoked."""
+        banesco_stand_in.config.auto_create = True
+        banesco_stand_in.revoke_client("revoked")
+        http_client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=create_app(banesco_stand_in))
+        )
+        credentials = [
+            BanescoCredential(
+                name=client_id,
+                oauth_client=BanescoOAuth2Client(
+                    auth_url="http://banesco/oauth/token",
+                    client_id=client_id,
+                    client_secret="secret",
+                    http_client=http_client,
+                ),
+                throttle=AdaptiveTokenBucket(rate=1000, burst=100),
+            )
+            for client_id in ("revoked", "valid")
+        ]
+        pool = BanescoCredentialPool(credentials, eject_after=2)
+        client = BanescoClient(
+            base_url="http://banesco", http_client=http_client, credential_pool=pool
+        )
+
+        try:
+            results = await asyncio.gather(
+                *(client.get_transaction_status(f"TRX-{i}") for i in range(20))
+            )
+        finally:
+            await client.close()
+            await http_client.aclose()
+
+        assert all(result["status"] == "pending" for result in results)
+        assert pool.healthy() == [credentials[1]]
+        assert 2 <= banesco_stand_in.stats.responses[401] < 20
+        assert banesco_stand_in.stats.responses[200] == 20
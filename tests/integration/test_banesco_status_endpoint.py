@@ -0,0 +1,368 @@
+"""Integration tests for the Banesco status endpoint."""
+
+from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from application.services.rate_limit_service import RateLimitDeferralError
+from domain.entities.transaction import BankType
+from domain.entities.user import User
+from domain.services.bank_connector import BankStatusResult
+from infrastructure.config.settings import settings
+from infrastructure.database.connection import get_db_session
+from infrastructure.external.banesco_client import (
+    BanescoAPIError,
+    BanescoCircuitOpenError,
+    BanescoClient,
+    BanescoNotFoundError,
+    BanescoStatusResult,
+)
+from infrastructure.external.bank_connectors import BankConnectorRegistry
+from infrastructure.rate_limit import RateLimitDecision
+from infrastructure.resilience import remaining_time
+from interface.api.main import app
+from interface.api.routes.auth import get_current_user
+from interface.api.routes.transactions import (
+    get_banesco_client,
+    get_bank_connectors,
+    get_rate_limit_service,
+    get_transaction_service,
+)
+
+
+class TestBanescoStatusEndpoint:
+    """Test suite for GET /api/v1/transactions/external/{id}/banesco-status."""
+
+    @pytest.fixture
+    def banesco_client(self) -> Mock:
+        """Create mock Banesco client."""
+        client = Mock(spec=BanescoClient)
+        client.get_transaction_status_result = AsyncMock(
+            return_value=BanescoStatusResult(
+                transaction_id="TRX-1", data={"status": "approved"}
+            )
+        )
+        client.get_cached_transaction_status = AsyncMock(return_value=None)
+        return client
+
+    @pytest.fixture
+    def rate_limit_service(self) -> Mock:
+        """Create mock rate limit service that admits every request."""
+        service = Mock()
+        service.try_acquire = AsyncMock(
+            return_value=RateLimitDecision(allowed=True, count=1)
+        )
+        return service
+
+    @pytest_asyncio.fixture
+    async def api_client(
+        self, banesco_client: Mock, rate_limit_service: Mock
+    ) -> AsyncGenerator[AsyncClient, None]:
+        """Create test client with external dependencies overridden."""
+        session = Mock()
+        session.commit = AsyncMock()
+
+        async def override_get_db_session() -> AsyncGenerator[Mock, None]:
+            yield session
+
+        app.dependency_overrides[get_db_session] = override_get_db_session
+        app.dependency_overrides[get_current_user] = lambda: User(
+            id=uuid4(), email="test@example.com", password_hash="", full_name="Test"
+        )
+        app.dependency_overrides[get_banesco_client] = lambda: banesco_client
+        app.dependency_overrides[get_rate_limit_service] = lambda: rate_limit_service
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://testserver"
+        ) as ac:
+            yield ac
+
+        app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_returns_banesco_payload(self, api_client: AsyncClient) -> None:
+        """Test successful lookup returns the upstream payload."""
+        response = await api_client.get(
+            "/api/v1/transactions/external/TRX-1/banesco-status"
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "transaction_id": "TRX-1",
+            "data": {"status": "approved"},
+            "stale": False,
+            "age_seconds": None,
+        }
+        assert "Warning" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_stale_payload_is_flagged(
+        self, api_client: AsyncClient, banesco_client: Mock
+    ) -> None:
+        """Test stale responses carry their age and a Warning header."""
+        banesco_client.get_transaction_status_result.return_value = BanescoStatusResult(
+            transaction_id="TRX-1",
+            data={"status": "pending"},
+            stale=True,
+            age_seconds=42.7,
+        )
+
+        response = await api_client.get(
+            "/api/v1/transactions/external/TRX-1/banesco-status"
+        )
+
+        assert response.status_code == 200
+        assert response.json()["stale"] is True
+        assert response.json()["age_seconds"] == 42.7
+        assert response.headers["Age"] == "42"
+        assert response.headers["Warning"] == '110 - "Response is Stale"'
+
+    @pytest.mark.asyncio
+    async def test_request_timeout_header_bounds_lookup(
+        self, api_client: AsyncClient, banesco_client: Mock
+    ) -> None:
+        """Test X-Request-Timeout sets the deadline of the Banesco lookup."""
+        seen: list[float | None] = []
+
+        async def lookup(transaction_id: str) -> BanescoStatusResult:
+            seen.append(remaining_time())
+            return BanescoStatusResult(transaction_id=transaction_id, data={})
+
+        banesco_client.get_transaction_status_result.side_effect = lookup
+
+        response = await api_client.get(
+            "/api/v1/transactions/external/TRX-1/banesco-status",
+            headers={"X-Request-Timeout": "1.5"},
+        )
+
+        assert response.status_code == 200
+        assert seen[0] is not None and 0 < seen[0] <= 1.5
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_maps_to_503(
+        self, api_client: AsyncClient, banesco_client: Mock
+    ) -> None:
+        """Test an open circuit returns 503 with Retry-After."""
+        banesco_client.get_transaction_status_result.side_effect = (
+            BanescoCircuitOpenError(retry_after=12.3)
+        )
+
+        response = await api_client.get(
+            "/api/v1/transactions/external/TRX-1/banesco-status"
+        )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "13"
+        assert response.json()["detail"]["error_code"] == "SERVICE_UNAVAILABLE"
+
+    @pytest.mark.asyncio
+    async def test_not_found_maps_to_404(
+        self, api_client: AsyncClient, banesco_client: Mock
+    ) -> None:
+        """Test unknown transactions return 404."""
+        banesco_client.get_transaction_status_result.side_effect = (
+            BanescoNotFoundError()
+        )
+
+        response = await api_client.get(
+            "/api/v1/transactions/external/TRX-1/banesco-status"
+        )
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_transaction_returns_429(
+        self,
+        api_client: AsyncClient,
+        banesco_client: Mock,
+        rate_limit_service: Mock,
+    ) -> None:
+        """Test per-transaction rate limit is enforced before calling Banesco."""
+        rate_limit_service.try_acquire.return_value = RateLimitDecision(
+            allowed=False, count=2, retry_after=12.3
+        )
+
+        response = await api_client.get(
+            "/api/v1/transactions/external/TRX-1/banesco-status"
+        )
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "13"
+        banesco_client.get_transaction_status_result.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deferral_mode_waits_for_next_window(
+        self,
+        api_client: AsyncClient,
+        rate_limit_service: Mock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test deferral mode runs the lookup through the rate limit queue."""
+        monkeypatch.setattr(settings, "banesco_rate_limit_defer", True)
+        rate_limit_service.execute_or_defer = AsyncMock(
+            return_value=BanescoStatusResult(
+                transaction_id="TRX-1", data={"status": "approved"}
+            )
+        )
+
+        response = await api_client.get(
+            "/api/v1/transactions/external/TRX-1/banesco-status"
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"] == {"status": "approved"}
+        rate_limit_service.check_rate_limit.assert_not_called()
+
+        rate_limit_service.execute_or_defer.side_effect = RateLimitDeferralError(41.2)
+        response = await api_client.get(
+            "/api/v1/transactions/external/TRX-1/banesco-status"
+        )
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "42"
+
+    @pytest.mark.asyncio
+    async def test_cached_status_skips_rate_limit(
+        self,
+        api_client: AsyncClient,
+        banesco_client: Mock,
+        rate_limit_service: Mock,
+    ) -> None:
+        """Test cache hits are served without consuming the rate limit."""
+        banesco_client.get_cached_transaction_status.return_value = {
+            "status": "completed"
+        }
+        rate_limit_service.try_acquire.return_value = RateLimitDecision(
+            allowed=False, count=2, retry_after=30
+        )
+
+        response = await api_client.get(
+            "/api/v1/transactions/external/TRX-1/banesco-status"
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"] == {"status": "completed"}
+        rate_limit_service.try_acquire.assert_not_called()
+        banesco_client.get_transaction_status_result.assert_not_called()
+
+
+class TestBankStatusByReferenceEndpoint:
+    """Test suite for GET /api/v1/transactions/reference/{ref}/bank-status."""
+
+    @pytest.fixture
+    def transaction_service(self) -> Mock:
+        """Create mock transaction service knowing reference REF-1."""
+        service = Mock()
+        service.get_transaction_by_reference = AsyncMock(
+            side_effect=lambda reference: (
+                Mock(transaction_id="TRX-1") if reference == "REF-1" else None
+            )
+        )
+        return service
+
+    @pytest.fixture
+    def registry(self) -> Mock:
+        """Create registry with one answering and one failing bank."""
+        registry = Mock(spec=BankConnectorRegistry)
+        registry.banks = [BankType.BANESCO, BankType.MOBILE_TRANSFER]
+        registry.fan_out = AsyncMock(
+            return_value={
+                BankType.BANESCO: BankStatusResult(
+                    bank=BankType.BANESCO,
+                    transaction_id="TRX-1",
+                    data={"status": "approved"},
+                ),
+                BankType.MOBILE_TRANSFER: BankStatusResult(
+                    bank=BankType.MOBILE_TRANSFER,
+                    transaction_id="TRX-1",
+                    error=TimeoutError("MOBILE_TRANSFER did not answer in time"),
+                ),
+            }
+        )
+        return registry
+
+    @pytest_asyncio.fixture
+    async def api_client(
+        self, registry: Mock, transaction_service: Mock
+    ) -> AsyncGenerator[AsyncClient, None]:
+        """Create test client with mocked banks and transactions."""
+        app.dependency_overrides[get_current_user] = lambda: User(
+            id=uuid4(), email="test@example.com", password_hash="", full_name="Test"
+        )
+        app.dependency_overrides[get_bank_connectors] = lambda: registry
+        app.dependency_overrides[get_transaction_service] = lambda: transaction_service
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://testserver"
+        ) as ac:
+            yield ac
+
+        app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_reports_each_bank(
+        self, api_client: AsyncClient, registry: Mock
+    ) -> None:
+        """Test a failing bank is reported alongside the one that answered."""
+        response = await api_client.get(
+            "/api/v1/transactions/reference/REF-1/bank-status"
+        )
+
+        assert response.status_code == 200
+        registry.fan_out.assert_awaited_once_with("TRX-1", banks=None)
+        assert response.json() == {
+            "reference": "REF-1",
+            "transaction_id": "TRX-1",
+            "results": [
+                {
+                    "bank": "BANESCO",
+                    "found": True,
+                    "data": {"status": "approved"},
+                    "stale": False,
+                    "error": None,
+                },
+                {
+                    "bank": "MOBILE_TRANSFER",
+                    "found": False,
+                    "data": None,
+                    "stale": False,
+                    "error": "Bank did not answer in time",
+                },
+            ],
+        }
+
+    @pytest.mark.asyncio
+    async def test_unknown_reference_is_not_found(
+        self, api_client: AsyncClient, registry: Mock
+    ) -> None:
+        """Test banks are not queried for a reference with no transaction."""
+        response = await api_client.get(
+            "/api/v1/transactions/reference/REF-404/bank-status"
+        )
+
+        assert response.status_code == 404
+        registry.fan_out.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_does_not_leak_upstream_error_text(
+        self, api_client: AsyncClient, registry: Mock
+    ) -> None:
+        """Test upstream exception text is replaced with a fixed message."""
+        registry.fan_out.return_value = {
+            BankType.BANESCO: BankStatusResult(
+                bank=BankType.BANESCO,
+                transaction_id="TRX-1",
+                error=BanescoAPIError("HTTP 500 from https://internal.banesco/api"),
+            ),
+        }
+
+        response = await api_client.get(
+            "/api/v1/transactions/reference/REF-1/bank-status"
+        )
+
+        assert response.status_code == 200
+        assert response.json()["results"][0]["error"] == "Lookup failed"
@@ -0,0 +1,226 @@
+"""Integration tests for recording and replaying Banesco traffic."""
+
+import gzip
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+from stubs.banesco_server import BanescoStandIn, LatencyDistribution, create_app
+
+from infrastructure.external.banesco_client import BanescoClient, BanescoOAuth2Client
+from infrastructure.external.cassette import (
+    REDACTED,
+    CassetteMissError,
+    RecordingTransport,
+    ReplayTransport,
+    load_cassette,
+    replay_status_lookups,
+)
+
+
+def make_client(transport: httpx.AsyncBaseTransport) -> BanescoClient:
+    """Create a BanescoClient whose HTTP traffic goes through ``transport``."""
+    http_client = httpx.AsyncClient(transport=transport)
+    oauth_client = BanescoOAuth2Client(
+        auth_url="http://banesco/oauth/token",
+        client_id="test-client-id",
+        client_secret="test-client-secret",
+        http_client=http_client,
+    )
+    return BanescoClient(
+        base_url="http://banesco", oauth_client=oauth_client, http_client=http_client
+    )
+
+
+async def record(stand_in: BanescoStandIn, path: Path, ids: list[str]) -> list[dict]:
+    """Look up transactions against the stand-in while recording."""
+    transport = RecordingTransport(
+        path, transport=httpx.ASGITransport(app=create_app(stand_in))
+    )
+    client = make_client(transport)
+    try:
+        return [await client.get_transaction_status(tid) for tid in ids]
+    finally:
+        await client.close()
+        await client.client.aclose()
+
+
+class TestCassette:
+    """Test suite for the record and replay transports."""
+
+    @pytest.fixture
+    def stand_in(self) -> BanescoStandIn:
+        """Create a stand-in with two transactions and a fixed latency."""
+        stand_in = BanescoStandIn()
+        stand_in.config.latency = LatencyDistribution.parse("fixed:0.05")
+        stand_in.set_transaction("TRX-1", {"status": "approved", "amount": 10})
+        stand_in.set_transaction("TRX-2", {"status": "pending", "amount": 20})
+        return stand_in
+
+    @pytest.mark.asyncio
+    async def test_recording_redacts_credentials(
+        self, stand_in: BanescoStandIn, tmp_path: Path
+    ) -> None:
+        """Test tokens, secrets and Authorization headers never reach the file."""
+        path = tmp_path / "banesco.jsonl.gz"
+        await record(stand_in, path, ["TRX-1", "TRX-2"])
+
+        raw = gzip.decompress(path.read_bytes()).decode()
+        assert "test-client-secret" not in raw
+        assert "Bearer " not in raw
+        for token in stand_in.tokens:
+            assert token not in raw
+
+        entries = load_cassette(path)
+        token_entry, status_entry = entries[0], entries[1]
+        form = parse_qs(token_entry.request_body)
+        assert form["client_secret"] == [REDACTED]
+        assert REDACTED in token_entry.response_body
+        assert status_entry.request_headers["authorization"] == REDACTED
+        assert status_entry.duration >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_recording_redacts_query_credentials(self, tmp_path: Path) -> None:
+        """Test credentials passed in the query string are masked too."""
+        path = tmp_path / "query.jsonl.gz"
+        transport = RecordingTransport(
+            path, transport=httpx.MockTransport(lambda r: httpx.Response(200))
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get(
+                "http://banesco/transactions/TRX-1",
+                params={"access_token": "secret-token", "page": "2"},
+            )
+
+        (entry,) = load_cassette(path)
+        assert "secret-token" not in gzip.decompress(path.read_bytes()).decode()
+        assert parse_qs(urlsplit(entry.url).query) == {
+            "access_token": [REDACTED],
+            "page": ["2"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_recording_holds_no_open_file(self, tmp_path: Path) -> None:
+        """Test the file is written per entry and loadable without closing."""
+        path = tmp_path / "lifecycle.jsonl.gz"
+        transport = RecordingTransport(
+            path, transport=httpx.MockTransport(lambda r: httpx.Response(200))
+        )
+        assert not path.exists()
+
+        client = httpx.AsyncClient(transport=transport)
+        await client.get("http://banesco/transactions/TRX-1")
+        await client.get("http://banesco/transactions/TRX-2")
+
+        # Never closed, as after a crash: both entries are already on disk
+        assert [e.url for e in load_cassette(path)] == [
+            "http://banesco/transactions/TRX-1",
+            "http://banesco/transactions/TRX-2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_recording_is_loadable(self, tmp_path: Path) -> None:
+        """Test closing a recording without traffic leaves a valid cassette."""
+        path = tmp_path / "empty.jsonl.gz"
+        transport = RecordingTransport(
+            path, transport=httpx.MockTransport(lambda r: httpx.Response(200))
+        )
+        await transport.aclose()
+
+        assert load_cassette(path) == []
+
+    @pytest.mark.asyncio
+    async def test_failed_requests_are_recorded_and_replayed(
+        self, tmp_path: Path
+    ) -> None:
+        """Test a timeout is recorded with its duration and raised on replay."""
+        path = tmp_path / "failures.jsonl.gz"
+        now = [0.0]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            now[0] += 2.5
+            if request.url.path.endswith("TRX-SLOW"):
+                raise httpx.ReadTimeout("timed out", request=request)
+            return httpx.Response(200)
+
+        transport = RecordingTransport(
+            path, transport=httpx.MockTransport(handler), clock=lambda: now[0]
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.head("http://banesco")
+            with pytest.raises(httpx.ReadTimeout):
+                await client.get("http://banesco/transactions/TRX-SLOW")
+
+        # The warm-up HEAD is not part of the cassette
+        (entry,) = load_cassette(path)
+        assert (entry.status_code, entry.error) == (0, "ReadTimeout")
+        assert entry.duration == 2.5
+
+        delays: list[float] = []
+
+        async def fake_sleep(seconds: float) -> None:
+            delays.append(seconds)
+
+        replay = ReplayTransport.from_file(path, sleep=fake_sleep)
+        async with httpx.AsyncClient(transport=replay) as client:
+            with pytest.raises(httpx.ReadTimeout):
+                await client.get("http://banesco/transactions/TRX-SLOW")
+        assert delays == [2.5]
+
+    @pytest.mark.asyncio
+    async def test_replay_reproduces_responses_and_scaled_latency(
+        self, stand_in: BanescoStandIn, tmp_path: Path
+    ) -> None:
+        """Test a replayed client sees the recorded answers and latencies."""
+        path = tmp_path / "banesco.jsonl.gz"
+        recorded = await record(stand_in, path, ["TRX-1", "TRX-2"])
+
+        delays: list[float] = []
+
+        async def fake_sleep(seconds: float) -> None:
+            delays.append(seconds)
+
+        replay = ReplayTransport.from_file(path, time_scale=0.5, sleep=fake_sleep)
+        client = make_client(replay)
+        replayed = [
+            await client.get_transaction_status(tid) for tid in ["TRX-1", "TRX-2"]
+        ]
+        await client.close()
+
+        assert replayed == recorded
+        assert replay.served == 3
+        # Token exchange plus two lookups of at least 50 ms, halved
+        assert sorted(delays)[1:] >= [0.025, 0.025]
+
+    @pytest.mark.asyncio
+    async def test_unrecorded_request_is_a_transport_error(
+        self, stand_in: BanescoStandIn, tmp_path: Path
+    ) -> None:
+        """Test requests outside the cassette fail like a broken connection."""
+        path = tmp_path / "banesco.jsonl.gz"
+        await record(stand_in, path, ["TRX-1"])
+        replay = ReplayTransport.from_file(path, time_scale=0, loop=False)
+
+        async with httpx.AsyncClient(transport=replay) as client:
+            await client.get("http://banesco/transactions/TRX-1")
+            with pytest.raises(CassetteMissError):
+                await client.get("http://banesco/transactions/TRX-1")
+            with pytest.raises(httpx.TransportError):
+                await client.get("http://banesco/transactions/OTHER")
+
+    @pytest.mark.asyncio
+    async def test_status_lookups_replay_on_recorded_schedule(
+        self, stand_in: BanescoStandIn, tmp_path: Path
+    ) -> None:
+        """Test recorded lookups are reissued at their scaled offsets."""
+        path = tmp_path / "banesco.jsonl.gz"
+        await record(stand_in, path, ["TRX-1", "TRX-2"])
+        entries = load_cassette(path)
+
+        client = make_client(ReplayTransport(entries, time_scale=0))
+        results = await replay_status_lookups(client, entries, time_scale=0.1)
+        await client.close()
+
+        assert [r.transaction_id for r in results] == ["TRX-1", "TRX-2"]
+        assert {r.outcome for r in results} == {"success"}
@@ -0,0 +1,77 @@
+"""Integration tests for the Postgres rate limit backend."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.database.models import RateLimitModel
+from infrastructure.rate_limit import DatabaseRateLimitBackend
+
+
+class TestDatabaseRateLimitBackend:
+    """Test suite for the upsert-based counters."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sessions_never_exceed_limit(
+        self, test_engine, monkeypatch
+    ) -> None:
+        """Test requests in separate transactions admit exactly ``limit``."""
+        # Mid-window, so every request counts against the same row
+        monkeypatch.setattr(
+            "infrastructure.rate_limit.database_backend.time",
+            SimpleNamespace(time=lambda: 1_700_000_030.0),
+        )
+        session_factory = sessionmaker(
+            test_engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+        async def acquire() -> bool:
+            async with session_factory() as session:
+                decision = await DatabaseRateLimitBackend(session).acquire(
+                    "TRANSACTION_ID", "TRX-1", 3, 60
+                )
+                await session.commit()
+                return decision.allowed
+
+        allowed = await asyncio.gather(*(acquire() for _ in range(10)))
+
+        assert sum(allowed) == 3
+        async with session_factory() as session:
+            rows = await session.scalar(select(func.count(RateLimitModel.id)))
+            assert rows == 1
+            assert (
+                await DatabaseRateLimitBackend(session).count(
+                    "TRANSACTION_ID", "TRX-1", 60
+                )
+                == 3
+            )
+
+    @pytest.mark.asyncio
+    async def test_purge_keeps_current_windows(self, db_session: AsyncSession) -> None:
+        """Test only windows older than the cutoff are deleted."""
+        now = datetime.now(timezone.utc)
+        db_session.add_all(
+            [
+                RateLimitModel(
+                    resource_type="TRANSACTION_ID",
+                    resource_identifier=f"TRX-{i}",
+                    window_start=now - timedelta(hours=2),
+                    request_count=1,
+                )
+                for i in range(3)
+            ]
+        )
+        await db_session.flush()
+        backend = DatabaseRateLimitBackend(db_session)
+        await backend.acquire("TRANSACTION_ID", "TRX-0", 2, 60)
+
+        purged = await backend.purge_expired(now - timedelta(hours=1), limit=2)
+        purged += await backend.purge_expired(now - timedelta(hours=1), limit=2)
+
+        assert purged == 3
+        assert await backend.count("TRANSACTION_ID", "TRX-0", 60) == 1
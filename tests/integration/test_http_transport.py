@@ -0,0 +1,53 @@
+"""Integration tests for the shared HTTP transport."""
+
+import httpx
+import pytest
+
+from infrastructure.external.http_transport import SharedHTTPTransport
+
+
+class TestSharedHTTPTransport:
+    """Test suite for SharedHTTPTransport."""
+
+    @pytest.mark.asyncio
+    async def test_warm_up_opens_connections_per_origin(self) -> None:
+        """Test warm-up probes each distinct origin once per connection."""
+        probed: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            probed.append(f"{request.method} {request.url}")
+            return httpx.Response(200)
+
+        transport = SharedHTTPTransport(transport=httpx.MockTransport(handler))
+
+        warmed = await transport.warm_up(
+            [
+                "https://api.banesco.com/v1",
+                "https://api.banesco.com/oauth/token",
+                "https://auth.banesco.com/token",
+            ],
+            connections_per_host=2,
+        )
+        await transport.close()
+
+        assert warmed == 4
+        assert sorted(probed) == [
+            "HEAD https://api.banesco.com",
+            "HEAD https://api.banesco.com",
+            "HEAD https://auth.banesco.com",
+            "HEAD https://auth.banesco.com",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_warm_up_ignores_failures(self) -> None:
+        """Test warm-up failures are swallowed."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        transport = SharedHTTPTransport(transport=httpx.MockTransport(handler))
+
+        warmed = await transport.warm_up(["https://api.banesco.com/v1", ""])
+        await transport.close()
+
+        assert warmed == 0
@@ -0,0 +1,72 @@
+"""Integration tests for the Redis rate limit backend (needs a Redis server)."""
+
+import asyncio
+import os
+import uuid
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as redis
+
+from infrastructure.rate_limit import RedisRateLimitBackend
+
+
+@pytest_asyncio.fixture
+async def backend() -> AsyncGenerator[RedisRateLimitBackend, None]:
+    """Create a backend on REDIS_URL with a unique key prefix."""
+    client = redis.from_url(
+        os.getenv("REDIS_URL", "redis://localhost:6379/0"), decode_responses=True
+    )
+    try:
+        await client.ping()
+    except (redis.RedisError, OSError):
+        await client.aclose()
+        pytest.skip("Redis is not available")
+
+    yield RedisRateLimitBackend(client, prefix=f"test-ratelimit-{uuid.uuid4().hex}")
+    await client.aclose()
+
+
+class TestRedisRateLimitBackend:
+    """Test suite for the sliding-window Lua script."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_never_exceed_limit(
+        self, backend: RedisRateLimitBackend
+    ) -> None:
+        """Test concurrent acquisitions admit exactly ``limit`` requests."""
+        decisions = await asyncio.gather(
+            *(backend.acquire("TRANSACTION_ID", "TRX-1", 5, 60) for _ in range(50))
+        )
+
+        assert sum(d.allowed for d in decisions) == 5
+        assert await backend.count("TRANSACTION_ID", "TRX-1", 60) == 5
+        rejected = next(d for d in decisions if not d.allowed)
+        assert 0 < rejected.retry_after <= 60
+
+    @pytest.mark.asyncio
+    async def test_window_slides(self, backend: RedisRateLimitBackend) -> None:
+        """Test capacity comes back as requests leave the window."""
+        assert (await backend.acquire("TRANSACTION_ID", "TRX-2", 1, 0.2)).allowed
+        assert not (await backend.acquire("TRANSACTION_ID", "TRX-2", 1, 0.2)).allowed
+
+        await asyncio.sleep(0.25)
+
+        assert (await backend.acquire("TRANSACTION_ID", "TRX-2", 1, 0.2)).allowed
+        await backend.reset("TRANSACTION_ID", "TRX-2")
+        assert await backend.count("TRANSACTION_ID", "TRX-2", 0.2) == 0
+
+    @pytest.mark.asyncio
+    async def test_lease_grants_what_fits_and_release_returns_it(
+        self, backend: RedisRateLimitBackend
+    ) -> None:
+        """Test a lease is capped by the limit and its leftovers can go back."""
+        await backend.acquire("TRANSACTION_ID", "TRX-3", 5, 60)
+
+        grant = await backend.lease("TRANSACTION_ID", "TRX-3", 10, 5, 60)
+        await backend.release("TRANSACTION_ID", "TRX-3", grant, 2)
+
+        assert grant.granted == 4
+        assert grant.count == 5
+        assert await backend.count("TRANSACTION_ID", "TRX-3", 60) == 3
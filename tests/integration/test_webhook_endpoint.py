@@ -0,0 +1,68 @@
+"""Integration tests for the Banesco webhook endpoint."""
+
+import time
+from collections.abc import AsyncGenerator
+from unittest.mock import Mock
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from stubs.webhook_sender import BanescoWebhookSender
+
+from application.services.webhook_service import BanescoWebhookProcessor
+from infrastructure.config.settings import settings
+from interface.api.main import app
+from interface.api.routes.webhooks import get_webhook_processor
+
+
+class TestBanescoWebhookEndpoint:
+    """Test suite for POST /api/v1/webhooks/banesco."""
+
+    @pytest.fixture
+    def processor(self) -> BanescoWebhookProcessor:
+        """Create a processor whose queue is never consumed."""
+        return BanescoWebhookProcessor(Mock(), queue_size=1)
+
+    @pytest_asyncio.fixture
+    async def sender(
+        self, processor: BanescoWebhookProcessor, monkeypatch: pytest.MonkeyPatch
+    ) -> AsyncGenerator[BanescoWebhookSender, None]:
+        """Create a stand-in sender posting to the app over ASGI."""
+        monkeypatch.setattr(settings, "banesco_webhook_secret", "whsec-test")
+        app.dependency_overrides[get_webhook_processor] = lambda: processor
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            yield BanescoWebhookSender(client, "whsec-test")
+        app.dependency_overrides.clear()
+
+    async def test_signed_notification_is_queued(
+        self, sender: BanescoWebhookSender, processor: BanescoWebhookProcessor
+    ) -> None:
+        """Test a valid notification is acknowledged with 202 and queued."""
+        response = await sender.send("TRX-1", "APPROVED", event_id="evt-1")
+
+        assert response.status_code == 202
+        queued = processor.queue.get_nowait()
+        assert (queued.transaction_id, queued.status) == ("TRX-1", "APPROVED")
+        assert queued.event_id == "evt-1"
+
+    async def test_bad_or_stale_signature_is_rejected(
+        self, sender: BanescoWebhookSender, processor: BanescoWebhookProcessor
+    ) -> None:
+        """Test forged and replayed notifications get 401 and are not queued."""
+        forged = await sender.send("TRX-1", "APPROVED", signature="0" * 64)
+        stale = await sender.send("TRX-1", "APPROVED", timestamp=time.time() - 3600)
+
+        assert forged.status_code == 401
+        assert stale.status_code == 401
+        assert processor.queue.empty()
+
+    async def test_full_queue_answers_503(self, sender: BanescoWebhookSender) -> None:
+        """Test Banesco is told to retry when the queue is full."""
+        assert (await sender.send("TRX-1", "APPROVED")).status_code == 202
+
+        response = await sender.send("TRX-2", "APPROVED")
+
+        assert response.status_code == 503
+        assert "Retry-After" in response.headers
@@ -0,0 +1,321 @@
+"""Local stand-in for the Banesco API.
+
+Implements the OAuth token endpoint and the transaction status endpoint with
+ETag/Last-Modified validators, configurable latency distributions, injected
+500/404/429 answers and expiring tokens. It counts what it serves so client
+throughput, retries, tail latency and conditional-request savings can be
+measured without the real API.
+
+Use it in-process through ``httpx.ASGITransport`` (see the ``banesco_stand_in``
+fixtures in ``tests/conftest.py``) or run it standalone::
+
+    PYTHONPATH=src python tests/stubs/banesco_server.py --port 8090 \\
+        --latency lognormal:0.05,0.6 --error-rate 0.02 --rate-limit-rate 0.01
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import secrets
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import FastAPI, Form, Header, Response
+from fastapi.responses import JSONResponse
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    """Response latency distribution.
+
+    Specs have the form ``kind:params``:
+
+    - ``fixed:S`` always ``S`` seconds
+    - ``uniform:LOW,HIGH`` uniformly between ``LOW`` and ``HIGH`` seconds
+    - ``exponential:MEAN`` exponential with the given mean
+    - ``lognormal:MEDIAN,SIGMA`` log-normal, heavy tailed for larger ``SIGMA``
+    """
+
+    kind: str = "fixed"
+    params: tuple[float, ...] = (0.0,)
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        """Parse a ``kind:params`` spec.
+
+        Raises:
+            ValueError: If the spec is malformed
+        """
+        kind, _, raw_params = spec.partition(":")
+        params = tuple(float(p) for p in raw_params.split(",") if p)
+        expected = {"fixed": 1, "uniform": 2, "exponential": 1, "lognormal": 2}
+        if expected.get(kind) != len(params):
+            raise ValueError(f"Invalid latency spec: {spec!r}")
+        return cls(kind=kind, params=params)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw a latency in seconds."""
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        if self.kind == "exponential":
+            return rng.expovariate(1 / self.params[0]) if self.params[0] else 0.0
+        median, sigma = self.params
+        return rng.lognormvariate(math.log(median), sigma) if median else 0.0
+
+
+@dataclass
+class StandInConfig:
+    """Behavior of the stand-in.
+
+    Rates are probabilities (0-1) evaluated per status request, in the order
+    429, 500, 404, after authentication.
+    """
+
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    token_latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    error_rate: float = 0.0
+    not_found_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: int = 1
+    token_ttl: int = 3600
+    auto_create: bool = False
+    seed: int | None = None
+
+
+@dataclass
+class StandInStats:
+    """Counters of what the stand-in has served."""
+
+    token_requests: int = 0
+    status_requests: int = 0
+    not_modified: int = 0
+    body_bytes: int = 0
+    responses: Counter = field(default_factory=Counter)
+
+
+@dataclass
+class StandInTransaction:
+    """A transaction known to the stand-in."""
+
+    payload: dict
+    updated_at: datetime = field(
+        default_factory=lambda: datetime.now(timezone.utc).replace(microsecond=0)
+    )
+
+    @property
+    def body(self) -> bytes:
+        """Serialized response body."""
+        return json.dumps(self.payload, sort_keys=True).encode()
+
+    @property
+    def etag(self) -> str:
+        """Strong validator derived from the body."""
+        return f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+
+    @property
+    def last_modified(self) -> str:
+        """Last-Modified header value."""
+        return format_datetime(self.updated_at, usegmt=True)
+
+
+class BanescoStandIn:
+    """State and behavior of the local Banesco API."""
+
+    def __init__(self, config: StandInConfig | None = None) -> None:
+        """Initialize stand-in.
+
+        Args:
+            config: Behavior settings (defaults: no latency, no injected errors)
+        """
+        self.config = config or StandInConfig()
+        self.rng = random.Random(self.config.seed)
+        self.tokens: dict[str, float] = {}
+        self.token_clients: dict[str, str] = {}
+        self.revoked_clients: set[str] = set()
+        self.transactions: dict[str, StandInTransaction] = {}
+        self.stats = StandInStats()
+
+    def set_transaction(self, transaction_id: str, payload: dict) -> None:
+        """Create or update a transaction, changing its validators."""
+        self.transactions[transaction_id] = StandInTransaction(payload=payload)
+
+    def get_transaction(self, transaction_id: str) -> StandInTransaction | None:
+        """Look up a transaction, creating a pending one if ``auto_create``."""
+        if transaction_id not in self.transactions and self.config.auto_create:
+            self.set_transaction(
+                transaction_id,
+                {"reference": transaction_id, "status": "pending", "amount": 100.0},
+            )
+        return self.transactions.get(transaction_id)
+
+    def issue_token(self, client_id: str = "") -> str:
+        """Issue a new access token valid for ``token_ttl`` seconds."""
+        token = secrets.token_urlsafe(16)
+        self.tokens[token] = time.monotonic() + self.config.token_ttl
+        self.token_clients[token] = client_id
+        return token
+
+    def revoke_client(self, client_id: str) -> None:
+        """Answer 401 to every status request made with the client's tokens."""
+        self.revoked_clients.add(client_id)
+
+    def expire_tokens(self) -> None:
+        """Invalidate every issued token immediately."""
+        self.tokens.clear()
+
+    def is_authorized(self, authorization: str | None) -> bool:
+        """Check a Bearer Authorization header against unexpired tokens."""
+        if not authorization or not authorization.startswith("Bearer "):
+            return False
+        token = authorization.removeprefix("Bearer ")
+        expires_at = self.tokens.get(token)
+        if self.token_clients.get(token) in self.revoked_clients:
+            return False
+        return expires_at is not None and time.monotonic() < expires_at
+
+    def roll(self, rate: float) -> bool:
+        """Decide whether an injected outcome with the given rate happens."""
+        return rate > 0 and self.rng.random() < rate
+
+    @staticmethod
+    def is_not_modified(
+        transaction: StandInTransaction,
+        if_none_match: str | None,
+        if_modified_since: str | None,
+    ) -> bool:
+        """Evaluate conditional request headers (RFC 9110 section 13.2.2)."""
+        if if_none_match is not None:
+            candidates = {tag.strip() for tag in if_none_match.split(",")}
+            return "*" in candidates or transaction.etag in candidates
+
+        if if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            return transaction.updated_at <= since
+
+        return False
+
+
+def create_app(stand_in: BanescoStandIn | None = None) -> FastAPI:
+    """Create the stand-in ASGI application.
+
+    Args:
+        stand_in: Stand-in state (a new one is created if omitted)
+
+    Returns:
+        FastAPI application; its state is available as ``app.state.stand_in``
+    """
+    stand_in = stand_in or BanescoStandIn()
+    app = FastAPI(title="Banesco API stand-in")
+    app.state.stand_in = stand_in
+
+    def respond(response: Response) -> Response:
+        stand_in.stats.responses[response.status_code] += 1
+        return response
+
+    @app.post("/oauth/token")
+    async def token(
+        grant_type: str = Form(...),
+        client_id: str = Form(...),
+        client_secret: str = Form(...),
+    ) -> Response:
+        stand_in.stats.token_requests += 1
+        await asyncio.sleep(stand_in.config.token_latency.sample(stand_in.rng))
+        if grant_type != "client_credentials":
+            return JSONResponse({"error": "unsupported_grant_type"}, status_code=400)
+        return JSONResponse(
+            {
+                "access_token": stand_in.issue_token(client_id),
+                "token_type": "Bearer",
+                "expires_in": stand_in.config.token_ttl,
+            }
+        )
+
+    @app.get("/transactions/{transaction_id}")
+    async def transaction_status(
+        transaction_id: str,
+        authorization: str | None = Header(None),
+        if_none_match: str | None = Header(None),
+        if_modified_since: str | None = Header(None),
+    ) -> Response:
+        config = stand_in.config
+        stand_in.stats.status_requests += 1
+        await asyncio.sleep(config.latency.sample(stand_in.rng))
+
+        if not stand_in.is_authorized(authorization):
+            return respond(JSONResponse({"error": "invalid_token"}, status_code=401))
+        if stand_in.roll(config.rate_limit_rate):
+            return respond(
+                JSONResponse(
+                    {"error": "rate_limited"},
+                    status_code=429,
+                    headers={"Retry-After": str(config.retry_after)},
+                )
+            )
+        if stand_in.roll(config.error_rate):
+            return respond(JSONResponse({"error": "internal"}, status_code=500))
+
+        transaction = stand_in.get_transaction(transaction_id)
+        if transaction is None or stand_in.roll(config.not_found_rate):
+            return respond(JSONResponse({"error": "not_found"}, status_code=404))
+
+        headers = {
+            "ETag": transaction.etag,
+            "Last-Modified": transaction.last_modified,
+        }
+        if stand_in.is_not_modified(transaction, if_none_match, if_modified_since):
+            stand_in.stats.not_modified += 1
+            return respond(Response(status_code=304, headers=headers))
+
+        body = transaction.body
+        stand_in.stats.body_bytes += len(body)
+        return respond(Response(body, media_type="application/json", headers=headers))
+
+    return app
+
+
+def main() -> None:
+    """Run the stand-in with uvicorn."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", default="fixed:0", type=LatencyDistribution.parse)
+    parser.add_argument(
+        "--token-latency", default="fixed:0", type=LatencyDistribution.parse
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--not-found-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--token-ttl", type=int, default=3600)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = StandInConfig(
+        latency=args.latency,
+        token_latency=args.token_latency,
+        error_rate=args.error_rate,
+        not_found_rate=args.not_found_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        token_ttl=args.token_ttl,
+        auto_create=True,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(BanescoStandIn(config)), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Local stand-in for Banesco's webhook sender.
+
+Signs transaction status notifications the way Banesco does and posts them
+to the webhook endpoint, so ingestion can be exercised without the real
+bank. Signatures are computed independently of the application code.
+
+Use it in-process with an ``httpx.AsyncClient`` over ``httpx.ASGITransport``
+or run it standalone against a running API::
+
+    python tests/stubs/webhook_sender.py --url http://localhost:8000 \\
+        --secret whsec --status COMPLETED TRX-1 TRX-2
+"""
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+
+import httpx
+
+WEBHOOK_PATH = "/api/v1/webhooks/banesco"
+
+
+class BanescoWebhookSender:
+    """Builds and posts signed Banesco status notifications."""
+
+    def __init__(
+        self, client: httpx.AsyncClient, secret: str, path: str = WEBHOOK_PATH
+    ) -> None:
+        self.client = client
+        self.secret = secret
+        self.path = path
+
+    def sign(self, timestamp: str, body: bytes) -> str:
+        """Hex HMAC-SHA256 of ``"{timestamp}." + body``."""
+        return hmac.new(
+            self.secret.encode(), f"{timestamp}.".encode() + body, hashlib.sha256
+        ).hexdigest()
+
+    async def send(
+        self,
+        transaction_id: str,
+        status: str,
+        event_id: str | None = None,
+        timestamp: float | None = None,
+        signature: str | None = None,
+    ) -> httpx.Response:
+        """Post one notification, optionally with a forged timestamp or signature."""
+        body = json.dumps(
+            {
+                "transaction_id": transaction_id,
+                "status": status,
+                "event_id": event_id or str(uuid.uuid4()),
+                "occurred_at": datetime.now(timezone.utc).isoformat(),
+            }
+        ).encode()
+        sent_at = str(int(time.time() if timestamp is None else timestamp))
+        return await self.client.post(
+            self.path,
+            content=body,
+            headers={
+                "Content-Type": "application/json",
+                "X-Banesco-Timestamp": sent_at,
+                "X-Banesco-Signature": signature or self.sign(sent_at, body),
+            },
+        )
+
+
+async def _send_all(args: argparse.Namespace) -> None:
+    """Send one notification per transaction ID and print the answers."""
+    async with httpx.AsyncClient(base_url=args.url) as client:
+        sender = BanescoWebhookSender(client, args.secret)
+        for transaction_id in args.transaction_ids:
+            response = await sender.send(transaction_id, args.status)
+            print(transaction_id, response.status_code, response.text)
+
+
+def main() -> None:
+    """Send notifications from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--secret", required=True)
+    parser.add_argument("--status", default="COMPLETED")
+    parser.add_argument("transaction_ids", nargs="+")
+    asyncio.run(_send_all(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Unit tests for bank connectors and BankConnectorRegistry."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from stubs.banesco_server import BanescoStandIn
+
+from domain.entities.transaction import BankType
+from domain.services.bank_connector import BankHealth, BankStatusResult, IBankConnector
+from infrastructure.external.banesco_client import (
+    BanescoClient,
+    BanescoRateLimitError,
+)
+from infrastructure.external.bank_connectors import (
+    BanescoConnector,
+    BankConnectorRegistry,
+    UnsupportedBankError,
+)
+from infrastructure.rate_limit import RateLimitDecision
+
+
+class FakeConnector(IBankConnector):
+    """Connector answering after a fixed delay, or failing."""
+
+    def __init__(
+        self, bank: BankType, delay: float = 0.0, error: Exception | None = None
+    ) -> None:
+        self.bank = bank
+        self.delay = delay
+        self.error = error
+        self.closed = False
+
+    async def get_transaction_status(self, transaction_id: str) -> BankStatusResult:
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            return BankStatusResult(
+                bank=self.bank, transaction_id=transaction_id, error=self.error
+            )
+        return BankStatusResult(
+            bank=self.bank, transaction_id=transaction_id, data={"status": "OK"}
+        )
+
+    async def get_transaction_statuses(
+        self, transaction_ids: Iterable[str], concurrency: int | None = None
+    ) -> dict[str, BankStatusResult]:
+        return {tid: await self.get_transaction_status(tid) for tid in transaction_ids}
+
+    async def health_check(self) -> BankHealth:
+        return BankHealth(bank=self.bank, healthy=self.error is None)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestBankConnectorRegistry:
+    """Test suite for BankConnectorRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_slow_bank_does_not_hold_up_fan_out(self) -> None:
+        """Test a bank past its timeout is reported without delaying others."""
+        registry = BankConnectorRegistry(
+            [
+                FakeConnector(BankType.BANESCO),
+                FakeConnector(BankType.MOBILE_TRANSFER, delay=5),
+            ],
+            timeout=0.1,
+        )
+
+        started_at = time.perf_counter()
+        results = await registry.fan_out("REF-1")
+
+        assert time.perf_counter() - started_at < 1
+        assert results[BankType.BANESCO].found
+        slow = results[BankType.MOBILE_TRANSFER]
+        assert not slow.ok
+        assert isinstance(slow.error, TimeoutError)
+
+    @pytest.mark.asyncio
+    async def test_fan_out_to_selected_or_unknown_banks(self) -> None:
+        """Test fan-out honors the bank filter and rejects unknown banks."""
+        registry = BankConnectorRegistry([FakeConnector(BankType.BANESCO)])
+
+        results = await registry.fan_out("REF-1", banks=[BankType.BANESCO])
+
+        assert list(results) == [BankType.BANESCO]
+        with pytest.raises(UnsupportedBankError):
+            await registry.fan_out("REF-1", banks=[BankType.MOBILE_TRANSFER])
+
+    @pytest.mark.asyncio
+    async def test_health_and_close_cover_every_bank(self) -> None:
+        """Test health reports per bank and close reaches every connector."""
+        healthy = FakeConnector(BankType.BANESCO)
+        failing = FakeConnector(BankType.MOBILE_TRANSFER, error=RuntimeError("down"))
+        registry = BankConnectorRegistry([healthy, failing])
+
+        reports = await registry.health()
+        await registry.close()
+
+        assert [(r.bank, r.healthy) for r in reports] == [
+            (BankType.BANESCO, True),
+            (BankType.MOBILE_TRANSFER, False),
+        ]
+        assert healthy.closed and failing.closed
+
+    def test_duplicate_bank_is_rejected(self) -> None:
+        """Test two connectors cannot serve the same bank."""
+        with pytest.raises(ValueError):
+            BankConnectorRegistry(
+                [FakeConnector(BankType.BANESCO), FakeConnector(BankType.BANESCO)]
+            )
+
+
+class TestBanescoConnector:
+    """Test suite for BanescoConnector against the Banesco stand-in."""
+
+    @pytest.mark.asyncio
+    async def test_lookups_map_to_bank_results(
+        self, banesco_stand_in: BanescoStandIn, banesco_stand_in_client: BanescoClient
+    ) -> None:
+        """Test found, not found and batch lookups through the connector."""
+        banesco_stand_in.set_transaction("TRX-1", {"status": "approved"})
+        connector = BanescoConnector(banesco_stand_in_client)
+
+        found = await connector.get_transaction_status("TRX-1")
+        missing = await connector.get_transaction_status("TRX-404")
+        batch = await connector.get_transaction_statuses(["TRX-1", "TRX-404"])
+        health = await connector.health_check()
+
+        assert found.found and found.data == {"status": "approved"}
+        assert missing.ok and not missing.found
+        assert batch["TRX-1"].found and batch["TRX-404"].ok
+        assert health.healthy
+        assert health.details["circuit"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_lookups_count_against_the_transaction_limit(
+        self, banesco_stand_in: BanescoStandIn, banesco_stand_in_client: BanescoClient
+    ) -> None:
+        """Test a lookup over the per-transaction limit never reaches Banesco."""
+        banesco_stand_in.set_transaction("TRX-1", {"status": "approved"})
+        session = Mock(commit=AsyncMock())
+
+        @asynccontextmanager
+        async def session_factory() -> AsyncIterator[Mock]:
+            yield session
+
+        rate_limit_backend = Mock(
+            acquire=AsyncMock(
+                side_effect=[
+                    RateLimitDecision(allowed=True, count=1),
+                    RateLimitDecision(allowed=False, count=1, retry_after=30),
+                ]
+            )
+        )
+        connector = BanescoConnector(
+            banesco_stand_in_client,
+            session_factory=session_factory,
+            banesco_rate_limit=1,
+            rate_limit_backend=rate_limit_backend,
+        )
+
+        first = await connector.get_transaction_status("TRX-1")
+        second = await connector.get_transaction_status("TRX-1")
+
+        assert first.found
+        assert isinstance(second.error, BanescoRateLimitError)
+        assert second.error.retry_after == 30
+        assert banesco_stand_in.stats.status_requests == 1
+        rate_limit_backend.acquire.assert_awaited_with("TRANSACTION_ID", "TRX-1", 1, 60)
+        assert session.commit.await_count == 2
@@ -0,0 +1,186 @@
+"""Unit tests for CircuitBreaker."""
+
+import pytest
+
+from infrastructure.resilience import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test suite for CircuitBreaker."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """Create fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def breaker(self, clock: FakeClock) -> CircuitBreaker:
+        """Create circuit breaker with a small window."""
+        return CircuitBreaker(
+            name="test",
+            failure_rate_threshold=0.5,
+            slow_call_rate_threshold=0.5,
+            slow_call_duration=2.0,
+            minimum_calls=4,
+            window_size=4,
+            open_duration=30.0,
+            clock=clock,
+        )
+
+    def test_opens_when_failure_rate_reached(self, breaker: CircuitBreaker) -> None:
+        """Test the circuit opens once the failure rate hits the threshold."""
+        breaker.record_success(breaker.allow(), 0.1)
+        breaker.record_success(breaker.allow(), 0.1)
+        breaker.record_failure(breaker.allow(), 0.1)
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure(breaker.allow(), 0.1)
+
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.allow()
+        assert exc_info.value.retry_after == 30.0
+
+    def test_opens_when_calls_are_slow(self, breaker: CircuitBreaker) -> None:
+        """Test slow successful calls also open the circuit."""
+        for _ in range(2):
+            breaker.record_success(breaker.allow(), 0.1)
+        for _ in range(2):
+            breaker.record_success(breaker.allow(), 3.0)
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_half_open_allows_single_probe(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test only one probe is admitted after the open period."""
+        for _ in range(4):
+            breaker.record_failure(breaker.allow(), 0.1)
+        clock.now = 31.0
+
+        breaker.allow()
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.allow()
+
+    def test_probe_success_closes_circuit(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test a successful probe closes the circuit."""
+        for _ in range(4):
+            breaker.record_failure(breaker.allow(), 0.1)
+        clock.now = 31.0
+        probe = breaker.allow()
+
+        breaker.record_success(probe, 0.1)
+
+        assert breaker.state == CircuitState.CLOSED
+        breaker.allow()
+
+    def test_probe_failure_reopens_circuit(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test a failed probe opens the circuit for another period."""
+        for _ in range(4):
+            breaker.record_failure(breaker.allow(), 0.1)
+        clock.now = 31.0
+        probe = breaker.allow()
+
+        breaker.record_failure(probe, 0.1)
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.retry_after == 30.0
+
+    def test_stragglers_do_not_resolve_the_probe(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test calls admitted before the circuit opened are ignored."""
+        straggler = breaker.allow()
+        for _ in range(4):
+            breaker.record_failure(breaker.allow(), 0.1)
+        clock.now = 31.0
+        probe = breaker.allow()
+
+        breaker.record_success(straggler, 31.0)
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.allow()
+        breaker.record_success(probe, 0.1)
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_late_failures_do_not_extend_open_period(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test failures of calls admitted while closed do not count later."""
+        stragglers = [breaker.allow() for _ in range(4)]
+        for _ in range(4):
+            breaker.record_failure(breaker.allow(), 0.1)
+        clock.now = 20.0
+
+        for ticket in stragglers:
+            breaker.record_failure(ticket, 20.0)
+
+        assert breaker.retry_after == 10.0
+
+    def test_released_straggler_keeps_the_probe_exclusive(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test a cancelled old call does not admit a second probe."""
+        straggler = breaker.allow()
+        for _ in range(4):
+            breaker.record_failure(breaker.allow(), 0.1)
+        clock.now = 31.0
+        breaker.allow()
+
+        breaker.release(straggler)
+
+        with pytest.raises(CircuitOpenError):
+            breaker.allow()
+
+    @pytest.mark.asyncio
+    async def test_call_ignores_non_failures(self, breaker: CircuitBreaker) -> None:
+        """Test exceptions excluded by is_failure do not open the circuit."""
+
+        async def not_found() -> None:
+            raise LookupError("not found")
+
+        for _ in range(4):
+            with pytest.raises(LookupError):
+                await breaker.call(
+                    not_found, is_failure=lambda e: not isinstance(e, LookupError)
+                )
+
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_neutral_outcomes_are_not_successes(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        """Test a probe that only ran out of the caller's time is released."""
+        for _ in range(4):
+            breaker.record_failure(breaker.allow(), 0.1)
+        clock.now = 31.0
+
+        async def out_of_time() -> None:
+            raise TimeoutError("caller deadline")
+
+        with pytest.raises(TimeoutError):
+            await breaker.call(
+                out_of_time, is_neutral=lambda e: isinstance(e, TimeoutError)
+            )
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        breaker.record_failure(breaker.allow(), 0.1)
+        assert breaker.state == CircuitState.OPEN
@@ -0,0 +1,137 @@
+"""Unit tests for AIMDConcurrencyLimiter."""
+
+import asyncio
+
+import pytest
+from prometheus_client import CollectorRegistry, Gauge
+
+from infrastructure.resilience import (
+    AIMDConcurrencyLimiter,
+    ConcurrencyLimitExceededError,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAIMDConcurrencyLimiter:
+    """Test suite for AIMDConcurrencyLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_callers_above_limit_wait_in_order(self) -> None:
+        """Test slots are handed to waiters in FIFO order on release."""
+        limiter = AIMDConcurrencyLimiter(initial_limit=1, max_wait=1.0)
+        order: list[int] = []
+
+        await limiter.acquire()
+        waiters = [
+            asyncio.create_task(limiter.acquire()),
+            asyncio.create_task(limiter.acquire()),
+        ]
+        for i, waiter in enumerate(waiters):
+            waiter.add_done_callback(lambda _, i=i: order.append(i))
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 2
+
+        limiter.release()
+        await waiters[0]
+        limiter.release()
+        await waiters[1]
+
+        assert order == [0, 1]
+        assert limiter.in_flight == 1
+        assert limiter.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_is_bounded(self) -> None:
+        """Test callers give up after the wait bound or when the queue is full."""
+        limiter = AIMDConcurrencyLimiter(initial_limit=1, max_queue=1)
+        await limiter.acquire()
+
+        with pytest.raises(ConcurrencyLimitExceededError):
+            await limiter.acquire(timeout=0.01)
+        assert limiter.queue_depth == 0
+
+        waiter = asyncio.create_task(limiter.acquire(timeout=1.0))
+        await asyncio.sleep(0)
+        with pytest.raises(ConcurrencyLimitExceededError):
+            await limiter.acquire(timeout=1.0)
+
+        limiter.release()
+        await waiter
+        assert limiter.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_additive_increase_on_fast_calls(self) -> None:
+        """Test fast successes grow the limit while it is being used."""
+        clock = FakeClock()
+        limiter = AIMDConcurrencyLimiter(
+            initial_limit=2, latency_target=1.0, clock=clock
+        )
+
+        async def fast() -> str:
+            clock.now += 0.1
+            return "ok"
+
+        async def slow() -> str:
+            clock.now += 5.0
+            return "ok"
+
+        await limiter.call(fast)
+        assert limiter.limit == pytest.approx(2.5)
+
+        await limiter.call(slow)
+        assert limiter.limit == pytest.approx(2.5)
+
+    @pytest.mark.asyncio
+    async def test_multiplicative_decrease_on_overload(self) -> None:
+        """Test overload errors shrink the limit down to the minimum."""
+        limiter = AIMDConcurrencyLimiter(
+            initial_limit=10, min_limit=2, decrease_factor=0.5
+        )
+
+        async def overloaded() -> None:
+            raise TimeoutError()
+
+        for expected in (5.0, 2.5, 2.0):
+            with pytest.raises(TimeoutError):
+                await limiter.call(overloaded, is_overload=lambda e: True)
+            assert limiter.limit == expected
+
+        with pytest.raises(TimeoutError):
+            await limiter.call(overloaded)
+        assert limiter.limit == 2.0
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_metrics_are_exported(self) -> None:
+        """Test limit, queue depth and in-flight gauges follow the limiter."""
+        registry = CollectorRegistry()
+        limit = Gauge("test_limit", "Limit", registry=registry)
+        queue = Gauge("test_queue", "Queue", registry=registry)
+        in_flight = Gauge("test_in_flight", "In flight", registry=registry)
+        limiter = AIMDConcurrencyLimiter(
+            initial_limit=1,
+            limit_metric=limit,
+            queue_metric=queue,
+            in_flight_metric=in_flight,
+        )
+
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire(timeout=1.0))
+        await asyncio.sleep(0)
+
+        assert registry.get_sample_value("test_limit") == 1
+        assert registry.get_sample_value("test_queue") == 1
+        assert registry.get_sample_value("test_in_flight") == 1
+
+        limiter.release()
+        await waiter
+        assert registry.get_sample_value("test_queue") == 0
@@ -0,0 +1,115 @@
+"""Unit tests for BanescoCredentialPool."""
+
+from unittest.mock import Mock
+
+from prometheus_client import CollectorRegistry, Counter, Gauge
+
+from infrastructure.external.banesco_credentials import (
+    BanescoCredential,
+    BanescoCredentialPool,
+)
+from infrastructure.resilience import AdaptiveTokenBucket
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_credential(name: str, rate: float = 5.0) -> BanescoCredential:
+    """Create a credential with a mock OAuth client."""
+    return BanescoCredential(
+        name=name, oauth_client=Mock(), throttle=AdaptiveTokenBucket(rate=rate)
+    )
+
+
+class TestBanescoCredentialPool:
+    """Test suite for BanescoCredentialPool."""
+
+    def test_calls_go_to_least_loaded_credential(self) -> None:
+        """Test calls spread by in-flight count relative to throttle rate."""
+        fast, slow = make_credential("fast", rate=10.0), make_credential("slow", 2.0)
+        pool = BanescoCredentialPool([fast, slow])
+
+        picked = [pool.acquire().name for _ in range(6)]
+
+        assert picked.count("fast") == 5
+        assert picked.count("slow") == 1
+
+        pool.release(fast)
+        assert fast.in_flight == 4
+
+    def test_repeated_rejections_eject_credential(self) -> None:
+        """Test consecutive 429/401 answers take a credential out of rotation."""
+        clock = FakeClock()
+        registry = CollectorRegistry()
+        ejections = Counter(
+            "ejections", "Ejections", ["credential", "reason"], registry=registry
+        )
+        healthy = Gauge("healthy", "Healthy", ["credential"], registry=registry)
+        first, second = make_credential("first"), make_credential("second")
+        pool = BanescoCredentialPool(
+            [first, second],
+            eject_after=3,
+            eject_duration=60,
+            healthy_metric=healthy,
+            ejections_metric=ejections,
+            clock=clock,
+        )
+
+        pool.record_rejection(first, "rate_limited")
+        pool.record_success(first)
+        pool.record_rejection(first, "rate_limited")
+        pool.record_rejection(first, "unauthorized")
+        assert pool.is_healthy(first)
+
+        pool.record_rejection(first, "unauthorized")
+
+        assert not pool.is_healthy(first)
+        assert pool.healthy() == [second]
+        assert all(pool.acquire() is second for _ in range(3))
+        assert (
+            registry.get_sample_value(
+                "ejections_total", {"credential": "first", "reason": "unauthorized"}
+            )
+            == 1
+        )
+        assert registry.get_sample_value("healthy", {"credential": "first"}) == 0
+
+    def test_returning_credential_is_ejected_again_on_next_rejection(self) -> None:
+        """Test a reinstated credential needs a success to be fully healthy."""
+        clock = FakeClock()
+        credential = make_credential("only")
+        pool = BanescoCredentialPool(
+            [credential], eject_after=2, eject_duration=30, clock=clock
+        )
+        pool.record_rejection(credential, "rate_limited")
+        pool.record_rejection(credential, "rate_limited")
+
+        clock.now = 31
+        assert pool.is_healthy(credential)
+        pool.record_rejection(credential, "rate_limited")
+        assert not pool.is_healthy(credential)
+
+        clock.now = 62
+        pool.record_success(credential)
+        pool.record_rejection(credential, "rate_limited")
+        assert pool.is_healthy(credential)
+
+    def test_all_ejected_uses_first_to_recover(self) -> None:
+        """Test calls still go out when every credential is ejected."""
+        clock = FakeClock()
+        first, second = make_credential("first"), make_credential("second")
+        pool = BanescoCredentialPool(
+            [first, second], eject_after=1, eject_duration=60, clock=clock
+        )
+        pool.record_rejection(first, "rate_limited")
+        clock.now = 10
+        pool.record_rejection(second, "rate_limited")
+
+        assert pool.acquire() is first
@@ -0,0 +1,69 @@
+"""Unit tests for request-scoped deadlines."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from infrastructure.resilience import (
+    DeadlineExceededError,
+    cap_timeout,
+    clear_deadline,
+    deadline_scope,
+    remaining_time,
+    stop_before_deadline,
+)
+
+
+class TestDeadline:
+    """Test suite for deadline helpers."""
+
+    def test_no_deadline_by_default(self) -> None:
+        """Test operations are unbounded outside a scope."""
+        assert remaining_time() is None
+        assert cap_timeout(30) == 30
+
+    def test_nested_scopes_only_shorten(self) -> None:
+        """Test an inner scope cannot extend the enclosing deadline."""
+        with deadline_scope(1.0):
+            with deadline_scope(60.0):
+                assert remaining_time() <= 1.0
+            with deadline_scope(0.5):
+                assert remaining_time() <= 0.5
+            assert 0.5 < remaining_time() <= 1.0
+        assert remaining_time() is None
+
+    def test_cap_timeout(self) -> None:
+        """Test timeouts are capped to the time left."""
+        with deadline_scope(2.0):
+            assert cap_timeout(30) <= 2.0
+            assert cap_timeout(1.0) == 1.0
+
+        with deadline_scope(0), pytest.raises(DeadlineExceededError):
+            cap_timeout(30)
+
+    def test_stop_before_deadline(self) -> None:
+        """Test retries stop when backoff plus an attempt exceeds the deadline."""
+        stop = stop_before_deadline(min_attempt_time=0.5)
+
+        assert stop(Mock(upcoming_sleep=100)) is False
+        with deadline_scope(5.0):
+            assert stop(Mock(upcoming_sleep=1.0)) is False
+            assert stop(Mock(upcoming_sleep=4.8)) is True
+
+    @pytest.mark.asyncio
+    async def test_tasks_inherit_and_can_clear_deadline(self) -> None:
+        """Test child tasks see the deadline unless they clear it."""
+
+        async def child(clear: bool) -> float | None:
+            if clear:
+                clear_deadline()
+            return remaining_time()
+
+        with deadline_scope(1.0):
+            inherited = await asyncio.create_task(child(clear=False))
+            cleared = await asyncio.create_task(child(clear=True))
+            assert remaining_time() is not None
+
+        assert inherited is not None and inherited <= 1.0
+        assert cleared is None
@@ -0,0 +1,113 @@
+"""Unit tests for Hedger."""
+
+import asyncio
+
+import pytest
+from prometheus_client import CollectorRegistry, Counter
+
+from infrastructure.resilience import Hedger
+
+
+def warmed_hedger(latency: float = 0.01, **kwargs: object) -> Hedger:
+    """Create a hedger with enough samples to start hedging."""
+    hedger = Hedger(min_delay=0, min_samples=5, **kwargs)
+    for _ in range(5):
+        hedger.observe(latency)
+    return hedger
+
+
+class TestHedger:
+    """Test suite for Hedger."""
+
+    def test_delay_follows_latency_quantile(self) -> None:
+        """Test the hedge delay is the configured quantile of recent latencies."""
+        hedger = Hedger(quantile=0.9, min_delay=0.05, min_samples=10)
+        for i in range(1, 10):
+            hedger.observe(i / 10)
+        assert hedger.delay() is None
+
+        hedger.observe(1.0)
+        assert hedger.delay() == 0.9
+
+        fast = Hedger(min_delay=0.05, min_samples=1)
+        fast.observe(0.001)
+        assert fast.delay() == 0.05
+
+    @pytest.mark.asyncio
+    async def test_slow_call_is_hedged(self) -> None:
+        """Test the hedge answers when the first call is slow."""
+        metric = Counter(
+            "test_hedges_total", "Hedges", ["result"], registry=CollectorRegistry()
+        )
+        hedger = warmed_hedger(metric=metric)
+        cancelled = asyncio.Event()
+
+        async def slow() -> str:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "slow"
+
+        async def fast() -> str:
+            return "hedge"
+
+        result = await hedger.run(slow, hedge_fn=fast)
+        await asyncio.sleep(0)
+
+        assert result == "hedge"
+        assert cancelled.is_set()
+        assert metric.labels(result="sent")._value.get() == 1
+        assert metric.labels(result="won")._value.get() == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_is_skipped_when_not_allowed(self) -> None:
+        """Test no hedge is sent when the budget refuses it."""
+        hedger = warmed_hedger()
+        calls = 0
+
+        async def call() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return calls
+
+        assert await hedger.run(call, allow_hedge=lambda: False) == 1
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_waits_for_first_call(self) -> None:
+        """Test a failing hedge does not hide the first call's answer."""
+        hedger = warmed_hedger()
+
+        async def slow() -> str:
+            await asyncio.sleep(0.05)
+            return "first"
+
+        async def failing() -> str:
+            raise RuntimeError("throttled")
+
+        assert await hedger.run(slow, hedge_fn=failing) == "first"
+
+    @pytest.mark.asyncio
+    async def test_final_error_is_returned_immediately(self) -> None:
+        """Test a definitive error from either call ends the race."""
+        hedger = warmed_hedger()
+
+        async def slow() -> str:
+            await asyncio.sleep(10)
+            return "slow"
+
+        async def not_found() -> str:
+            raise LookupError("missing")
+
+        with pytest.raises(LookupError):
+            await asyncio.wait_for(
+                hedger.run(
+                    slow,
+                    hedge_fn=not_found,
+                    is_final=lambda e: isinstance(e, LookupError),
+                ),
+                timeout=1,
+            )
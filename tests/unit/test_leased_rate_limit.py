@@ -0,0 +1,116 @@
+"""Unit tests for LeasedRateLimitBackend."""
+
+import pytest
+from benchmarks.rate_limit_lease import (
+    InMemoryRedisBackend,
+    RoundTripCounter,
+    run_benchmark,
+)
+
+from infrastructure.rate_limit import LeasedRateLimitBackend
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_backend(
+    lease_size: int = 10, min_limit: int = 20
+) -> tuple[LeasedRateLimitBackend, RoundTripCounter, FakeClock]:
+    """Create a leased backend over an in-memory shared counter."""
+    clock = FakeClock()
+    counter = RoundTripCounter(InMemoryRedisBackend())
+    backend = LeasedRateLimitBackend(
+        counter, lease_size=lease_size, lease_ttl=5.0, min_limit=min_limit, clock=clock
+    )
+    return backend, counter, clock
+
+
+class TestLeasedRateLimitBackend:
+    """Test suite for process-local quota leases."""
+
+    @pytest.mark.asyncio
+    async def test_requests_are_served_from_the_lease(self) -> None:
+        """Test one round trip covers ``lease_size`` requests."""
+        backend, counter, _ = make_backend(lease_size=10)
+
+        decisions = [await backend.acquire("KEY", "hot", 100, 60) for _ in range(25)]
+
+        assert all(d.allowed for d in decisions)
+        assert [d.count for d in decisions[:3]] == [1, 2, 3]
+        assert counter.round_trips == 3
+
+    @pytest.mark.asyncio
+    async def test_leftovers_are_returned_when_the_lease_expires(self) -> None:
+        """Test unused tokens go back to the shared counter."""
+        backend, counter, clock = make_backend(lease_size=10)
+        for _ in range(3):
+            await backend.acquire("KEY", "hot", 100, 60)
+
+        clock.now += 5.0
+        returned = await backend.release_expired()
+
+        assert returned == 7
+        assert await counter.count("KEY", "hot", 60) == 3
+
+    @pytest.mark.asyncio
+    async def test_exhausted_quota_is_refused_locally(self) -> None:
+        """Test a refused lease is remembered until capacity frees up."""
+        backend, counter, clock = make_backend(lease_size=20)
+        for _ in range(20):
+            assert (await backend.acquire("KEY", "hot", 20, 60)).allowed
+
+        refused = await backend.acquire("KEY", "hot", 20, 60)
+        trips = counter.round_trips
+        again = await backend.acquire("KEY", "hot", 20, 60)
+
+        assert not refused.allowed
+        assert not again.allowed
+        assert counter.round_trips == trips
+        assert 0 < again.retry_after <= refused.retry_after
+
+    @pytest.mark.asyncio
+    async def test_low_limits_go_to_redis_every_time(self) -> None:
+        """Test limits below ``min_limit`` keep their exact accounting."""
+        backend, counter, _ = make_backend(min_limit=20)
+
+        decisions = [await backend.acquire("KEY", "low", 2, 60) for _ in range(3)]
+
+        assert [d.allowed for d in decisions] == [True, True, False]
+        assert counter.round_trips == 3
+
+    @pytest.mark.asyncio
+    async def test_stop_returns_every_lease(self) -> None:
+        """Test shutting down hands back the tokens still held."""
+        backend, counter, _ = make_backend(lease_size=10)
+        await backend.acquire("KEY", "a", 100, 60)
+        await backend.acquire("KEY", "b", 100, 60)
+
+        await backend.stop()
+
+        assert await counter.count("KEY", "a", 60) == 1
+        assert await counter.count("KEY", "b", 60) == 1
+
+
+class TestLeasedRateLimitBenchmark:
+    """Smoke run of the lease benchmark."""
+
+    @pytest.mark.asyncio
+    async def test_leases_cut_round_trips_within_the_bound(self) -> None:
+        """Test leasing stays within its bound with far fewer round trips."""
+        backend = InMemoryRedisBackend()
+        settings = {"processes": 4, "requests": 500, "limit": 1000}
+
+        direct = await run_benchmark(backend, **settings)
+        leased = await run_benchmark(backend, lease_size=20, **settings)
+
+        assert direct.round_trips == direct.requests
+        assert leased.round_trips * 10 <= direct.round_trips
+        assert direct.max_admitted_per_window <= 1000
+        assert leased.max_admitted_per_window <= 1000 + 4 * 20
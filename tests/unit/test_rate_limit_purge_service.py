@@ -0,0 +1,52 @@
+"""Unit tests for RateLimitPurgeService."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from application.services.rate_limit_purge_service import RateLimitPurgeService
+
+
+def make_service(*deleted: int) -> tuple[RateLimitPurgeService, Mock, AsyncMock]:
+    """Create a service whose batches delete ``deleted`` rows in order."""
+    session = Mock(commit=AsyncMock())
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    purge_expired = AsyncMock(side_effect=list(deleted))
+    service = RateLimitPurgeService(session_factory, retention=3600, batch_size=100)
+    return service, session, purge_expired
+
+
+class TestRateLimitPurgeService:
+    """Test suite for the expired window purge."""
+
+    @pytest.mark.asyncio
+    async def test_purges_in_batches_until_done(self) -> None:
+        """Test full batches are followed by another until one comes up short."""
+        service, session, purge_expired = make_service(100, 100, 7)
+
+        with patch(
+            "application.services.rate_limit_purge_service.DatabaseRateLimitBackend"
+        ) as backend:
+            backend.return_value.purge_expired = purge_expired
+            purged = await service.purge_once()
+
+        assert purged == 207
+        assert purge_expired.await_count == 3
+        assert session.commit.await_count == 3
+        before = purge_expired.await_args.args[0]
+        expected = datetime.now(timezone.utc) - timedelta(hours=1)
+        assert abs(before - expected) < timedelta(seconds=5)
+        assert purge_expired.await_args.kwargs == {"limit": 100}
+
+    @pytest.mark.asyncio
+    async def test_stop_without_start(self) -> None:
+        """Test stopping a service that never started is a no-op."""
+        service, _, _ = make_service()
+
+        await service.stop()
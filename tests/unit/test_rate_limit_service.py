@@ -0,0 +1,235 @@
+"""Unit tests for RateLimitService and its backends."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from application.services.rate_limit_service import (
+    RateLimitDeferralError,
+    RateLimitService,
+)
+from infrastructure.rate_limit import (
+    DatabaseRateLimitBackend,
+    FallbackRateLimitBackend,
+    RateLimitDecision,
+    RedisRateLimitBackend,
+)
+from infrastructure.resilience import DeadlineExceededError, deadline_scope
+
+
+def make_service(*within_limit: bool, window_in: float = 0.05) -> RateLimitService:
+    """Create a service whose acquisitions answer ``within_limit`` in order."""
+    session = Mock()
+    session.commit = AsyncMock()
+    service = RateLimitService(session)
+    service.try_acquire = AsyncMock(
+        side_effect=[
+            RateLimitDecision(
+                allowed=allowed, count=1, retry_after=0 if allowed else window_in
+            )
+            for allowed in within_limit
+        ]
+    )
+    return service
+
+
+class TestExecuteOrDefer:
+    """Test suite for RateLimitService.execute_or_defer."""
+
+    @pytest.mark.asyncio
+    async def test_call_within_limit_runs_immediately(self) -> None:
+        """Test a call within the limit is counted, committed and run."""
+        service = make_service(True)
+        fn = AsyncMock(return_value="result")
+
+        result = await service.execute_or_defer("TRANSACTION_ID", "TRX-1", fn)
+
+        assert result == "result"
+        service.try_acquire.assert_awaited_once()
+        service.session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_waiters_share_one_deferred_call(self) -> None:
+        """Test callers over the limit share a single call in the next window."""
+        leader = make_service(False, True)
+        followers = [make_service() for _ in range(4)]
+        fn = AsyncMock(return_value="result")
+
+        results = await asyncio.gather(
+            *(
+                service.execute_or_defer("TRANSACTION_ID", "TRX-2", fn)
+                for service in [leader, *followers]
+            )
+        )
+
+        assert results == ["result"] * 5
+        fn.assert_awaited_once()
+        assert leader.try_acquire.await_count == 2
+        # The refused acquisition is committed before waiting
+        assert leader.session.commit.await_count == 2
+        assert all(f.try_acquire.await_count == 0 for f in followers)
+
+    @pytest.mark.asyncio
+    async def test_deferral_past_deadline_is_rejected(self) -> None:
+        """Test a next window beyond the caller's deadline fails immediately."""
+        service = make_service(False, window_in=30)
+        fn = AsyncMock()
+
+        with deadline_scope(2.0), pytest.raises(RateLimitDeferralError) as exc_info:
+            await service.execute_or_defer("TRANSACTION_ID", "TRX-3", fn)
+
+        assert exc_info.value.retry_after == 30
+        fn.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deferred_failure_reaches_every_waiter(self) -> None:
+        """Test waiters get the error of the shared call."""
+        leader, follower = make_service(False, True), make_service()
+        fn = AsyncMock(side_effect=RuntimeError("upstream down"))
+
+        results = await asyncio.gather(
+            leader.execute_or_defer("TRANSACTION_ID", "TRX-4", fn),
+            follower.execute_or_defer("TRANSACTION_ID", "TRX-4", fn),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        fn.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_joiner_gives_up_at_its_own_deadline(self) -> None:
+        """Test a waiter with a shorter deadline does not wait for the leader."""
+        leader, follower = make_service(False, True), make_service()
+
+        async def slow_call() -> str:
+            await asyncio.sleep(0.5)
+            return "result"
+
+        leading = asyncio.create_task(
+            leader.execute_or_defer("TRANSACTION_ID", "TRX-5", slow_call)
+        )
+        await asyncio.sleep(0)
+        with deadline_scope(0.2), pytest.raises(DeadlineExceededError):
+            await follower.execute_or_defer("TRANSACTION_ID", "TRX-5", slow_call)
+
+        assert not leading.done()
+        assert await leading == "result"
+
+    @pytest.mark.asyncio
+    async def test_joiner_sees_the_leader_cancelled(self) -> None:
+        """Test waiters get a cancellation, not a deferral error."""
+        leader, follower = make_service(False, True, window_in=0.5), make_service()
+        fn = AsyncMock(return_value="result")
+
+        leading = asyncio.create_task(
+            leader.execute_or_defer("TRANSACTION_ID", "TRX-6", fn)
+        )
+        await asyncio.sleep(0)
+        joining = asyncio.create_task(
+            follower.execute_or_defer("TRANSACTION_ID", "TRX-6", fn)
+        )
+        await asyncio.sleep(0)
+        leading.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await joining
+        fn.assert_not_called()
+
+
+class TestRateLimitBackends:
+    """Test suite for the Redis and fallback rate limit backends."""
+
+    @pytest.mark.asyncio
+    async def test_redis_acquire_is_one_script_call(self) -> None:
+        """Test check-and-increment runs as a single atomic script."""
+        script = AsyncMock(return_value=[0, 2, 12500])
+        client = Mock(register_script=Mock(return_value=script))
+        backend = RedisRateLimitBackend(client)
+
+        decision = await backend.acquire("TRANSACTION_ID", "TRX-1", 2, 60)
+
+        assert decision == RateLimitDecision(allowed=False, count=2, retry_after=12.5)
+        script.assert_awaited_once()
+        kwargs = script.await_args.kwargs
+        assert kwargs["keys"] == ["ratelimit:TRANSACTION_ID:TRX-1"]
+        assert kwargs["args"][:2] == [2, 60000]
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_to_database(self) -> None:
+        """Test requests are still limited when Redis is unreachable."""
+        primary = Mock(acquire=AsyncMock(side_effect=ConnectionError("down")))
+        fallback = Mock(
+            acquire=AsyncMock(return_value=RateLimitDecision(allowed=True, count=1))
+        )
+        service = RateLimitService(Mock(), banesco_rate_limit=3)
+        service.backend = FallbackRateLimitBackend(primary, fallback)
+
+        decision = await service.try_acquire("TRANSACTION_ID", "TRX-1")
+
+        assert decision.allowed
+        fallback.acquire.assert_awaited_once_with("TRANSACTION_ID", "TRX-1", 3, 60)
+
+    def test_redis_backend_is_used_when_given(self) -> None:
+        """Test the service keeps the database only as the fallback."""
+        redis_backend = RedisRateLimitBackend(
+            Mock(register_script=Mock(return_value=AsyncMock()))
+        )
+
+        service = RateLimitService(Mock(), redis_backend=redis_backend)
+
+        assert isinstance(service.backend, FallbackRateLimitBackend)
+        assert service.backend.primary is redis_backend
+        assert service.get_limit("OTHER") is None
+
+    @pytest.mark.asyncio
+    async def test_database_acquire_is_one_upsert(self) -> None:
+        """Test the database counts a request with a single conditional upsert."""
+        session = Mock(
+            execute=AsyncMock(
+                return_value=Mock(scalar_one_or_none=Mock(return_value=2))
+            )
+        )
+
+        decision = await DatabaseRateLimitBackend(session).acquire(
+            "TRANSACTION_ID", "TRX-1", 2, 60
+        )
+
+        assert decision == RateLimitDecision(allowed=True, count=2)
+        session.execute.assert_awaited_once()
+        sql = str(
+            session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "ON CONFLICT ON CONSTRAINT unique_rate_limit_window DO UPDATE" in sql
+        assert "WHERE rate_limits.request_count <" in sql
+        assert "RETURNING rate_limits.request_count" in sql
+
+    @pytest.mark.asyncio
+    async def test_database_skipped_update_means_limited(self) -> None:
+        """Test a row already at the limit rejects the request."""
+        session = Mock(
+            execute=AsyncMock(
+                return_value=Mock(scalar_one_or_none=Mock(return_value=None))
+            )
+        )
+
+        decision = await DatabaseRateLimitBackend(session).acquire(
+            "TRANSACTION_ID", "TRX-1", 2, 60
+        )
+
+        assert not decision.allowed
+        assert 0 < decision.retry_after <= 60
+
+    @pytest.mark.asyncio
+    async def test_autocommit_commits_each_admission(self) -> None:
+        """Test long-running callers release each counter row at once."""
+        session = Mock(commit=AsyncMock())
+        service = RateLimitService(session, autocommit=True)
+        service.backend = Mock(
+            acquire=AsyncMock(return_value=RateLimitDecision(allowed=True, count=1))
+        )
+
+        await service.try_acquire("TRANSACTION_ID", "TRX-1")
+
+        session.commit.assert_awaited_once()
@@ -0,0 +1,164 @@
+"""Unit tests for ReconciliationService."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from application.services.reconciliation_service import (
+    ReconciliationService,
+    map_banesco_status,
+)
+from domain.entities.transaction import (
+    ActorType,
+    BankType,
+    Transaction,
+    TransactionStatus,
+    TransactionType,
+)
+from infrastructure.external.banesco_client import (
+    BanescoAPIError,
+    BanescoStatusResult,
+)
+
+
+def make_transaction(transaction_id: str, age: timedelta) -> Transaction:
+    """Create an in-progress transaction of the given age."""
+    return Transaction(
+        id=uuid4(),
+        transaction_id=transaction_id,
+        status=TransactionStatus.IN_PROGRESS,
+        bank=BankType.BANESCO,
+        transaction_type=TransactionType.TRANSACTION,
+        reference="REF",
+        customer_full_name="Test",
+        customer_phone="04141234567",
+        customer_national_id="V12345678",
+        created_at=datetime.now(timezone.utc) - age,
+    )
+
+
+class TestReconciliationService:
+    """Test suite for ReconciliationService."""
+
+    @pytest.fixture
+    def session(self) -> Mock:
+        """Create mock database session."""
+        session = Mock()
+        session.commit = AsyncMock()
+        return session
+
+    @pytest.fixture
+    def repo(self) -> Mock:
+        """Create mock transaction repository."""
+        repo = Mock()
+        repo.bulk_update_status = AsyncMock(
+            side_effect=lambda updates, **_: list(updates)
+        )
+        repo.schedule_reconciliation = AsyncMock()
+        return repo
+
+    @pytest.fixture
+    def banesco_client(self) -> Mock:
+        """Create mock Banesco client."""
+        return Mock(get_transaction_statuses=AsyncMock())
+
+    @pytest.fixture
+    def service(
+        self, session: Mock, repo: Mock, banesco_client: Mock
+    ) -> ReconciliationService:
+        """Create ReconciliationService with mocked dependencies."""
+
+        @asynccontextmanager
+        async def session_factory():
+            yield session
+
+        return ReconciliationService(
+            session_factory,
+            banesco_client,
+            repository_factory=lambda _: repo,
+            base_delay=30,
+            max_delay=3600,
+            doubling_age=600,
+        )
+
+    def test_map_banesco_status(self) -> None:
+        """Test only final Banesco statuses map to a transaction status."""
+        assert map_banesco_status({"status": "approved"}) == TransactionStatus.COMPLETED
+        assert map_banesco_status({"status": "REJECTED"}) == TransactionStatus.CANCELED
+        assert map_banesco_status({"status": "pending"}) is None
+        assert map_banesco_status(None) is None
+
+    def test_delay_backs_off_with_age(self, service: ReconciliationService) -> None:
+        """Test the check delay doubles with age up to the maximum."""
+        assert service.next_delay(timedelta(minutes=5)) == timedelta(seconds=30)
+        assert service.next_delay(timedelta(minutes=25)) == timedelta(seconds=120)
+        assert service.next_delay(timedelta(days=2)) == timedelta(hours=1)
+
+    @pytest.mark.asyncio
+    async def test_final_statuses_are_applied_as_system(
+        self,
+        service: ReconciliationService,
+        repo: Mock,
+        banesco_client: Mock,
+    ) -> None:
+        """Test settled transactions are updated and the rest rescheduled."""
+        done = make_transaction("TRX-DONE", timedelta(minutes=1))
+        pending = make_transaction("TRX-PENDING", timedelta(minutes=25))
+        failed = make_transaction("TRX-FAILED", timedelta(minutes=1))
+        repo.claim_for_reconciliation = AsyncMock(return_value=[done, pending, failed])
+        banesco_client.get_transaction_statuses.return_value = {
+            "TRX-DONE": BanescoStatusResult("TRX-DONE", data={"status": "COMPLETED"}),
+            "TRX-PENDING": BanescoStatusResult(
+                "TRX-PENDING", data={"status": "pending"}
+            ),
+            "TRX-FAILED": BanescoStatusResult("TRX-FAILED", error=BanescoAPIError()),
+        }
+
+        updated = await service.reconcile_once()
+
+        assert updated == 1
+        repo.bulk_update_status.assert_awaited_once()
+        call = repo.bulk_update_status.await_args
+        assert call.args[0] == {"TRX-DONE": TransactionStatus.COMPLETED}
+        assert call.kwargs["actor_type"] == ActorType.SYSTEM
+        assert call.kwargs["event_metadata"] == {
+            "TRX-DONE": {"banesco_status": "COMPLETED"}
+        }
+
+        next_checks = repo.schedule_reconciliation.await_args.args[0]
+        assert set(next_checks) == {pending.id, failed.id}
+        assert next_checks[pending.id] - next_checks[failed.id] == pytest.approx(
+            timedelta(seconds=90), abs=timedelta(seconds=1)
+        )
+        rate_limit_service = banesco_client.get_transaction_statuses.await_args.kwargs[
+            "rate_limit_service"
+        ]
+        assert rate_limit_service.autocommit
+
+    @pytest.mark.asyncio
+    async def test_transactions_settled_meanwhile_are_not_counted(
+        self, service: ReconciliationService, repo: Mock, banesco_client: Mock
+    ) -> None:
+        """Test a transaction changed during the lookups is left alone."""
+        done = make_transaction("TRX-DONE", timedelta(minutes=1))
+        repo.claim_for_reconciliation = AsyncMock(return_value=[done])
+        repo.bulk_update_status = AsyncMock(return_value=[])
+        banesco_client.get_transaction_statuses.return_value = {
+            "TRX-DONE": BanescoStatusResult("TRX-DONE", data={"status": "CANCELED"}),
+        }
+
+        assert await service.reconcile_once() == 0
+        assert repo.schedule_reconciliation.await_args.args[0] == {}
+
+    @pytest.mark.asyncio
+    async def test_nothing_due_skips_banesco(
+        self, service: ReconciliationService, repo: Mock, banesco_client: Mock
+    ) -> None:
+        """Test a pass without due transactions makes no Banesco call."""
+        repo.claim_for_reconciliation = AsyncMock(return_value=[])
+
+        assert await service.reconcile_once() == 0
+        banesco_client.get_transaction_statuses.assert_not_called()
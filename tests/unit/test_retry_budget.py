@@ -0,0 +1,80 @@
+"""Unit tests for RetryBudget."""
+
+from unittest.mock import Mock
+
+from prometheus_client import CollectorRegistry, Counter
+
+from infrastructure.resilience import RetryBudget
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRetryBudget:
+    """Test suite for RetryBudget."""
+
+    def test_retries_are_capped_to_ratio_of_attempts(self) -> None:
+        """Test 10% of first attempts may be retried when there is no floor."""
+        budget = RetryBudget(ratio=0.1, min_retries_per_second=0, clock=FakeClock())
+
+        for _ in range(50):
+            budget.record_attempt()
+        allowed = sum(budget.try_retry() for _ in range(10))
+
+        assert allowed == 5
+
+    def test_floor_allows_retries_without_traffic(self) -> None:
+        """Test the minimum rate lets low-traffic callers retry."""
+        budget = RetryBudget(
+            ratio=0.1, min_retries_per_second=0.2, window=10, clock=FakeClock()
+        )
+
+        assert budget.try_retry()
+        assert budget.try_retry()
+        assert not budget.try_retry()
+
+    def test_budget_recovers_after_window(self) -> None:
+        """Test spent retries stop counting once they leave the window."""
+        clock = FakeClock()
+        budget = RetryBudget(
+            ratio=0, min_retries_per_second=0.1, window=10, clock=clock
+        )
+
+        assert budget.try_retry()
+        assert not budget.try_retry()
+        clock.now = 11.0
+
+        assert budget.try_retry()
+
+    def test_refused_retries_are_counted(self) -> None:
+        """Test the metric records allowed and refused retries."""
+        metric = Counter(
+            "test_retries_total",
+            "Test retries",
+            ["operation", "result"],
+            registry=CollectorRegistry(),
+        )
+        budget = RetryBudget(
+            ratio=0, min_retries_per_second=0.1, window=10, metric=metric
+        )
+
+        budget.try_retry("lookup")
+        budget.try_retry("lookup")
+
+        assert metric.labels(operation="lookup", result="allowed")._value.get() == 1
+        assert metric.labels(operation="lookup", result="refused")._value.get() == 1
+
+    def test_stop_condition_spends_budget(self) -> None:
+        """Test the tenacity stop condition stops once the budget is spent."""
+        budget = RetryBudget(ratio=0, min_retries_per_second=0.1, window=10)
+        stop = budget.stop_when_exhausted("lookup")
+
+        assert stop(Mock()) is False
+        assert stop(Mock()) is True
@@ -0,0 +1,133 @@
+"""Unit tests for SingleFlight."""
+
+import asyncio
+
+import pytest
+
+from infrastructure.resilience import (
+    DeadlineExceededError,
+    SingleFlight,
+    deadline_scope,
+    remaining_time,
+)
+
+
+class TestSingleFlight:
+    """Test suite for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self) -> None:
+        """Test concurrent callers with the same key run the call once."""
+        flight: SingleFlight[str] = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        callers = [asyncio.create_task(flight.do("TRX-1", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        assert results == ["result"] * 5
+        assert calls == 1
+        assert flight.leader_calls == 1
+        assert flight.coalesced_calls == 4
+        assert flight.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared_with_waiters(self) -> None:
+        """Test every waiter receives the leader's exception."""
+        flight: SingleFlight[str] = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            await release.wait()
+            raise ValueError("upstream failed")
+
+        callers = [asyncio.create_task(flight.do("TRX-1", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_waiters(self) -> None:
+        """Test a cancelled leader leaves the shared call running."""
+        flight: SingleFlight[str] = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            await release.wait()
+            return "result"
+
+        leader = asyncio.create_task(flight.do("TRX-1", fetch))
+        follower = asyncio.create_task(flight.do("TRX-1", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+
+        assert await follower == "result"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    @pytest.mark.asyncio
+    async def test_distinct_keys_are_not_coalesced(self) -> None:
+        """Test different keys run independent calls."""
+        flight: SingleFlight[str] = SingleFlight()
+
+        async def fetch() -> str:
+            return "result"
+
+        await asyncio.gather(flight.do("TRX-1", fetch), flight.do("TRX-2", fetch))
+
+        assert flight.leader_calls == 2
+        assert flight.coalesced_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_follower_waits_only_until_its_deadline(self) -> None:
+        """Test a joining caller gives up when its own deadline passes."""
+        flight: SingleFlight[str] = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            await release.wait()
+            return "result"
+
+        leader = asyncio.create_task(flight.do("TRX-1", fetch))
+        await asyncio.sleep(0)
+
+        with deadline_scope(0.05), pytest.raises(DeadlineExceededError):
+            await flight.do("TRX-1", fetch)
+
+        release.set()
+        assert await leader == "result"
+
+    @pytest.mark.asyncio
+    async def test_shared_call_ignores_the_leader_deadline(self) -> None:
+        """Test a hurried leader does not fail the call for patient followers."""
+        flight: SingleFlight[str] = SingleFlight()
+        seen: list[float | None] = []
+
+        async def fetch() -> str:
+            seen.append(remaining_time())
+            await asyncio.sleep(0.1)
+            return "result"
+
+        async def hurried() -> str:
+            with deadline_scope(0.02):
+                return await flight.do("TRX-1", fetch, timeout=5.0)
+
+        leader = asyncio.create_task(hurried())
+        await asyncio.sleep(0)
+        follower = await flight.do("TRX-1", fetch, timeout=5.0)
+
+        assert follower == "result"
+        with pytest.raises(DeadlineExceededError):
+            await leader
+        assert seen[0] is not None and seen[0] > 4
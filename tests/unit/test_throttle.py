@@ -0,0 +1,131 @@
+"""Unit tests for AdaptiveTokenBucket."""
+
+import asyncio
+import time
+
+import pytest
+
+from infrastructure.resilience import (
+    AdaptiveTokenBucket,
+    ThrottleQueueFullError,
+    ThrottleTimeoutError,
+    deadline_scope,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAdaptiveTokenBucket:
+    """Test suite for AdaptiveTokenBucket."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """Create fake clock."""
+        return FakeClock()
+
+    @pytest.mark.asyncio
+    async def test_burst_is_served_without_waiting(self, clock: FakeClock) -> None:
+        """Test calls within the burst do not wait."""
+        bucket = AdaptiveTokenBucket(rate=1.0, burst=3, clock=clock)
+
+        waits = [await bucket.acquire(timeout=0) for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+
+    @pytest.mark.asyncio
+    async def test_fails_fast_when_wait_exceeds_deadline(
+        self, clock: FakeClock
+    ) -> None:
+        """Test callers are rejected instead of waiting past their deadline."""
+        bucket = AdaptiveTokenBucket(rate=2.0, burst=1, clock=clock)
+        await bucket.acquire(timeout=0)
+
+        with pytest.raises(ThrottleTimeoutError) as exc_info:
+            await bucket.acquire(timeout=0.1)
+
+        assert exc_info.value.retry_after == pytest.approx(0.5)
+
+    @pytest.mark.asyncio
+    async def test_waiting_caller_does_not_hold_up_others(self) -> None:
+        """Test a caller that cannot wait fails at once behind a sleeping one."""
+        bucket = AdaptiveTokenBucket(rate=1.0, burst=1)
+        await bucket.acquire(timeout=0)
+        sleeper = asyncio.create_task(bucket.acquire(timeout=5))
+        await asyncio.sleep(0)
+
+        started_at = time.monotonic()
+        with pytest.raises(ThrottleTimeoutError):
+            await bucket.acquire(timeout=0)
+
+        assert time.monotonic() - started_at < 0.1
+        sleeper.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await sleeper
+
+    @pytest.mark.asyncio
+    async def test_deadline_caps_the_wait(self, clock: FakeClock) -> None:
+        """Test a wait beyond the caller's deadline is refused."""
+        bucket = AdaptiveTokenBucket(rate=2.0, burst=1, clock=clock)
+        await bucket.acquire(timeout=0)
+
+        with deadline_scope(0.1), pytest.raises(ThrottleTimeoutError):
+            await bucket.acquire(timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_refills_over_time(self, clock: FakeClock) -> None:
+        """Test tokens refill at the configured rate."""
+        bucket = AdaptiveTokenBucket(rate=2.0, burst=1, clock=clock)
+        await bucket.acquire(timeout=0)
+        clock.now = 0.5
+
+        assert await bucket.acquire(timeout=0) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_pauses_and_slows_down(self, clock: FakeClock) -> None:
+        """Test a 429 halves the rate and honors Retry-After."""
+        bucket = AdaptiveTokenBucket(rate=4.0, burst=4, clock=clock)
+
+        bucket.on_rate_limited(retry_after=10)
+
+        assert bucket.rate == 2.0
+        with pytest.raises(ThrottleTimeoutError) as exc_info:
+            await bucket.acquire(timeout=5)
+        assert exc_info.value.retry_after == pytest.approx(10.5)
+
+        clock.now = 10.5
+        assert await bucket.acquire(timeout=0) == 0.0
+
+    def test_success_recovers_rate_up_to_max(self, clock: FakeClock) -> None:
+        """Test successes raise the rate additively back to the maximum."""
+        bucket = AdaptiveTokenBucket(
+            rate=1.0, min_rate=0.5, increase_step=0.5, clock=clock
+        )
+        bucket.on_rate_limited()
+        bucket.on_rate_limited()
+        assert bucket.rate == 0.5
+
+        for _ in range(5):
+            bucket.on_success()
+
+        assert bucket.rate == 1.0
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_is_full(self) -> None:
+        """Test callers beyond max_waiters are rejected immediately."""
+        bucket = AdaptiveTokenBucket(rate=20.0, burst=1, max_waiters=1)
+        await bucket.acquire()
+
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        with pytest.raises(ThrottleQueueFullError):
+            await bucket.acquire()
+
+        assert await waiter > 0
@@ -0,0 +1,159 @@
+"""Unit tests for BanescoWebhookProcessor and webhook signatures."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.dto.transaction_dto import BanescoWebhookNotification
+from application.services.webhook_service import BanescoWebhookProcessor
+from domain.entities.transaction import ActorType, TransactionStatus
+from infrastructure.external.banesco_webhooks import sign_webhook, verify_webhook
+
+
+def notification(transaction_id: str, status: str) -> BanescoWebhookNotification:
+    """Create a webhook notification."""
+    return BanescoWebhookNotification(transaction_id=transaction_id, status=status)
+
+
+class TestWebhookSignature:
+    """Test suite for webhook signature verification."""
+
+    def test_valid_signature_is_accepted(self) -> None:
+        """Test a fresh, correctly signed body verifies."""
+        signature = sign_webhook("secret", "1000", b"{}")
+
+        assert verify_webhook("secret", "1000", b"{}", signature, now=1010)
+
+    def test_tampered_stale_or_unconfigured_is_rejected(self) -> None:
+        """Test altered bodies, old timestamps and a missing secret fail."""
+        signature = sign_webhook("secret", "1000", b"{}")
+
+        assert not verify_webhook("secret", "1000", b"{ }", signature, now=1000)
+        assert not verify_webhook("secret", "1001", b"{}", signature, now=1000)
+        assert not verify_webhook(
+            "secret", "1000", b"{}", signature, tolerance=300, now=1301
+        )
+        assert not verify_webhook("", "1000", b"{}", signature, now=1000)
+        assert not verify_webhook("secret", "soon", b"{}", signature, now=1000)
+
+    def test_non_finite_timestamp_is_rejected(self) -> None:
+        """Test "nan" and "inf" timestamps fail even when correctly signed."""
+        for timestamp in ("nan", "inf", "-inf"):
+            signature = sign_webhook("secret", timestamp, b"{}")
+
+            assert not verify_webhook("secret", timestamp, b"{}", signature, now=1000)
+
+
+class TestBanescoWebhookProcessor:
+    """Test suite for BanescoWebhookProcessor."""
+
+    @pytest.fixture
+    def session(self) -> Mock:
+        """Create mock database session."""
+        session = Mock()
+        session.commit = AsyncMock()
+        return session
+
+    @pytest.fixture
+    def repo(self) -> Mock:
+        """Create mock transaction repository that changes every update."""
+        repo = Mock()
+        repo.bulk_update_status = AsyncMock(
+            side_effect=lambda updates, **kwargs: list(updates)
+        )
+        return repo
+
+    @pytest.fixture
+    def processor(self, session: Mock, repo: Mock) -> BanescoWebhookProcessor:
+        """Create processor with mocked dependencies."""
+
+        @asynccontextmanager
+        async def session_factory():
+            yield session
+
+        return BanescoWebhookProcessor(
+            session_factory,
+            repository_factory=lambda _: repo,
+            queue_size=3,
+            batch_size=2,
+            flush_interval=0.05,
+        )
+
+    async def test_apply_keeps_last_final_status_per_transaction(
+        self, processor: BanescoWebhookProcessor, repo: Mock, session: Mock
+    ) -> None:
+        """Test one bulk update with deduplicated, final statuses only."""
+        changed = await processor.apply(
+            [
+                notification("TRX-1", "pending"),
+                notification("TRX-1", "approved"),
+                notification("TRX-2", "REJECTED"),
+                notification("TRX-3", "PENDING"),
+            ]
+        )
+
+        assert changed == 2
+        repo.bulk_update_status.assert_awaited_once()
+        updates = repo.bulk_update_status.await_args.args[0]
+        assert updates == {
+            "TRX-1": TransactionStatus.COMPLETED,
+            "TRX-2": TransactionStatus.CANCELED,
+        }
+        kwargs = repo.bulk_update_status.await_args.kwargs
+        assert kwargs["actor_type"] == ActorType.EXTERNAL
+        assert kwargs["event_metadata"]["TRX-1"]["banesco_status"] == "approved"
+        session.commit.assert_awaited_once()
+
+    async def test_late_non_final_status_does_not_hide_final_one(
+        self, processor: BanescoWebhookProcessor, repo: Mock
+    ) -> None:
+        """Test an out-of-order pending after a final status is ignored."""
+        await processor.apply(
+            [
+                notification("TRX-1", "COMPLETED"),
+                notification("TRX-1", "PENDING"),
+            ]
+        )
+
+        updates = repo.bulk_update_status.await_args.args[0]
+        assert updates == {"TRX-1": TransactionStatus.COMPLETED}
+
+    async def test_full_queue_refuses_notifications(
+        self, processor: BanescoWebhookProcessor
+    ) -> None:
+        """Test submit reports a full queue instead of blocking."""
+        assert all(
+            processor.submit(notification(f"T{i}", "APPROVED")) for i in range(3)
+        )
+        assert not processor.submit(notification("T3", "APPROVED"))
+
+    async def test_consumer_batches_and_stop_drains(
+        self, processor: BanescoWebhookProcessor, repo: Mock
+    ) -> None:
+        """Test queued notifications are applied in batches, leftovers on stop."""
+        processor.start()
+        for i in range(3):
+            processor.submit(notification(f"T{i}", "APPROVED"))
+        await asyncio.sleep(0.2)
+        processor.submit(notification("T3", "APPROVED"))
+        await processor.stop()
+
+        batches = [call.args[0] for call in repo.bulk_update_status.await_args_list]
+        assert [len(batch) for batch in batches] == [2, 1, 1]
+        assert processor.queue.empty()
+
+    async def test_failed_batch_does_not_stop_consumer(
+        self, processor: BanescoWebhookProcessor, repo: Mock
+    ) -> None:
+        """Test a database error is logged and later batches still apply."""
+        repo.bulk_update_status.side_effect = [RuntimeError("db down"), ["T1"]]
+        processor.start()
+        processor.submit(notification("T0", "APPROVED"))
+        await asyncio.sleep(0.1)
+        processor.submit(notification("T1", "APPROVED"))
+        await asyncio.sleep(0.1)
+        await processor.stop()
+
+        assert repo.bulk_update_status.await_count == 2